@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from aiohttp import ClientConnectionError, ClientConnectorSSLError
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID, CONF_HOST
+from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntry
+from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID, CONF_HOST, Platform
+from homeassistant.core import SupportsResponse, callback
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
     ConfigEntryNotReady,
+    HomeAssistantError,
     ServiceValidationError,
 )
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
     DeviceInfo,
@@ -23,22 +28,54 @@ from homeassistant.helpers.device_registry import (
 )
 from homeassistant.util.hass_dict import HassKey
 from homeconnect_websocket import HomeAppliance
+from homeconnect_websocket.errors import HomeConnectError
+from homeconnect_websocket.session import HCSession
 
+from .address_cache import async_get_address_cache
 from .const import (
     CONF_AES_IV,
+    CONF_BACKGROUND_CONNECT,
+    CONF_DESCRIPTION_HASH,
     CONF_DEV_OVERRIDE_HOST,
     CONF_DEV_OVERRIDE_PSK,
     CONF_DEV_SETUP_FROM_DUMP,
+    CONF_OPTIMISTIC_STATE,
+    CONF_PARSE_PROFILES_IN_PARALLEL,
     CONF_PSK,
+    CONF_WRITE_WINDOW,
     DOMAIN,
-    PLATFORMS,
 )
-from .entity_descriptions import get_available_entities
-from .helpers import get_config_entry_from_call
+from .description_cache import HCDescriptionCache
+from .description_store import (
+    DescriptionStoreError,
+    async_load_description,
+    async_remove_description,
+    async_save_description,
+)
+from .dispatcher import HCDispatcher
+from .entity_descriptions import (
+    get_available_entities,
+    get_namespaces,
+    load_description_modules,
+)
+from .helpers import (
+    get_config_entry_from_call,
+    get_hc_entity,
+    get_platforms,
+    get_program,
+    get_program_option_values,
+)
+from .host_update import HCHostUpdater, async_route_connects
+from .optimistic import HCOptimisticState
+from .profile_cache import async_get_profile_cache
+from .reachability import AES_PORT, TLS_PORT, HCConnectStats, async_probe
+from .socket_handoff import async_adopt_socket, async_pop_socket
+from .write_queue import DEFAULT_WRITE_WINDOW, HCWriteQueue, validate_value
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse
     from homeassistant.helpers.typing import ConfigType
+    from homeconnect_websocket.entities import Entity as HcEntity
 
     from .entity_descriptions import _EntityDescriptionsType
 
@@ -50,10 +87,15 @@ CONFIG_SCHEMA = vol.Schema(
             vol.Optional(CONF_DEV_SETUP_FROM_DUMP, default=False): vol.Boolean(),
             vol.Optional(CONF_DEV_OVERRIDE_HOST): str,
             vol.Optional(CONF_DEV_OVERRIDE_PSK): str,
+            vol.Optional(CONF_PARSE_PROFILES_IN_PARALLEL, default=False): vol.Boolean(),
         }
     },
     extra=vol.ALLOW_EXTRA,
 )
+SET_VALUES_SCHEMA = vol.Schema(
+    {vol.Required("values"): vol.Schema({cv.string: vol.Any(str, int, float, bool)})},
+    extra=vol.ALLOW_EXTRA,
+)
 
 
 @dataclass
@@ -63,6 +105,17 @@ class HCData:
     appliance: HomeAppliance
     device_info: DeviceInfo
     available_entity_descriptions: _EntityDescriptionsType
+    dispatcher: HCDispatcher
+    awaiting_connection: bool = False
+    platforms: list[Platform] = field(default_factory=list)
+    platform_setup_times: dict[Platform, float] = field(default_factory=dict)
+    host_updater: HCHostUpdater | None = None
+    write_queue: HCWriteQueue | None = None
+    optimistic_state: HCOptimisticState | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+    """Data the config entry was set up with"""
+    options: dict[str, Any] = field(default_factory=dict)
+    """Options the config entry was set up with"""
 
 
 @dataclass
@@ -72,12 +125,18 @@ class HCConfig:
     setup_from_dump: bool = False
     override_host: str | None = None
     override_psk: str | None = None
+    parse_profiles_in_parallel: bool = False
+    connect_stats: dict[str, HCConnectStats] = field(default_factory=dict)
 
 
 type HCConfigEntry = ConfigEntry[HCData]
 
 HC_KEY: HassKey[HCConfig] = HassKey(DOMAIN)
 
+CONFIG_ENTRY_VERSION = 2
+BACKGROUND_CONNECT_RETRY_MIN = 10
+BACKGROUND_CONNECT_RETRY_MAX = 600
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up integration global config."""
@@ -86,6 +145,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass.data[HC_KEY].setup_from_dump = config[DOMAIN].get(CONF_DEV_SETUP_FROM_DUMP, False)
         hass.data[HC_KEY].override_host = config[DOMAIN].get(CONF_DEV_OVERRIDE_HOST)
         hass.data[HC_KEY].override_psk = config[DOMAIN].get(CONF_DEV_OVERRIDE_PSK)
+        hass.data[HC_KEY].parse_profiles_in_parallel = config[DOMAIN].get(
+            CONF_PARSE_PROFILES_IN_PARALLEL, False
+        )
 
     async def handle_start_program(call: ServiceCall) -> ServiceResponse:
         config_entry = await get_config_entry_from_call(hass, call)
@@ -103,11 +165,22 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             else:
                 msg = "'Start in' is not available on this Appliance"
                 raise ServiceValidationError(msg)
-        if appliance.selected_program:
-            await appliance.selected_program.start(options)
+        if "program" in call.data:
+            program = get_program(appliance, call.data["program"])
+        elif appliance.selected_program:
+            program = appliance.selected_program
         else:
             msg = "No Program selected"
             raise ServiceValidationError(msg)
+        # Select, set the options and start in one message
+        options.update(
+            get_program_option_values(
+                program,
+                call.data.get("options", {}),
+                selected=program is appliance.selected_program,
+            )
+        )
+        await program.start(options)
 
     async def handle_set_start_in(call: ServiceCall) -> ServiceResponse:
         config_entry = await get_config_entry_from_call(hass, call)
@@ -118,69 +191,306 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 + int(call.data["start_in"].get("minutes", 0)) * 60
                 + int(call.data["start_in"].get("seconds", 0))
             )
-            await start_in_entity.set_value(relative_time_in_seconds)
+            await config_entry.runtime_data.write_queue.async_set_value(
+                start_in_entity, relative_time_in_seconds
+            )
         else:
             msg = "'Start in' is not available on this Appliance"
             raise ServiceValidationError(msg)
 
+    async def handle_set_values(call: ServiceCall) -> ServiceResponse:
+        return await _async_set_values(hass, call)
+
     hass.services.async_register(DOMAIN, "start_program", handle_start_program)
     hass.services.async_register(DOMAIN, "set_start_in", handle_set_start_in)
+    hass.services.async_register(
+        DOMAIN,
+        "set_values",
+        handle_set_values,
+        schema=SET_VALUES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     return True
 
 
+async def _async_set_values(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Validate the values and send the valid values in one message, return the results."""
+    config_entry = await get_config_entry_from_call(hass, call)
+    results: dict[str, dict[str, Any]] = {}
+    values: dict[HcEntity, Any] = {}
+    for key, value in call.data["values"].items():
+        try:
+            entity = get_hc_entity(hass, config_entry, key)
+            values[entity] = validate_value(entity, value)
+        except (ServiceValidationError, HomeConnectError, ValueError) as ex:
+            results[key] = {"success": False, "error": str(ex)}
+        else:
+            results[key] = {"success": True, "uid": entity.uid, "value": values[entity]}
+    failed = [key for key, result in results.items() if not result["success"]]
+    if values:
+        try:
+            await config_entry.runtime_data.write_queue.async_set_values_raw(values)
+        except (TimeoutError, HomeConnectError) as ex:
+            if not call.return_response:
+                msg = f"Failed to set values: {str(ex) or type(ex).__name__}"
+                raise HomeAssistantError(msg) from ex
+            for result in results.values():
+                if result["success"]:
+                    result.update(success=False, error=str(ex) or type(ex).__name__)
+    if failed and not call.return_response:
+        msg = f"Invalid values for {', '.join(failed)}"
+        raise ServiceValidationError(msg)
+    return {"results": results}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: HCConfigEntry,
 ) -> bool:
     """Set up this integration using config entry."""
-    _LOGGER.debug("Setting up %s", config_entry.data[CONF_DESCRIPTION]["info"].get("model"))
+    try:
+        description = await async_load_description(hass, config_entry.data[CONF_DESCRIPTION_HASH])
+    except DescriptionStoreError as ex:
+        # The profile file has to be uploaded again
+        raise ConfigEntryAuthFailed(str(ex)) from ex
+    _LOGGER.debug("Setting up %s", description["info"].get("model"))
     appliance = HomeAppliance(
-        description=config_entry.data[CONF_DESCRIPTION],
+        description=description,
         host=config_entry.data[CONF_HOST],
         app_name="Homeassistant",
         app_id=config_entry.data[CONF_DEVICE_ID],
         psk64=config_entry.data[CONF_PSK],
         iv64=config_entry.data.get(CONF_AES_IV, None),
     )
+    if socket := async_pop_socket(hass, config_entry.unique_id, config_entry.data):
+        _LOGGER.debug("Using the socket of the config flow")
+        await async_adopt_socket(appliance, socket)
+    host_updater = HCHostUpdater(hass, config_entry, appliance)
+    config_entry.async_on_unload(host_updater.async_shutdown)
+    async_route_connects(hass, config_entry, appliance, host_updater)
+    description_cache = HCDescriptionCache(hass, config_entry)
+    available_entities = await description_cache.async_load()
+    background_connect = (
+        config_entry.options.get(CONF_BACKGROUND_CONNECT, False)
+        and available_entities is not None
+        and description_cache.info is not None
+    )
+    if background_connect:
+        # Create entities from the cached device info and connect in the background
+        appliance.info = {**appliance.info, **description_cache.info}
+    else:
+        await _async_connect(hass, config_entry, appliance)
+        if not appliance.info:
+            msg = "Appliance has no device info"
+            raise ConfigEntryError(msg)
+        if available_entities is None:
+            await hass.async_add_import_executor_job(
+                load_description_modules, get_namespaces(appliance)
+            )
+            available_entities = get_available_entities(appliance)
+            await description_cache.async_save(available_entities, appliance.info)
+        else:
+            description_cache.async_update_info(appliance.info)
+
+    device_info = DeviceInfo(
+        connections={(CONNECTION_NETWORK_MAC, format_mac(appliance.info["mac"]))},
+        hw_version=appliance.info["hwVersion"],
+        identifiers={(DOMAIN, appliance.info["deviceID"])},
+        name=f"{appliance.info['brand'].capitalize()} {appliance.info['type']}",
+        manufacturer=appliance.info["brand"].capitalize(),
+        model=f"{appliance.info['type']}",
+        model_id=appliance.info["vib"],
+        sw_version=appliance.info["swVersion"],
+    )
+    dispatcher = HCDispatcher(hass, config_entry, appliance)
+    config_entry.async_on_unload(dispatcher.async_shutdown)
+    optimistic_state = HCOptimisticState(
+        hass, dispatcher, enabled=config_entry.options.get(CONF_OPTIMISTIC_STATE, False)
+    )
+    config_entry.async_on_unload(optimistic_state.async_shutdown)
+    write_queue = HCWriteQueue(
+        hass,
+        appliance,
+        config_entry.options.get(CONF_WRITE_WINDOW, DEFAULT_WRITE_WINDOW),
+        optimistic_state,
+    )
+    config_entry.async_on_unload(write_queue.async_shutdown)
+    config_entry.runtime_data = HCData(
+        appliance,
+        device_info,
+        available_entities,
+        dispatcher,
+        background_connect,
+        host_updater=host_updater,
+        write_queue=write_queue,
+        optimistic_state=optimistic_state,
+        data=dict(config_entry.data),
+        options=dict(config_entry.options),
+    )
+    config_entry.async_on_unload(config_entry.add_update_listener(async_update_options))
+    if background_connect:
+        config_entry.async_create_background_task(
+            hass,
+            _async_background_connect(hass, config_entry, description_cache),
+            f"homeconnect_ws background connect {config_entry.title}",
+        )
+    config_entry.runtime_data.platforms = get_platforms(available_entities)
+    await asyncio.gather(
+        *(
+            _async_forward_platform(hass, config_entry, platform)
+            for platform in config_entry.runtime_data.platforms
+        )
+    )
+    _LOGGER.debug(
+        "Platform setup times for %s: %s",
+        config_entry.title,
+        config_entry.runtime_data.platform_setup_times,
+    )
+    return True
+
+
+async def _async_forward_platform(
+    hass: HomeAssistant, config_entry: HCConfigEntry, platform: Platform
+) -> None:
+    """Forward the setup of a platform, measuring the setup time."""
+    start = time.monotonic()
+    await hass.config_entries.async_forward_entry_setups(config_entry, [platform])
+    config_entry.runtime_data.platform_setup_times[platform] = time.monotonic() - start
+
+
+def get_connect_stats(hass: HomeAssistant, config_entry: HCConfigEntry) -> HCConnectStats:
+    """Get the connection attempts of a config entry, kept across setup retries."""
+    global_config = hass.data.setdefault(HC_KEY, HCConfig())
+    return global_config.connect_stats.setdefault(config_entry.entry_id, HCConnectStats())
+
+
+async def _async_connect(
+    hass: HomeAssistant, config_entry: HCConfigEntry, appliance: HomeAppliance
+) -> None:
+    """
+    Connect to the appliance, probing its reachability first if the last connect failed.
+
+    Host names are connected by their cached address, see `async_route_connects`.
+    """
+    host = config_entry.data[CONF_HOST]
+    address_cache = async_get_address_cache(hass)
+    address = address_cache.async_get(host)
+    stats = get_connect_stats(hass, config_entry)
+    port = AES_PORT if config_entry.data.get(CONF_AES_IV) else TLS_PORT
+    if stats.probe and not await async_probe(address or host, port):
+        stats.skipped += 1
+        address_cache.async_invalidate(host)
+        msg = f"{host} is not reachable"
+        raise ConfigEntryNotReady(msg)
+    stats.attempted += 1
+    stats.probe = True
     try:
         await appliance.connect()
     except ClientConnectorSSLError as ex:
         await appliance.close()
-        msg = f"Authentication failed with {config_entry.data[CONF_HOST]}"
+        msg = f"Authentication failed with {host}"
         raise ConfigEntryAuthFailed(msg) from ex
     except (TimeoutError, ClientConnectionError) as ex:
         await appliance.close()
-        msg = f"Can't connect to {config_entry.data[CONF_HOST]}"
+        msg = f"Can't connect to {host}"
         raise ConfigEntryNotReady(msg) from ex
     except Exception:
         await appliance.close()
         raise
+    stats.probe = False
+    _LOGGER.debug("Connected to %s", appliance.info.get("vib"))
 
-    _LOGGER.debug("Connected to %s", config_entry.data[CONF_DESCRIPTION]["info"].get("vib"))
-    if not appliance.info:
-        msg = "Appliance has no device info"
-        raise ConfigEntryError(msg)
 
-    device_info = DeviceInfo(
-        connections={(CONNECTION_NETWORK_MAC, format_mac(appliance.info["mac"]))},
-        hw_version=appliance.info["hwVersion"],
-        identifiers={(DOMAIN, appliance.info["deviceID"])},
-        name=f"{appliance.info['brand'].capitalize()} {appliance.info['type']}",
-        manufacturer=appliance.info["brand"].capitalize(),
-        model=f"{appliance.info['type']}",
-        model_id=appliance.info["vib"],
-        sw_version=appliance.info["swVersion"],
+async def _async_background_connect(
+    hass: HomeAssistant, config_entry: HCConfigEntry, description_cache: HCDescriptionCache
+) -> None:
+    """Connect to the appliance, retrying until connected."""
+    runtime_data = config_entry.runtime_data
+    retry_delay = BACKGROUND_CONNECT_RETRY_MIN
+    while True:
+        try:
+            await _async_connect(hass, config_entry, runtime_data.appliance)
+        except ConfigEntryAuthFailed:
+            _LOGGER.warning("Authentication failed with %s", config_entry.data[CONF_HOST])
+            config_entry.async_start_reauth(hass)
+            return
+        except Exception as ex:  # noqa: BLE001
+            _LOGGER.debug("Background connect failed, retrying in %ss: %s", retry_delay, ex)
+        else:
+            if runtime_data.appliance.session.connected:
+                break
+            await runtime_data.appliance.close()
+        _async_renew_session(hass, config_entry, runtime_data.appliance)
+        await asyncio.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, BACKGROUND_CONNECT_RETRY_MAX)
+
+    runtime_data.awaiting_connection = False
+    runtime_data.dispatcher.async_update_all()
+    description_cache.async_update_info(runtime_data.appliance.info)
+
+
+@callback
+def _async_renew_session(
+    hass: HomeAssistant, config_entry: HCConfigEntry, appliance: HomeAppliance
+) -> None:
+    """Replace the session of the appliance, a closed session can't connect again."""
+    appliance.session = HCSession(
+        host=config_entry.data[CONF_HOST],
+        app_name="Homeassistant",
+        app_id=config_entry.data[CONF_DEVICE_ID],
+        psk64=config_entry.data[CONF_PSK],
+        iv64=config_entry.data.get(CONF_AES_IV, None),
     )
-    available_entities = get_available_entities(appliance)
-    config_entry.runtime_data = HCData(appliance, device_info, available_entities)
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
-    return True
+    async_route_connects(hass, config_entry, appliance, config_entry.runtime_data.host_updater)
+
+
+async def async_update_options(hass: HomeAssistant, config_entry: HCConfigEntry) -> None:
+    """Reload the config entry when data or options changed."""
+    if any(config_entry.async_get_active_flows(hass, {SOURCE_REAUTH})):
+        # The reauth flow reloads the config entry when it updates it
+        return
+    runtime_data = config_entry.runtime_data
+    data, setup_data = dict(config_entry.data), dict(runtime_data.data)
+    # Host changes are applied without reloading
+    data.pop(CONF_HOST)
+    setup_data.pop(CONF_HOST)
+    if config_entry.options == runtime_data.options and data == setup_data:
+        return
+    await hass.config_entries.async_reload(config_entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: HCConfigEntry) -> bool:
     """Unload a config entry."""
-    _LOGGER.debug("Unloading %s", entry.data[CONF_DESCRIPTION]["info"].get("vib"))
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    _LOGGER.debug("Unloading %s", entry.runtime_data.appliance.info.get("vib"))
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    )
     if unload_ok:
         await entry.runtime_data.appliance.close()
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: HCConfigEntry) -> None:
+    """Remove cached data of a config entry."""
+    await HCDescriptionCache(hass, entry).async_remove()
+    if global_config := hass.data.get(HC_KEY):
+        global_config.connect_stats.pop(entry.entry_id, None)
+    if CONF_DESCRIPTION_HASH in entry.data:
+        await async_remove_description(hass, entry.data[CONF_DESCRIPTION_HASH], entry.entry_id)
+    if entry.unique_id is not None:
+        profile_cache = await async_get_profile_cache(hass)
+        profile_cache.async_remove_appliance(entry.unique_id)
+
+
+async def async_migrate_entry(hass: HomeAssistant, config_entry: HCConfigEntry) -> bool:
+    """Migrate old config entries."""
+    if config_entry.version > CONFIG_ENTRY_VERSION:
+        # Downgraded from a future version
+        return False
+    if config_entry.version == 1:
+        # Move the device description out of the config entry
+        data = {**config_entry.data}
+        data[CONF_DESCRIPTION_HASH] = await async_save_description(hass, data.pop(CONF_DESCRIPTION))
+        hass.config_entries.async_update_entry(config_entry, data=data, version=2)
+        _LOGGER.debug("Migrated %s to version 2", config_entry.title)
+    return True
@@ -0,0 +1,80 @@
+"""Cache of the resolved addresses of appliance host names."""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.network import is_ip_address
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.hc_socket import HCSocket
+
+_LOGGER = logging.getLogger(__name__)
+
+ADDRESS_TTL = 3600
+
+
+def normalize_host(host: str) -> str:
+    """Normalize a host name, mDNS host names are case insensitive and may end with `.local.`."""
+    return host.lower().removesuffix(".").removesuffix(".local")
+
+
+def get_peer_address(socket: HCSocket) -> str | None:
+    """Get the address a connected socket is connected to."""
+    websocket = socket._websocket  # noqa: SLF001
+    peer = websocket.get_extra_info("peername") if websocket else None
+    if isinstance(peer, tuple) and peer:
+        return peer[0]
+    return None
+
+
+class HCAddressCache:
+    """
+    Resolved addresses of appliance host names.
+
+    Fed by zeroconf discoveries and successful connections, addresses expire after
+    `ADDRESS_TTL` seconds. Appliances are connected by the cached address, the host name is
+    resolved again when the cached address fails.
+    """
+
+    def __init__(self) -> None:
+        self._addresses: dict[str, tuple[str, float]] = {}
+
+    @callback
+    def async_get(self, host: str) -> str | None:
+        """Get the cached address of a host name."""
+        key = normalize_host(host)
+        if (cached := self._addresses.get(key)) is None:
+            return None
+        address, expires = cached
+        if expires < time.monotonic():
+            del self._addresses[key]
+            return None
+        return address
+
+    @callback
+    def async_set(self, host: str, address: str) -> None:
+        """Cache the address of a host name."""
+        if is_ip_address(host) or not is_ip_address(address):
+            return
+        _LOGGER.debug("Caching address %s of %s", address, host)
+        self._addresses[normalize_host(host)] = (address, time.monotonic() + ADDRESS_TTL)
+
+    @callback
+    def async_invalidate(self, host: str) -> None:
+        """Remove the cached address of a host name."""
+        self._addresses.pop(normalize_host(host), None)
+
+
+@singleton(f"{DOMAIN}_address_cache")
+@callback
+def async_get_address_cache(hass: HomeAssistant) -> HCAddressCache:  # noqa: ARG001
+    """Get the address cache."""
+    return HCAddressCache()
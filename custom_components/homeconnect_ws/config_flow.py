@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import multiprocessing
+import os
 import random
 import re
 from binascii import Error as BinasciiError
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from typing import TYPE_CHECKING, Any
 from zipfile import ZipFile
 
@@ -14,7 +19,13 @@ import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from aiohttp import ClientConnectionError, ClientConnectorSSLError
 from homeassistant.components.file_upload import process_uploaded_file
-from homeassistant.config_entries import SOURCE_IGNORE, ConfigFlow
+from homeassistant.config_entries import (
+    SOURCE_IGNORE,
+    SOURCE_INTEGRATION_DISCOVERY,
+    ConfigEntryState,
+    ConfigFlow,
+    OptionsFlow,
+)
 from homeassistant.const import (
     CONF_DESCRIPTION,
     CONF_DEVICE,
@@ -23,13 +34,19 @@ from homeassistant.const import (
     CONF_MODE,
     CONF_NAME,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     FileSelector,
     FileSelectorConfig,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
 )
+from homeassistant.util.hass_dict import HassKey
 from homeconnect_websocket import (
     DeviceDescription,
     ParserError,
@@ -37,20 +54,41 @@ from homeconnect_websocket import (
     parse_device_description,
 )
 
-from . import HC_KEY, HCConfig
-from .const import CONF_AES_IV, CONF_FILE, CONF_MANUAL_HOST, CONF_PSK, DOMAIN
+from . import CONFIG_ENTRY_VERSION, HC_KEY, HCConfig
+from .address_cache import async_get_address_cache
+from .const import (
+    CONF_AES_IV,
+    CONF_BACKGROUND_CONNECT,
+    CONF_DESCRIPTION_HASH,
+    CONF_FILE,
+    CONF_MANUAL_HOST,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_OPTIMISTIC_STATE,
+    CONF_PSK,
+    CONF_SETUP_ALL,
+    CONF_WRITE_WINDOW,
+    DOMAIN,
+)
+from .description_store import async_remove_description, async_save_description
+from .profile_cache import async_get_profile_cache, profile_key
+from .socket_handoff import async_store_socket
 
 if TYPE_CHECKING:
     from pathlib import Path
 
-    from homeassistant.config_entries import ConfigFlowResult
+    from homeassistant.config_entries import ConfigEntry, ConfigFlowResult
     from homeassistant.data_entry_flow import FlowResult
     from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
+    from homeconnect_websocket.hc_socket import HCSocket
 
     from . import HCConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
 
+BULK_CONNECTION_TESTS = 4
+CONNECTION_ATTEMPT_DELAY = 0.5
+DISCOVERED_HOSTS_KEY: HassKey[dict[str, str]] = HassKey(f"{DOMAIN}_discovered_hosts")
+
 CONFIG_FILE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_FILE): FileSelector(config=FileSelectorConfig(accept=".zip")),
@@ -66,33 +104,87 @@ CONFIG_HOST_SCHEMA = vol.Schema(
         vol.Required(CONF_HOST): cv.string,
     }
 )
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_MIN_UPDATE_INTERVAL): NumberSelector(
+            NumberSelectorConfig(
+                min=0, max=600, step=1, unit_of_measurement="s", mode=NumberSelectorMode.BOX
+            )
+        ),
+        vol.Optional(CONF_BACKGROUND_CONNECT, default=False): BooleanSelector(),
+        vol.Optional(CONF_WRITE_WINDOW): NumberSelector(
+            NumberSelectorConfig(
+                min=0, max=1000, step=1, unit_of_measurement="ms", mode=NumberSelectorMode.BOX
+            )
+        ),
+        vol.Optional(CONF_OPTIMISTIC_STATE, default=False): BooleanSelector(),
+    }
+)
 
 
-def process_zip_file(config_path: Path) -> dict[str, dict[str, dict | DeviceDescription]]:
-    """Process uploaded zip file."""
-    profile_file = ZipFile(config_path)
+def process_zip_file(config_path: Path) -> dict[str, dict[str, Any]]:
+    """
+    Process uploaded zip file.
+
+    Only the appliance info files are read, the device descriptions are parsed on demand.
+    The zip file is kept in memory, because the uploaded
+    file is removed after processing.
+    """
+    profile_data = config_path.read_bytes()
 
     appliances = {}
     re_info = re.compile(".*.json$")
-    infolist = profile_file.infolist()
-    for file in infolist:
-        if re_info.match(file.filename):
-            appliance_info = json.load(profile_file.open(file))
-
-            description_file_name = appliance_info["deviceDescriptionFileName"]
-            feature_file_name = appliance_info["featureMappingFileName"]
-            description_file = profile_file.open(description_file_name).read()
-            feature_file = profile_file.open(feature_file_name).read()
-
-            appliance_description = parse_device_description(description_file, feature_file)
-            appliances[appliance_info["haId"]] = {
-                "info": appliance_info,
-                "description": appliance_description,
-            }
-            _LOGGER.debug("Found Appliance %s", appliance_info["vib"])
+    with ZipFile(BytesIO(profile_data)) as profile_file:
+        for file in profile_file.infolist():
+            if re_info.match(file.filename):
+                appliance_info = json.loads(profile_file.read(file))
+                appliances[appliance_info["haId"]] = {
+                    "info": appliance_info,
+                    "profile_file": profile_data,
+                }
+                _LOGGER.debug("Found Appliance %s", appliance_info["vib"])
     return appliances
 
 
+def read_description_files(
+    appliances: dict[str, dict[str, Any]],
+) -> dict[str, tuple[str, bytes, bytes]]:
+    """Read the DeviceDescription and FeatureMapping files and their cache key."""
+    files = {}
+    for appliance_id, appliance in appliances.items():
+        info = appliance["info"]
+        with ZipFile(BytesIO(appliance["profile_file"])) as profile_file:
+            description_file = profile_file.read(info["deviceDescriptionFileName"])
+            feature_file = profile_file.read(info["featureMappingFileName"])
+        files[appliance_id] = (
+            profile_key(description_file, feature_file),
+            description_file,
+            feature_file,
+        )
+    return files
+
+
+def parse_descriptions(files: dict[str, tuple[bytes, bytes]]) -> dict[str, DeviceDescription]:
+    """Parse device descriptions in parallel in a process pool."""
+    with ProcessPoolExecutor(
+        max_workers=min(len(files), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        descriptions = executor.map(
+            parse_device_description,
+            [description_file for description_file, _ in files.values()],
+            [feature_file for _, feature_file in files.values()],
+        )
+        return dict(zip(files, descriptions, strict=True))
+
+
+def get_default_host(appliance_info: dict[str, Any]) -> str:
+    """Get the mDNS host name of an appliance."""
+    if appliance_info["connectionType"] == "TLS":
+        return f"{appliance_info['brand']}-{appliance_info['type']}-{appliance_info['haId']}"
+    return appliance_info["haId"]
+
+
 def process_json_file(config_path: Path) -> dict[str, dict[str, dict | DeviceDescription]]:
     """Process uploaded json file."""
     with config_path.open() as file:
@@ -103,17 +195,23 @@ def process_json_file(config_path: Path) -> dict[str, dict[str, dict | DeviceDes
 class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
     """HomeConnect Config flow."""
 
+    VERSION = CONFIG_ENTRY_VERSION
+
     def __init__(self) -> None:
         super().__init__()
         self.errors = {}
         self.data = {}
-        self.appliances: dict[str, dict[str, dict | DeviceDescription]] = {}
+        self.appliances: dict[str, dict[str, Any]] = {}
         self.reauth_entry: HCConfigEntry = None
         self.global_config: HCConfig | None = None
 
-    def _process_profile_file(
-        self, uploaded_file_id: str
-    ) -> dict[str, dict[str, dict | DeviceDescription]]:
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> HomeConnectOptionsFlow:  # noqa: ARG004
+        """Get the options flow for this handler."""
+        return HomeConnectOptionsFlow()
+
+    def _process_profile_file(self, uploaded_file_id: str) -> dict[str, dict[str, Any]]:
         with process_uploaded_file(self.hass, uploaded_file_id) as config_path:
             if config_path.suffix == ".zip":
                 return process_zip_file(config_path)
@@ -122,34 +220,90 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
             msg = "Unexpected profile file suffix: %s"
             raise ValueError(msg, config_path.name)
 
-    def _set_encryption_keys(self, appliance_info: dict) -> None:
-        self.data[CONF_MODE] = appliance_info["connectionType"]
-        if self.data[CONF_MODE] == "TLS":
-            if CONF_HOST not in self.data:
-                self.data[CONF_HOST] = (
-                    f"{appliance_info['brand']}-{appliance_info['type']}-{appliance_info['haId']}"
+    async def _async_parse_all_descriptions(self) -> None:
+        """Parse all device descriptions up front, if enabled for bulk setup."""
+        if (
+            self.global_config is None
+            or not self.global_config.parse_profiles_in_parallel
+            or "config_entry" in self.appliances
+            or len(self.appliances) < 2
+        ):
+            return
+        await self._async_parse_descriptions(
+            {
+                appliance_id: appliance
+                for appliance_id, appliance in self.appliances.items()
+                if "description" not in appliance
+            }
+        )
+
+    async def _async_parse_descriptions(self, appliances: dict[str, dict[str, Any]]) -> None:
+        """
+        Add the device description to the appliances, from the profile cache if possible.
+
+        The descriptions are parsed in a process pool if enabled, one by one in the executor
+        otherwise.
+        """
+        if not appliances:
+            return
+        profile_cache = await async_get_profile_cache(self.hass)
+        files = await self.hass.async_add_executor_job(read_description_files, appliances)
+
+        pending: dict[str, tuple[bytes, bytes]] = {}
+        for appliance_id, (key, description_file, feature_file) in files.items():
+            description = profile_cache.async_get(key, appliance_id)
+            if description is None:
+                pending[appliance_id] = (description_file, feature_file)
+            else:
+                _LOGGER.debug("Using cached device description of %s", appliance_id)
+                appliances[appliance_id]["description"] = description
+
+        global_config = self.hass.data.get(HC_KEY)
+        if len(pending) > 1 and global_config and global_config.parse_profiles_in_parallel:
+            _LOGGER.debug("Parsing %s device descriptions", len(pending))
+            descriptions = await self.hass.async_add_executor_job(parse_descriptions, pending)
+        else:
+            descriptions = {}
+            for appliance_id, (description_file, feature_file) in pending.items():
+                _LOGGER.debug("Parsing device description of %s", appliance_id)
+                descriptions[appliance_id] = await self.hass.async_add_executor_job(
+                    parse_device_description, description_file, feature_file
                 )
-                _LOGGER.debug("Set Host to: %s", self.data[CONF_HOST])
-            self.data[CONF_PSK] = appliance_info["key"]
+
+        for appliance_id, description in descriptions.items():
+            profile_cache.async_set(files[appliance_id][0], appliance_id, description)
+            appliances[appliance_id]["description"] = description
+
+    def _set_appliance_data(self, appliance: dict[str, Any], data: dict[str, Any]) -> None:
+        appliance_info = appliance["info"]
+        data[CONF_DESCRIPTION] = appliance["description"]
+        data[CONF_DEVICE_ID] = random.randbytes(4).hex()  # noqa: S311
+        data[CONF_NAME] = f"{appliance_info['brand']} {appliance_info['type']}"
+        self._set_encryption_keys(appliance_info, data)
+
+    def _set_encryption_keys(self, appliance_info: dict, data: dict[str, Any]) -> None:
+        data[CONF_MODE] = appliance_info["connectionType"]
+        if CONF_HOST not in data:
+            data[CONF_HOST] = get_default_host(appliance_info)
+            _LOGGER.debug("Set Host to: %s", data[CONF_HOST])
+        if data[CONF_MODE] == "TLS":
+            data[CONF_PSK] = appliance_info["key"]
         else:
-            if CONF_HOST not in self.data:
-                self.data[CONF_HOST] = appliance_info["haId"]
-                _LOGGER.debug("Set Host to: %s", self.data[CONF_HOST])
-            self.data[CONF_PSK] = appliance_info["key"]
-            self.data[CONF_AES_IV] = appliance_info["iv"]
-        _LOGGER.debug("Set Keys for %s Appliance", self.data[CONF_MODE])
+            data[CONF_PSK] = appliance_info["key"]
+            data[CONF_AES_IV] = appliance_info["iv"]
+        _LOGGER.debug("Set Keys for %s Appliance", data[CONF_MODE])
 
         if self.global_config:
             if self.global_config.override_host is not None:
                 # Dev mode host override
-                self.data[CONF_HOST] = self.global_config.override_host
-                self.data[CONF_MANUAL_HOST] = True
-                _LOGGER.info("Host override: %s", self.data[CONF_HOST])
+                data[CONF_HOST] = self.global_config.override_host
+                data[CONF_MANUAL_HOST] = True
+                _LOGGER.info("Host override: %s", data[CONF_HOST])
             if self.global_config.override_psk is not None:
                 # Dev mode psk override
-                self.data[CONF_PSK] = self.global_config.override_psk
-                self.data[CONF_MODE] = "TLS"
-                self.data[CONF_AES_IV] = None
+                data[CONF_PSK] = self.global_config.override_psk
+                data[CONF_MODE] = "TLS"
+                data[CONF_AES_IV] = None
                 _LOGGER.info("PSK override")
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
@@ -182,6 +336,7 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
                             self.data[CONF_MODE] = "TLS"
                             self.data[CONF_AES_IV] = None
                             _LOGGER.info("PSK override")
+                await self._async_parse_all_descriptions()
 
             except ParserError as exc:
                 return self.async_abort(
@@ -210,8 +365,12 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle device selection."""
         if user_input is not None:
-            await self.async_set_unique_id(user_input[CONF_DEVICE])
-            return await self.async_step_set_data()
+            if user_input.get(CONF_SETUP_ALL):
+                return await self.async_step_setup_all()
+            if CONF_DEVICE in user_input:
+                await self.async_set_unique_id(user_input[CONF_DEVICE])
+                return await self.async_step_set_data()
+            self.errors["base"] = "no_appliance_selected"
 
         appliance_options: list[SelectOptionDict] = []
         try:
@@ -245,34 +404,202 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
         _LOGGER.debug("Found %s Appliances not setup", len(appliance_options))
         schema = vol.Schema(
             {
-                vol.Required(CONF_DEVICE): SelectSelector(
+                vol.Optional(CONF_DEVICE): SelectSelector(
                     SelectSelectorConfig(options=appliance_options, sort=True)
-                )
+                ),
+                vol.Optional(CONF_SETUP_ALL, default=False): BooleanSelector(),
             }
         )
         return self.async_show_form(step_id="device_select", data_schema=schema, errors=self.errors)
 
-    async def async_step_test_connection(
+    async def async_step_setup_all(
         self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Test connection with Appliance."""
-        host = self.data[CONF_HOST]
-        _LOGGER.debug("Testing connection to %s Appliance", self.data[CONF_MODE])
-        self.errors = {}
-        if self.data[CONF_MODE] == "AES":
-            socket = hc_socket.AesSocket(host, self.data[CONF_PSK], self.data[CONF_AES_IV])
+    ) -> ConfigFlowResult:
+        """
+        Set up all Appliances in the Profile file, which are not setup or ignored.
+
+        The connections are tested concurrently. A config flow is started for each Appliance,
+        which creates the config entry or, if the connection failed, asks for the host.
+        """
+        appliances = {
+            appliance_id: appliance
+            for appliance_id, appliance in self.appliances.items()
+            if self.hass.config_entries.async_entry_for_domain_unique_id(self.handler, appliance_id)
+            is None
+        }
+        entries_data: dict[str, dict[str, Any]] = {}
+        try:
+            await self._async_parse_descriptions(
+                {
+                    appliance_id: appliance
+                    for appliance_id, appliance in appliances.items()
+                    if "description" not in appliance
+                }
+            )
+            for appliance_id, appliance in appliances.items():
+                entries_data[appliance_id] = {}
+                self._set_appliance_data(appliance, entries_data[appliance_id])
+        except ParserError as exc:
+            return self.async_abort(
+                reason="profile_file_parser_error",
+                description_placeholders={"error": exc.args[0]},
+            )
+        except (KeyError, ValueError):
+            return self.async_abort(reason="invalid_profile_file")
+
+        semaphore = asyncio.Semaphore(BULK_CONNECTION_TESTS)
+
+        async def test_connection(data: dict[str, Any], appliance_id: str) -> str | None:
+            async with semaphore:
+                return await self._async_test_connection(data, appliance_id)
+
+        errors = await asyncio.gather(
+            *(test_connection(data, appliance_id) for appliance_id, data in entries_data.items())
+        )
+        results = dict(zip(entries_data, errors, strict=True))
+        _LOGGER.debug("Bulk setup connection tests: %s", results)
+        for appliance_id, error in results.items():
+            if error != "auth_failed":
+                await self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                    data={
+                        CONF_DEVICE: appliance_id,
+                        "data": entries_data[appliance_id],
+                        "error": error,
+                    },
+                )
+        errors_list = list(results.values())
+        return self.async_abort(
+            reason="bulk_setup_finished",
+            description_placeholders={
+                "setup": str(errors_list.count(None)),
+                "manual_host": str(errors_list.count("cannot_connect")),
+                "auth_failed": str(errors_list.count("auth_failed")),
+            },
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> ConfigFlowResult:
+        """Handle an Appliance of a bulk setup."""
+        await self.async_set_unique_id(discovery_info[CONF_DEVICE])
+        self._abort_if_unique_id_configured()
+        self.data = discovery_info["data"]
+        self.context["title_placeholders"] = {"name": self.data[CONF_NAME]}
+        if discovery_info["error"] is None:
+            return await self.async_step_create_entry(self.data)
+        self.errors["base"] = discovery_info["error"]
+        return await self.async_step_host()
+
+    def _get_host_candidates(self, data: dict[str, Any], unique_id: str | None) -> list[str]:
+        """Get the hosts to try: the set host, mDNS name, discovered and known address."""
+        candidates = [data[CONF_HOST]]
+        if data.get(CONF_MANUAL_HOST) or unique_id is None:
+            return candidates
+        if (appliance := self.appliances.get(unique_id)) and "info" in appliance:
+            candidates.append(get_default_host(appliance["info"]))
+        if host := self.hass.data.get(DISCOVERED_HOSTS_KEY, {}).get(unique_id):
+            candidates.append(host)
+        entry = self.hass.config_entries.async_entry_for_domain_unique_id(self.handler, unique_id)
+        if entry and (host := entry.data.get(CONF_HOST)):
+            candidates.append(host)
+        return list(dict.fromkeys(candidates))
+
+    async def _async_test_connection(
+        self, data: dict[str, Any], unique_id: str | None
+    ) -> str | None:
+        """
+        Test connection with Appliance, return the error if failed.
+
+        The host candidates are raced: the next candidate is started when the previous
+        failed or didn't connect within `CONNECTION_ATTEMPT_DELAY`. The host of the first
+        successful connection is set in the data and its socket is kept for the setup of
+        the config entry. An auth failure is only returned if no candidate connected, since
+        a stale address may belong to another Appliance.
+        """
+        candidates = self._get_host_candidates(data, unique_id)
+        remaining = iter(candidates)
+        tasks: dict[asyncio.Task[HCSocket | str], str] = {}
+        pending: set[asyncio.Task[HCSocket | str]] = set()
+        socket: HCSocket | None = None
+        auth_failed = False
+
+        def start_next() -> bool:
+            if (host := next(remaining, None)) is None:
+                return False
+            task = self.hass.async_create_task(
+                self._async_test_host(data, host), f"{DOMAIN} connection test {host}"
+            )
+            tasks[task] = host
+            pending.add(task)
+            return True
+
+        start_next()
+        more_candidates = len(candidates) > 1
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=CONNECTION_ATTEMPT_DELAY if more_candidates else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                pending.difference_update(done)
+                results = {tasks[task]: task.result() for task in done}
+                for host, result in results.items():
+                    if isinstance(result, str):
+                        auth_failed |= result == "auth_failed"
+                    elif socket is None:
+                        _LOGGER.debug("Connected to %s, candidates: %s", host, candidates)
+                        data[CONF_HOST] = host
+                        socket = result
+                    else:
+                        await result.close()
+                if socket is not None:
+                    if unique_id is None:
+                        await socket.close()
+                    else:
+                        async_store_socket(self.hass, unique_id, data, socket)
+                    return None
+                more_candidates = start_next()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return "auth_failed" if auth_failed else "cannot_connect"
+
+    async def _async_test_host(self, data: dict[str, Any], host: str) -> HCSocket | str:
+        """Connect to the Appliance at a host, return the connected socket or the error."""
+        _LOGGER.debug("Testing connection to %s Appliance at %s", data[CONF_MODE], host)
+        if data[CONF_MODE] == "AES":
+            socket = hc_socket.AesSocket(host, data[CONF_PSK], data[CONF_AES_IV])
         else:
-            socket = hc_socket.TlsSocket(host, self.data[CONF_PSK])
+            socket = hc_socket.TlsSocket(host, data[CONF_PSK])
         try:
             await socket.connect()
         except (ClientConnectorSSLError, BinasciiError) as ex:
             _LOGGER.debug("validate_config failed: %s", ex)
-            return self.async_abort(reason="auth_failed")
+            await socket.close()
+            return "auth_failed"
         except (TimeoutError, ClientConnectionError) as ex:
             _LOGGER.debug("validate_config failed: %s", ex)
-            self.errors["base"] = "cannot_connect"
-        finally:
             await socket.close()
+            return "cannot_connect"
+        except BaseException:
+            await socket.close()
+            raise
+        return socket
+
+    async def async_step_test_connection(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Test connection with Appliance."""
+        self.errors = {}
+        error = await self._async_test_connection(self.data, self.unique_id)
+        if error == "auth_failed":
+            return self.async_abort(reason="auth_failed")
+        if error is not None:
+            self.errors["base"] = error
         if self.errors:
             _LOGGER.debug("Connection error, showing host step")
             return await self.async_step_host()
@@ -299,7 +626,15 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
 
     async def async_step_create_entry(self, data: dict) -> ConfigFlowResult:
         """Create an config entry or update existing entry for reauth."""
+        data = {**data}
+        if CONF_DESCRIPTION in data:
+            data[CONF_DESCRIPTION_HASH] = await async_save_description(
+                self.hass, data.pop(CONF_DESCRIPTION)
+            )
         if self.reauth_entry:
+            old_hash = self.reauth_entry.data.get(CONF_DESCRIPTION_HASH)
+            if old_hash is not None and old_hash != data.get(CONF_DESCRIPTION_HASH, old_hash):
+                await async_remove_description(self.hass, old_hash, self.reauth_entry.entry_id)
             return self.async_update_reload_and_abort(
                 self.reauth_entry,
                 data_updates=data,
@@ -322,14 +657,14 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
 
         appliance = self.appliances[self.unique_id]
         try:
-            appliance_info = appliance["info"]
-
-            self.data[CONF_DESCRIPTION] = appliance["description"]
-
-            self.data[CONF_DEVICE_ID] = random.randbytes(4).hex()  # noqa: S311
-            self.data[CONF_NAME] = f"{appliance_info['brand']} {appliance_info['type']}"
-
-            self._set_encryption_keys(appliance_info)
+            if "description" not in appliance:
+                await self._async_parse_descriptions({self.unique_id: appliance})
+            self._set_appliance_data(appliance, self.data)
+        except ParserError as exc:
+            return self.async_abort(
+                reason="profile_file_parser_error",
+                description_placeholders={"error": exc.args[0]},
+            )
         except (KeyError, ValueError):
             return self.async_abort(reason="invalid_profile_file")
 
@@ -343,12 +678,27 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
                 discovery_info.host,
             )
             await self.async_set_unique_id(discovery_info.properties["id"])
+            self.hass.data.setdefault(DISCOVERED_HOSTS_KEY, {})[self.unique_id] = str(
+                discovery_info.ip_address
+            )
+            address_cache = async_get_address_cache(self.hass)
+            address_cache.async_set(discovery_info.hostname, str(discovery_info.ip_address))
             updates = None
             config_entry = self.hass.config_entries.async_entry_for_domain_unique_id(
                 self.handler, self.unique_id
             )
+            if config_entry:
+                address_cache.async_set(
+                    config_entry.data[CONF_HOST], str(discovery_info.ip_address)
+                )
             if config_entry and not config_entry.data.get(CONF_MANUAL_HOST, False):
-                updates = {CONF_HOST: str(discovery_info.ip_address)}
+                if config_entry.state is ConfigEntryState.LOADED and (
+                    host_updater := config_entry.runtime_data.host_updater
+                ):
+                    # Debounced, applied without reloading the config entry
+                    host_updater.async_update(str(discovery_info.ip_address))
+                else:
+                    updates = {CONF_HOST: str(discovery_info.ip_address)}
             self._abort_if_unique_id_configured(updates=updates)
             self.data[CONF_HOST] = str(discovery_info.ip_address)
             self.data[CONF_NAME] = (
@@ -364,3 +714,15 @@ class HomeConnectConfigFlow(ConfigFlow, domain=DOMAIN):
             return await self.async_step_upload()
         except KeyError:
             return self.async_abort(reason="invalid_discovery_info")
+
+
+class HomeConnectOptionsFlow(OptionsFlow):
+    """HomeConnect Options flow."""
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        schema = self.add_suggested_values_to_schema(OPTIONS_SCHEMA, self.config_entry.options)
+        return self.async_show_form(step_id="init", data_schema=schema)
@@ -17,11 +17,28 @@ PLATFORMS: Final = [
     Platform.LIGHT,
     Platform.FAN,
 ]
+PLATFORM_DESCRIPTION_TYPES: Final[dict[Platform, tuple[str, ...]]] = {
+    Platform.BINARY_SENSOR: ("binary_sensor",),
+    Platform.SENSOR: ("sensor", "event_sensor", "active_program", "wifi"),
+    Platform.SWITCH: ("switch",),
+    Platform.SELECT: ("select", "program"),
+    Platform.BUTTON: ("button", "start_button"),
+    Platform.NUMBER: ("number",),
+    Platform.LIGHT: ("light",),
+    Platform.FAN: ("fan",),
+}
 
 CONF_PSK: Final = "psk"
 CONF_AES_IV: Final = "aes_iv"
 CONF_FILE: Final = "file"
 CONF_MANUAL_HOST: Final = "manual_host"
+CONF_SETUP_ALL: Final = "setup_all"
+CONF_DESCRIPTION_HASH: Final = "description_hash"
+CONF_MIN_UPDATE_INTERVAL: Final = "min_update_interval"
+CONF_BACKGROUND_CONNECT: Final = "background_connect"
+CONF_WRITE_WINDOW: Final = "write_window"
+CONF_OPTIMISTIC_STATE: Final = "optimistic_state"
+CONF_PARSE_PROFILES_IN_PARALLEL: Final = "parse_profiles_in_parallel"
 CONF_DEV_SETUP_FROM_DUMP: Final = "setup_from_dump_enabled"
 CONF_DEV_OVERRIDE_HOST: Final = "override_host"
 CONF_DEV_OVERRIDE_PSK: Final = "override_psk"
@@ -0,0 +1,201 @@
+"""Persistent cache of resolved Entity descriptions."""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import sys
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.loader import async_get_integration
+
+from .const import CONF_DESCRIPTION_HASH, DOMAIN
+from .entity_descriptions import descriptions_definitions
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .entity_descriptions import HCEntityDescription, _EntityDescriptionsType
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 0
+
+DESCRIPTION_CLASSES: dict[str, type[HCEntityDescription]] = {
+    cls.__name__: cls
+    for cls in vars(descriptions_definitions).values()
+    if isinstance(cls, type) and issubclass(cls, descriptions_definitions.HCEntityDescription)
+}
+ENUM_MODULES = ("homeassistant.", "homeconnect_websocket.", "custom_components.homeconnect_ws.")
+
+
+class DescriptionCacheError(Exception):
+    """Entity descriptions can't be cached."""
+
+
+def _encode(value: Any) -> Any:  # noqa: PLR0911
+    """Encode a value of an Entity description as JSON."""
+    if dataclasses.is_dataclass(value) and type(value).__name__ in DESCRIPTION_CLASSES:
+        return {
+            "__description__": type(value).__name__,
+            "fields": {
+                field.name: _encode(getattr(value, field.name))
+                for field in dataclasses.fields(value)
+                if field.init and getattr(value, field.name) != _field_default(field)
+            },
+        }
+    if isinstance(value, Enum):
+        return {
+            "__enum__": f"{type(value).__module__}:{type(value).__qualname__}",
+            "value": value.value,
+        }
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        return {"__set__": [_encode(item) for item in value]}
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {"__dict__": {key: _encode(item) for key, item in value.items()}}
+    msg = f"Can't encode {type(value).__name__}"
+    raise DescriptionCacheError(msg)
+
+
+def _decode(value: Any) -> Any:  # noqa: PLR0911
+    """Decode a value of an Entity description from JSON."""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__description__" in value:
+        cls = DESCRIPTION_CLASSES[value["__description__"]]
+        return cls(**{key: _decode(item) for key, item in value["fields"].items()})
+    if "__enum__" in value:
+        return _get_enum(value["__enum__"])(value["value"])
+    if "__tuple__" in value:
+        return tuple(_decode(item) for item in value["__tuple__"])
+    if "__set__" in value:
+        return {_decode(item) for item in value["__set__"]}
+    if "__dict__" in value:
+        return {key: _decode(item) for key, item in value["__dict__"].items()}
+    msg = "Unknown encoded value"
+    raise DescriptionCacheError(msg)
+
+
+def _field_default(field: dataclasses.Field) -> Any:
+    if field.default is not dataclasses.MISSING:
+        return field.default
+    if field.default_factory is not dataclasses.MISSING:
+        return field.default_factory()
+    return dataclasses.MISSING
+
+
+def _get_enum(path: str) -> type[Enum]:
+    """Get an already imported Enum class."""
+    module_name, _, qualname = path.partition(":")
+    if not module_name.startswith(ENUM_MODULES) or module_name not in sys.modules:
+        msg = f"Enum module {module_name} not available"
+        raise DescriptionCacheError(msg)
+    obj: Any = sys.modules[module_name]
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    if not isinstance(obj, type) or not issubclass(obj, Enum):
+        msg = f"{path} is not an Enum"
+        raise DescriptionCacheError(msg)
+    return obj
+
+
+def encode_descriptions(descriptions: _EntityDescriptionsType) -> dict[str, list]:
+    """Encode Entity descriptions, verifying they can be decoded without loss."""
+    encoded = {key: [_encode(item) for item in value] for key, value in descriptions.items()}
+    if decode_descriptions(encoded) != descriptions:
+        msg = "Entity descriptions changed after decoding"
+        raise DescriptionCacheError(msg)
+    return encoded
+
+
+def decode_descriptions(encoded: dict[str, list]) -> _EntityDescriptionsType:
+    """Decode Entity descriptions."""
+    return {key: [_decode(item) for item in value] for key, value in encoded.items()}
+
+
+class HCDescriptionCache:
+    """
+    Cache of the Entity descriptions resolved for a config entry.
+
+    The cache is keyed by a hash of the stored device description and the integration version,
+    so it is invalidated when either changes. The device info received on the last connect is
+    stored with the descriptions.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        self._hass = hass
+        self._config_entry = config_entry
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.descriptions.{config_entry.entry_id}"
+        )
+        self._key: str | None = None
+        self._data: dict[str, Any] | None = None
+        self.info: dict[str, Any] | None = None
+
+    async def _async_get_key(self) -> str:
+        if self._key is None:
+            integration = await async_get_integration(self._hass, DOMAIN)
+            self._key = f"{self._config_entry.data[CONF_DESCRIPTION_HASH]}:{integration.version}"
+        return self._key
+
+    async def async_load(self) -> _EntityDescriptionsType | None:
+        """Load the cached Entity descriptions, None if not cached or invalid."""
+        data = await self._store.async_load()
+        if data is None:
+            return None
+        if data.get("key") != await self._async_get_key():
+            _LOGGER.debug("Cached Entity descriptions are outdated")
+            return None
+        try:
+            descriptions = decode_descriptions(data["descriptions"])
+        except Exception:
+            _LOGGER.debug("Failed to load cached Entity descriptions", exc_info=True)
+            return None
+        self._data = data
+        self.info = data.get("info")
+        return descriptions
+
+    async def async_save(
+        self, descriptions: _EntityDescriptionsType, info: dict[str, Any] | None = None
+    ) -> None:
+        """Save the Entity descriptions and device info."""
+        try:
+            encoded = encode_descriptions(descriptions)
+        except Exception:
+            _LOGGER.debug("Entity descriptions can't be cached", exc_info=True)
+            await self.async_remove()
+            return
+        self._data = {"key": await self._async_get_key(), "descriptions": encoded}
+        self._async_save_info(info)
+
+    @callback
+    def async_update_info(self, info: dict[str, Any]) -> None:
+        """Update the stored device info, if the descriptions are cached and the info changed."""
+        if self._data is not None and info != self.info:
+            self._async_save_info(info)
+
+    @callback
+    def _async_save_info(self, info: dict[str, Any] | None) -> None:
+        self.info = dict(info) if info else None
+        data = {**self._data, "info": self.info}
+        self._data = data
+        self._store.async_delay_save(lambda: data, SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the cache."""
+        self._data = None
+        self.info = None
+        await self._store.async_remove()
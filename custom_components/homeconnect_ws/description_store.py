@@ -0,0 +1,94 @@
+"""Compressed storage of device descriptions outside of the config entries."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import zlib
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers.storage import Store
+
+from .const import CONF_DESCRIPTION_HASH, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import DeviceDescription
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+COMPRESSION_LEVEL = 9
+
+
+class DescriptionStoreError(Exception):
+    """Device description is missing or invalid."""
+
+
+def hash_description(description: DeviceDescription) -> str:
+    """Get the hash of a device description, as stored in JSON."""
+    # JSON object keys are strings, convert int keys (e.g. of enumerations) before sorting,
+    # so a decoded description has the same hash
+    data = json.dumps(
+        json.loads(json.dumps(description)), sort_keys=True, separators=(",", ":")
+    ).encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+def encode_description(description: DeviceDescription) -> dict[str, str]:
+    """Encode a device description as zlib compressed JSON."""
+    data = json.dumps(description, separators=(",", ":")).encode()
+    return {
+        "hash": hash_description(description),
+        "description": base64.b64encode(zlib.compress(data, COMPRESSION_LEVEL)).decode(),
+    }
+
+
+def decode_description(data: dict[str, str]) -> DeviceDescription:
+    """Decode a device description, verifying its hash."""
+    description = json.loads(zlib.decompress(base64.b64decode(data["description"])))
+    if hash_description(description) != data["hash"]:
+        msg = "Device description doesn't match its hash"
+        raise DescriptionStoreError(msg)
+    return description
+
+
+def _get_store(hass: HomeAssistant, description_hash: str) -> Store[dict[str, str]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.device_description.{description_hash}")
+
+
+async def async_save_description(hass: HomeAssistant, description: DeviceDescription) -> str:
+    """
+    Save a device description and return its hash.
+
+    Descriptions are stored once per hash, so appliances of the same model share one file.
+    """
+    data = await hass.async_add_executor_job(encode_description, description)
+    await _get_store(hass, data["hash"]).async_save(data)
+    return data["hash"]
+
+
+async def async_load_description(hass: HomeAssistant, description_hash: str) -> DeviceDescription:
+    """Load a device description by its hash."""
+    data = await _get_store(hass, description_hash).async_load()
+    if data is None or data.get("hash") != description_hash:
+        msg = f"Device description {description_hash} not found"
+        raise DescriptionStoreError(msg)
+    try:
+        return await hass.async_add_executor_job(decode_description, data)
+    except (ValueError, zlib.error) as ex:
+        msg = f"Device description {description_hash} is invalid"
+        raise DescriptionStoreError(msg) from ex
+
+
+async def async_remove_description(
+    hass: HomeAssistant, description_hash: str, entry_id: str
+) -> None:
+    """Remove a device description, if not used by another config entry."""
+    for entry in hass.config_entries.async_entries(DOMAIN, include_ignore=False):
+        if entry.entry_id != entry_id and entry.data.get(CONF_DESCRIPTION_HASH) == description_hash:
+            _LOGGER.debug("Device description %s still in use", description_hash)
+            return
+    await _get_store(hass, description_hash).async_remove()
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import contextlib
+from dataclasses import asdict
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.diagnostics import async_redact_data
-from homeassistant.const import CONF_DEVICE_ID
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID
 
-from .const import CONF_AES_IV, CONF_PSK
+from . import get_connect_stats
+from .const import CONF_AES_IV, CONF_DESCRIPTION_HASH, CONF_PSK
+from .description_store import DescriptionStoreError, async_load_description
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -18,11 +23,32 @@ TO_REDACT = [CONF_PSK, CONF_AES_IV, CONF_DEVICE_ID, "serialNumber", "deviceID",
 
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant,  # noqa: ARG001
+    hass: HomeAssistant,
     entry: HCConfigEntry,
 ) -> dict[str, Any]:
-    """Return diagnostics for a config entry."""
+    """
+    Return diagnostics for a config entry.
+
+    The connect stats are reported during setup retries too, runtime data only when loaded.
+    The entry data includes the stored device description, so a config entry can be set up
+    from the diagnostics, see `config_flow.process_json_file`.
+    """
+    entry_data = dict(entry.data)
+    if CONF_DESCRIPTION_HASH in entry_data:
+        with contextlib.suppress(DescriptionStoreError):
+            entry_data[CONF_DESCRIPTION] = await async_load_description(
+                hass, entry_data[CONF_DESCRIPTION_HASH]
+            )
+    diagnostics = {
+        "entry_data": async_redact_data(entry_data, TO_REDACT),
+        "connect_stats": asdict(get_connect_stats(hass, entry)),
+    }
+    if entry.state is not ConfigEntryState.LOADED:
+        return diagnostics
     return {
-        "entry_data": async_redact_data(entry.data, TO_REDACT),
+        **diagnostics,
         "appliance_state": entry.runtime_data.appliance.dump(),
+        "state_writes": entry.runtime_data.dispatcher.dump(),
+        "write_confirmations": entry.runtime_data.optimistic_state.dump(),
+        "platform_setup_times": entry.runtime_data.platform_setup_times,
     }
@@ -0,0 +1,207 @@
+"""Coalesced state write dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import HomeAppliance
+    from homeconnect_websocket.entities import Entity as HcEntity
+
+    from .entity import HCEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+CONNECT_WAIT_TIMEOUT = 10
+DEFAULT_WRITE_COOLDOWN = 0.0
+
+
+@dataclass
+class DispatcherStats:
+    """Counters for received updates and written states."""
+
+    updates: int = 0
+    "HC entity updates received"
+    batches: int = 0
+    "Batches of updates flushed, one per message or event loop tick"
+    writes: int = 0
+    "State writes of HA entities"
+    deferred: int = 0
+    "State writes deferred by the write cooldown"
+    skipped: int = 0
+    "State writes skipped, because the state didn't change"
+
+
+class HCDispatcher:
+    """
+    Dispatch HC entity updates to HA entities.
+
+    All HC entity updates received within one message (or event loop tick) are collected,
+    mapped to the affected HA entities and each affected HA entity is written only once.
+    Entities written less then their `min_update_interval` (or the `cooldown`) ago stay pending
+    and are written when the interval expires, so the last value is always written.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        appliance: HomeAppliance,
+        cooldown: float = DEFAULT_WRITE_COOLDOWN,
+    ) -> None:
+        self._hass = hass
+        self._config_entry = config_entry
+        self._appliance = appliance
+        self._cooldown = cooldown
+        self._listeners: dict[str, dict[HCEntity, None]] = {}
+        self._pending: dict[HCEntity, None] = {}
+        self._last_write: dict[HCEntity, float] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._connected_waiter: asyncio.Task | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._timer_due: float | None = None
+        self.stats = DispatcherStats()
+
+    @callback
+    def async_add_listener(self, entity: HCEntity, hc_entities: list[HcEntity]) -> CALLBACK_TYPE:
+        """Add a HA entity as listener for updates of the given HC entities."""
+        for hc_entity in hc_entities:
+            if hc_entity.name not in self._listeners:
+                self._listeners[hc_entity.name] = {}
+                hc_entity.register_callback(self._async_hc_update)
+            self._listeners[hc_entity.name][entity] = None
+
+        @callback
+        def remove_listener() -> None:
+            self._pending.pop(entity, None)
+            self._last_write.pop(entity, None)
+            for hc_entity in hc_entities:
+                listeners = self._listeners.get(hc_entity.name)
+                if listeners is None:
+                    continue
+                listeners.pop(entity, None)
+                if not listeners:
+                    del self._listeners[hc_entity.name]
+                    hc_entity.unregister_callback(self._async_hc_update)
+
+        return remove_listener
+
+    @callback
+    def async_update_all(self) -> None:
+        """Write the state of all HA entities, e.g. after the first connect."""
+        for listeners in self._listeners.values():
+            self._pending.update(listeners)
+        self._async_schedule_flush()
+
+    @callback
+    def async_update_entities(self, hc_entities: list[HcEntity]) -> None:
+        """Write the state of the HA entities of HC entities changed locally."""
+        for hc_entity in hc_entities:
+            for entity in self._listeners.get(hc_entity.name, ()):
+                self._pending[entity] = None
+        self._async_schedule_flush()
+
+    async def _async_hc_update(self, hc_entity: HcEntity) -> None:
+        """Handle update of a HC entity."""
+        self.stats.updates += 1
+        for entity in self._listeners.get(hc_entity.name, ()):
+            self._pending[entity] = None
+        self._async_schedule_flush()
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Schedule a flush, if none is scheduled."""
+        if self._pending and self._flush_task is None:
+            # Runs after all callbacks scheduled by the current message
+            self._flush_task = self._config_entry.async_create_task(
+                self._hass, self._async_flush(), "homeconnect_ws dispatcher", eager_start=False
+            )
+
+    async def _async_wait_connected(self) -> None:
+        """Wait for the session to be connected, shared by all pending entities."""
+        if self._appliance.session.connected:
+            return
+        if self._connected_waiter is None or self._connected_waiter.done():
+            self._connected_waiter = self._config_entry.async_create_background_task(
+                self._hass,
+                asyncio.wait_for(
+                    self._appliance.session.connected_event.wait(), CONNECT_WAIT_TIMEOUT
+                ),
+                "homeconnect_ws connected waiter",
+            )
+        with contextlib.suppress(TimeoutError):
+            await asyncio.shield(self._connected_waiter)
+
+    async def _async_flush(self) -> None:
+        """Write state of all pending HA entities, which are not in cooldown."""
+        try:
+            await self._async_wait_connected()
+        finally:
+            self._flush_task = None
+        self.stats.batches += 1
+        now = self._hass.loop.time()
+        next_due: float | None = None
+        pending = self._pending
+        self._pending = {}
+        for entity in pending:
+            if entity.hass is None:
+                continue
+            interval = entity.min_update_interval
+            if interval is None:
+                interval = self._cooldown
+            due = self._last_write.get(entity, -interval) + interval
+            if due > now and not entity.is_significant_change():
+                self._pending[entity] = None
+                self.stats.deferred += 1
+                next_due = due if next_due is None else min(next_due, due)
+                continue
+            if entity.async_write_ha_state_if_changed():
+                self._last_write[entity] = now
+                self.stats.writes += 1
+            else:
+                self.stats.skipped += 1
+        if next_due is not None:
+            self._async_schedule_timer(next_due)
+
+    @callback
+    def _async_schedule_timer(self, due: float) -> None:
+        """Schedule a flush for entities with an expired cooldown."""
+        if self._unsub_timer is not None:
+            if self._timer_due <= due:
+                return
+            self._unsub_timer()
+        self._timer_due = due
+        self._unsub_timer = async_call_later(
+            self._hass, max(due - self._hass.loop.time(), 0), self._async_handle_timer
+        )
+
+    @callback
+    def _async_handle_timer(self, _: datetime) -> None:
+        self._unsub_timer = None
+        self._timer_due = None
+        self._async_schedule_flush()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel pending timers and tasks."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        if self._connected_waiter is not None:
+            self._connected_waiter.cancel()
+        self._pending.clear()
+
+    def dump(self) -> dict:
+        """Dump dispatcher statistics."""
+        return asdict(self.stats)
@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
-import asyncio
-import contextlib
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
+from homeconnect_websocket.message import Action, Message
 
+from .const import CONF_MIN_UPDATE_INTERVAL
 from .helpers import entity_is_available
+from .write_queue import SLIDER_DEBOUNCE, HCWriteDebouncer, get_raw_value
 
 if TYPE_CHECKING:
     from homeassistant.helpers.device_registry import DeviceInfo
     from homeconnect_websocket import HomeAppliance
     from homeconnect_websocket.entities import Entity as HcEntity
 
+    from . import HCData
     from .entity_descriptions.descriptions_definitions import (
         ExtraAttributeDict,
         HCEntityDescription,
@@ -32,7 +35,11 @@ class HCEntity(Entity):
     _entity: HcEntity | None = None
     _entities: list[HcEntity]
     _extra_attributes: list[ExtraAttributeDict]
-    _has_callback: bool = False
+    _state_fingerprint: tuple | None = None
+    _written_value: Any | None = None
+    _min_update_interval: float | None = None
+    _runtime_data: HCData | None = None
+    _write_debouncer: HCWriteDebouncer | None = None
 
     def __init__(
         self,
@@ -60,17 +67,20 @@ class HCEntity(Entity):
             for extra_attribute in entity_description.extra_attributes:
                 if extra_attribute["entity"] in self._appliance.entities:
                     self._extra_attributes.append(extra_attribute)
+        self._min_update_interval = entity_description.min_update_interval
 
     async def async_added_to_hass(self) -> None:
-        for entity in self._entities:
-            entity.register_callback(self.callback)
-
-    async def async_will_remove_from_hass(self) -> None:
-        for entity in self._entities:
-            entity.unregister_callback(self.callback)
+        if self.entity_description.min_update_interval is not None:
+            self._min_update_interval = self.platform.config_entry.options.get(
+                CONF_MIN_UPDATE_INTERVAL, self.entity_description.min_update_interval
+            )
+        self._runtime_data = self.platform.config_entry.runtime_data
+        self.async_on_remove(self._runtime_data.dispatcher.async_add_listener(self, self._entities))
 
     @property
     def available(self) -> bool:
+        if self._runtime_data is not None and self._runtime_data.awaiting_connection:
+            return False
         available = (
             self._appliance.session.connected
             # Hide first reconnect
@@ -100,11 +110,124 @@ class HCEntity(Entity):
                 extra_state_attributes[description["name"]] = entity.value
         return extra_state_attributes
 
-    async def callback(self, _: HcEntity) -> None:
-        if not self._has_callback:
-            self._has_callback = True
-            if not self._appliance.session.connected:
-                with contextlib.suppress(TimeoutError):
-                    await asyncio.wait_for(self._appliance.session.connected_event.wait(), 10)
-            self.async_write_ha_state()
-            self._has_callback = False
+    async def async_set_value(self, value: Any, entity: HcEntity | None = None) -> None:
+        """
+        Set the value of an HC entity (the main entity by default) through the write queue.
+
+        The write is skipped if the value equals the known value of the HC entity.
+        """
+        entity = entity or self._entity
+        if self._runtime_data is None or self._runtime_data.write_queue is None:
+            await entity.set_value(value)
+            return
+        if get_raw_value(entity, value) == self._get_known_value(entity):
+            _LOGGER.debug("Skipping write of unchanged value to %s", entity.name)
+            return
+        await self._runtime_data.write_queue.async_set_value(entity, value)
+
+    async def async_set_value_debounced(self, value: Any) -> None:
+        """Set the value of the main HC entity, only the last value of a burst is written."""
+        if self._write_debouncer is None:
+            self._write_debouncer = HCWriteDebouncer(
+                self.hass, SLIDER_DEBOUNCE, self.async_set_value
+            )
+            self.async_on_remove(self._write_debouncer.async_shutdown)
+        await self._write_debouncer.async_write(value)
+
+    async def async_set_values_raw(self, values: dict[HcEntity, Any]) -> None:
+        """
+        Set raw values of HC entities in one message through the write queue.
+
+        Only values that differ from the known value of their HC entity are written.
+        """
+        values = {
+            entity: value
+            for entity, value in values.items()
+            if value != self._get_known_value(entity)
+        }
+        if not values:
+            return
+        if self._runtime_data is None or self._runtime_data.write_queue is None:
+            message = Message(
+                resource="/ro/values",
+                action=Action.POST,
+                data=[{"uid": entity.uid, "value": value} for entity, value in values.items()],
+            )
+            await self._appliance.session.send_sync(message)
+            return
+        await self._runtime_data.write_queue.async_set_values_raw(values)
+
+    def get_value(self, entity: HcEntity | None = None) -> Any:
+        """Get the value of an HC entity (the main entity by default), or its optimistic state."""
+        entity = entity or self._entity
+        if self._runtime_data is None or self._runtime_data.optimistic_state is None:
+            return entity.value
+        return self._runtime_data.optimistic_state.get_value(entity)
+
+    def get_value_raw(self, entity: HcEntity | None = None) -> Any:
+        """Get the raw value of an HC entity (the main entity by default), see `get_value`."""
+        entity = entity or self._entity
+        if self._runtime_data is None or self._runtime_data.optimistic_state is None:
+            return entity.value_raw
+        return self._runtime_data.optimistic_state.get_value_raw(entity)
+
+    def _get_known_value(self, entity: HcEntity) -> Any:
+        """Get the raw value of an HC entity, including unconfirmed writes."""
+        if self._runtime_data is None or self._runtime_data.optimistic_state is None:
+            return entity.value_raw
+        return self._runtime_data.optimistic_state.get_known_value(entity)
+
+    @property
+    def min_update_interval(self) -> float | None:
+        """Minimum time in seconds between two state writes."""
+        return self._min_update_interval
+
+    def is_significant_change(self) -> bool:
+        """Check if the value changed more then `significant_change` since the last write."""
+        threshold = self.entity_description.significant_change
+        if threshold is None or self._entity is None:
+            return False
+        try:
+            return abs(float(self.get_value()) - float(self._written_value)) >= threshold
+        except (TypeError, ValueError):
+            return True
+
+    def _compute_state_fingerprint(self) -> tuple:
+        """Get a fingerprint of the current state."""
+        if not self.available:
+            return (False,)
+        return (True, self.state, self.state_attributes, self.extra_state_attributes)
+
+    def _get_state_fingerprint(self) -> tuple | None:
+        """Get the fingerprint of the current state, `None` if it's always written."""
+        if self.force_update:
+            return None
+        try:
+            return self._compute_state_fingerprint()
+        except Exception:  # noqa: BLE001
+            return None
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, refreshing the fingerprint of the last written state."""
+        self._async_write_state(self._get_state_fingerprint())
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> bool:
+        """
+        Write the state, if it changed since the last write.
+
+        Descriptions with `force_update` set are always written.
+        """
+        fingerprint = self._get_state_fingerprint()
+        if fingerprint is not None and fingerprint == self._state_fingerprint:
+            return False
+        self._async_write_state(fingerprint)
+        return True
+
+    @callback
+    def _async_write_state(self, fingerprint: tuple | None) -> None:
+        self._state_fingerprint = fingerprint
+        super().async_write_ha_state()
+        if self._entity is not None:
+            self._written_value = self.get_value()
@@ -1,14 +1,18 @@
-"""Description for all supported Entities."""
+"""
+Description for all supported Entities.
+
+The descriptions of an appliance domain (e.g. Cooking) are imported on first use, when an appliance
+has HC entities in the namespace of the domain.
+"""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import TYPE_CHECKING, Any
 
 from custom_components.homeconnect_ws.helpers import merge_dicts
 
 from .common import COMMON_ENTITY_DESCRIPTIONS
-from .consumer_products import CONSUMER_PRODUCTS_ENTITY_DESCRIPTIONS
-from .cooking import COOKING_ENTITY_DESCRIPTIONS
 from .descriptions_definitions import (
     EntityDescriptions,
     HCBinarySensorEntityDescription,
@@ -23,29 +27,130 @@ from .descriptions_definitions import (
     _EntityDescriptionsDefinitionsType,
     _EntityDescriptionsType,
 )
-from .dishcare import DISHCARE_ENTITY_DESCRIPTIONS
-from .laundry_care import LAUNDRY_ENTITY_DESCRIPTIONS
-from .refrigeration import REFRIGERATION_ENTITY_DESCRIPTIONS
 
 if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
     from homeconnect_websocket import HomeAppliance
 
+DESCRIPTION_MODULES: dict[str, tuple[str, str]] = {
+    "ConsumerProducts": ("consumer_products", "CONSUMER_PRODUCTS_ENTITY_DESCRIPTIONS"),
+    "Cooking": ("cooking", "COOKING_ENTITY_DESCRIPTIONS"),
+    "Dishcare": ("dishcare", "DISHCARE_ENTITY_DESCRIPTIONS"),
+    "LaundryCare": ("laundry_care", "LAUNDRY_ENTITY_DESCRIPTIONS"),
+    "Refrigeration": ("refrigeration", "REFRIGERATION_ENTITY_DESCRIPTIONS"),
+}
+"Module and descriptions name by HC entity namespace"
+
+ALL_ENTITY_DESCRIPTIONS: dict[frozenset[str], _EntityDescriptionsDefinitionsType] = {}
+ENTITY_DESCRIPTION_INDEXES: dict[int, EntityDescriptionIndex] = {}
+
+
+def get_namespaces(appliance: HomeAppliance) -> frozenset[str]:
+    """Get the namespaces with descriptions the appliance has HC entities in."""
+    namespaces = {name.partition(".")[0] for name in appliance.entities}
+    return frozenset(namespaces.intersection(DESCRIPTION_MODULES))
 
-ALL_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType | None = None
 
+def load_description_modules(namespaces: Iterable[str] | None = None) -> None:
+    """
+    Import the description modules of the namespaces (all if None).
 
-def get_all_entity_description() -> _EntityDescriptionsDefinitionsType:
-    global ALL_ENTITY_DESCRIPTIONS  # noqa: PLW0603
-    if ALL_ENTITY_DESCRIPTIONS is None:
-        ALL_ENTITY_DESCRIPTIONS = merge_dicts(
+    Imports are blocking, so call this in the import executor before
+    getting the descriptions in the event loop.
+    """
+    for namespace in DESCRIPTION_MODULES if namespaces is None else namespaces:
+        importlib.import_module(f"{__name__}.{DESCRIPTION_MODULES[namespace][0]}")
+
+
+def get_all_entity_description(
+    namespaces: Iterable[str] | None = None,
+) -> _EntityDescriptionsDefinitionsType:
+    """Get the merged common descriptions and the descriptions of the namespaces (all if None)."""
+    namespaces = frozenset(DESCRIPTION_MODULES if namespaces is None else namespaces)
+    if namespaces not in ALL_ENTITY_DESCRIPTIONS:
+        load_description_modules(namespaces)
+        ALL_ENTITY_DESCRIPTIONS[namespaces] = merge_dicts(
             COMMON_ENTITY_DESCRIPTIONS,
-            CONSUMER_PRODUCTS_ENTITY_DESCRIPTIONS,
-            COOKING_ENTITY_DESCRIPTIONS,
-            DISHCARE_ENTITY_DESCRIPTIONS,
-            LAUNDRY_ENTITY_DESCRIPTIONS,
-            REFRIGERATION_ENTITY_DESCRIPTIONS,
+            *(
+                getattr(importlib.import_module(f"{__name__}.{module}"), descriptions)
+                for namespace, (module, descriptions) in DESCRIPTION_MODULES.items()
+                if namespace in namespaces
+            ),
         )
-    return ALL_ENTITY_DESCRIPTIONS
+    return ALL_ENTITY_DESCRIPTIONS[namespaces]
+
+
+class EntityDescriptionIndex:
+    """
+    Entity descriptions compiled into an index from HC entity name to descriptions.
+
+    Each description is identified by its position in the merged descriptions, so matches can be
+    returned in the original order.
+    """
+
+    def __init__(self, all_descriptions: _EntityDescriptionsDefinitionsType) -> None:
+        self.source = all_descriptions
+        "Descriptions the index was compiled from"
+        self.descriptions: list[tuple[str, Any]] = []
+        "Description type and description (or generator function) by position"
+        self.required_count: list[int] = []
+        "Number of HC entities required by the description at each position"
+        self.by_entity: dict[str, list[int]] = {}
+        "Positions of the static descriptions requiring each HC entity"
+        self.always: list[int] = []
+        "Positions of generator functions and descriptions without required HC entities"
+
+        for description_type, descriptions in all_descriptions.items():
+            for description in descriptions:
+                position = len(self.descriptions)
+                self.descriptions.append((description_type, description))
+                if description_type == "dynamic" or callable(description):
+                    self.required_count.append(0)
+                    self.always.append(position)
+                    continue
+                required = set(description.entities or ())
+                if description.entity:
+                    required.add(description.entity)
+                self.required_count.append(len(required))
+                if not required:
+                    self.always.append(position)
+                for entity in required:
+                    self.by_entity.setdefault(entity, []).append(position)
+
+    def match(self, appliance_entities: Collection[str]) -> list[int]:
+        """Get the positions of all generators and static descriptions matching the entities."""
+        by_entity = self.by_entity
+        if len(appliance_entities) < len(by_entity):
+            present = [by_entity[name] for name in appliance_entities if name in by_entity]
+        else:
+            present = [
+                positions for name, positions in by_entity.items() if name in appliance_entities
+            ]
+
+        matched = list(self.always)
+        required_count = self.required_count
+        found: dict[int, int] = {}
+        for positions in present:
+            for position in positions:
+                count = found.get(position, 0) + 1
+                found[position] = count
+                if count == required_count[position]:
+                    matched.append(position)
+        matched.sort()
+        return matched
+
+
+def get_entity_description_index(
+    namespaces: Iterable[str] | None = None,
+) -> EntityDescriptionIndex:
+    """Get the Entity description index of the namespaces (all if None), compiled on first use."""
+    all_descriptions = get_all_entity_description(namespaces)
+    index = ENTITY_DESCRIPTION_INDEXES.get(id(all_descriptions))
+    if index is None or index.source is not all_descriptions:
+        index = EntityDescriptionIndex(all_descriptions)
+        ENTITY_DESCRIPTION_INDEXES[id(all_descriptions)] = index
+    return index
 
 
 def get_available_entities(appliance: HomeAppliance) -> EntityDescriptions:
@@ -65,31 +170,24 @@ def get_available_entities(appliance: HomeAppliance) -> EntityDescriptions:
         "light": [],
         "fan": [],
     }
-    appliance_entities = set(appliance.entities)
-    for description_type, descriptions in get_all_entity_description().items():
+    index = get_entity_description_index(get_namespaces(appliance))
+    for position in index.match(appliance.entities):
+        description_type, description = index.descriptions[position]
         # dynamic descriptions
         if description_type == "dynamic":
-            for descriptions_fn in descriptions:
-                dynamic_descriptions: _EntityDescriptionsType = descriptions_fn(appliance)
-                for key, value in dynamic_descriptions.items():
-                    available_entities[key].extend(value)
-            continue
-        for description in descriptions:
-            if callable(description):
-                if dynamic_description := description(appliance):
-                    available_entities[description_type].append(dynamic_description)
-            else:
-                all_subscribed_entities = set()
-                if description.entity:
-                    all_subscribed_entities.add(description.entity)
-                if description.entities:
-                    all_subscribed_entities.update(description.entities)
-                if appliance_entities.issuperset(all_subscribed_entities):
-                    available_entities[description_type].append(description)
+            dynamic_descriptions: _EntityDescriptionsType = description(appliance)
+            for key, value in dynamic_descriptions.items():
+                available_entities[key].extend(value)
+        elif callable(description):
+            if dynamic_description := description(appliance):
+                available_entities[description_type].append(dynamic_description)
+        else:
+            available_entities[description_type].append(description)
     return available_entities
 
 
 __all__ = [
+    "EntityDescriptionIndex",
     "EntityDescriptions",
     "HCBinarySensorEntityDescription",
     "HCButtonEntityDescription",
@@ -102,4 +200,7 @@ __all__ = [
     "HCSwitchEntityDescription",
     "_EntityDescriptionsType",
     "get_available_entities",
+    "get_entity_description_index",
+    "get_namespaces",
+    "load_description_modules",
 ]
@@ -12,6 +12,8 @@ from homeconnect_websocket.entities import Execution
 from .descriptions_definitions import (
     EntityDescriptions,
     HCButtonEntityDescription,
+    HCLightEntityDescription,
+    _EntityDescriptionsDefinitionsType,
 )
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -33,3 +35,38 @@ def generate_start_button(appliance: "HomeAppliance") -> EntityDescriptions:
             category=EntityCategory.CONFIG,
         )
     return []
+
+
+def generate_hood_ambient_light(appliance: HomeAppliance) -> HCLightEntityDescription | None:
+    """Get ambient light descriptions."""
+    if (
+        "BSH.Common.Setting.AmbientLightCustomColor" in appliance.entities
+        and "BSH.Common.Setting.AmbientLightColor" in appliance.entities
+    ):
+        return HCLightEntityDescription(
+            key="light_cooking_ambient_lighting",
+            entity="BSH.Common.Setting.AmbientLightEnabled",
+            brightness_entity="BSH.Common.Setting.AmbientLightBrightness",
+            color_entity="BSH.Common.Setting.AmbientLightCustomColor",
+            color_mode_entity="BSH.Common.Setting.AmbientLightColor",
+        )
+
+    if "BSH.Common.Setting.AmbientLightBrightness" in appliance.entities:
+        return HCLightEntityDescription(
+            key="light_cooking_ambient_lighting",
+            entity="BSH.Common.Setting.AmbientLightEnabled",
+            brightness_entity="BSH.Common.Setting.AmbientLightBrightness",
+        )
+
+    if "BSH.Common.Setting.AmbientLightEnabled" in appliance.entities:
+        return HCLightEntityDescription(
+            key="light_cooking_ambient_lighting",
+            entity="BSH.Common.Setting.AmbientLightEnabled",
+        )
+    return None
+
+
+COMMON_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
+    "button": [generate_start_button],
+    "light": [generate_hood_ambient_light],
+}
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import re
 from typing import TYPE_CHECKING
 
 from homeassistant.components.number import NumberDeviceClass, NumberMode
@@ -10,7 +9,7 @@ from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.switch import SwitchDeviceClass
 from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTemperature, UnitOfTime
 
-from custom_components.homeconnect_ws.helpers import get_groups_from_regex
+from custom_components.homeconnect_ws.helpers import get_entity_trie
 
 from .descriptions_definitions import (
     EntityDescriptions,
@@ -29,23 +28,22 @@ if TYPE_CHECKING:
 
 def generate_oven_status(appliance: HomeAppliance) -> EntityDescriptions:
     """Get Oven status descriptions."""
-    pattern = re.compile(r"^Cooking\.Oven\.Status\.Cavity\.([0-9]*)\..*$")
-    groups = get_groups_from_regex(appliance, pattern)
+    groups = get_entity_trie(appliance).get_numeric_groups("Cooking.Oven.Status.Cavity")
     descriptions = EntityDescriptions(event_sensor=[], sensor=[])
     for group in groups:
-        group_name = f" {int(group[0])}"
+        group_name = f" {int(group)}"
         if len(groups) == 1:
             group_name = ""
 
         # Water Tank
         entities = (
-            f"Cooking.Oven.Status.Cavity.{group[0]}.WaterTankUnplugged",
-            f"Cooking.Oven.Status.Cavity.{group[0]}.WaterTankEmpty",
+            f"Cooking.Oven.Status.Cavity.{group}.WaterTankUnplugged",
+            f"Cooking.Oven.Status.Cavity.{group}.WaterTankEmpty",
         )
         if all(entity in appliance.entities for entity in entities):
             descriptions["event_sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_oven_water_tank_{group[0]}",
+                    key=f"sensor_oven_water_tank_{group}",
                     translation_key="sensor_oven_water_tank",
                     translation_placeholders={"group_name": group_name},
                     entities=entities,
@@ -55,16 +53,18 @@ def generate_oven_status(appliance: HomeAppliance) -> EntityDescriptions:
             )
 
         # Temperatur
-        entity = f"Cooking.Oven.Status.Cavity.{group[0]}.CurrentTemperature"
+        entity = f"Cooking.Oven.Status.Cavity.{group}.CurrentTemperature"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_oven_current_temperature_{group[0]}",
+                    key=f"sensor_oven_current_temperature_{group}",
                     translation_key="sensor_oven_current_temperature",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
                     device_class=SensorDeviceClass.TEMPERATURE,
                     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                    min_update_interval=30,
+                    significant_change=10,
                 )
             )
 
@@ -87,18 +87,17 @@ def generate_hood_fan(appliance: HomeAppliance) -> HCFanEntityDescription:
 
 def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
     """Get Oven status descriptions."""
-    pattern = re.compile(r"^Cooking\.Hob\.Status\.Zone\.([0-9]*)\..*$")
-    groups = get_groups_from_regex(appliance, pattern)
+    groups = get_entity_trie(appliance).get_numeric_groups("Cooking.Hob.Status.Zone")
     descriptions = EntityDescriptions(sensor=[])
     for group in groups:
-        group_name = f" {int(group[0])}"
+        group_name = f" {int(group)}"
 
         # State
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.State"
+        entity = f"Cooking.Hob.Status.Zone.{group}.State"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_state",
+                    key=f"sensor_hob_zone_{group}_state",
                     translation_key="sensor_hob_zone_state",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -107,18 +106,18 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
                     extra_attributes=[
                         {
                             "name": "Type",
-                            "entity": f"Cooking.Hob.Status.Zone.{group[0]}.Type",
+                            "entity": f"Cooking.Hob.Status.Zone.{group}.Type",
                         }
                     ],
                 )
             )
 
         # OperationState
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.OperationState"
+        entity = f"Cooking.Hob.Status.Zone.{group}.OperationState"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_operationstate",
+                    key=f"sensor_hob_zone_{group}_operationstate",
                     translation_key="sensor_hob_zone_operationstate",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -128,11 +127,11 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # PowerLevel
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.PowerLevel"
+        entity = f"Cooking.Hob.Status.Zone.{group}.PowerLevel"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_power_level",
+                    key=f"sensor_hob_zone_{group}_power_level",
                     translation_key="sensor_hob_zone_power_level",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -142,11 +141,11 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # FryingSensorLevel
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.FryingSensorLevel"
+        entity = f"Cooking.Hob.Status.Zone.{group}.FryingSensorLevel"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_frying_sensor_level",
+                    key=f"sensor_hob_zone_{group}_frying_sensor_level",
                     translation_key="sensor_hob_zone_frying_sensor_level",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -156,38 +155,42 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # CurrentTemperature
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.CurrentTemperature"
+        entity = f"Cooking.Hob.Status.Zone.{group}.CurrentTemperature"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_current_temperature",
+                    key=f"sensor_hob_zone_{group}_current_temperature",
                     translation_key="sensor_hob_zone_current_temperature",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
                     device_class=SensorDeviceClass.TEMPERATURE,
                     native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                    min_update_interval=30,
+                    significant_change=10,
                 )
             )
 
         # HeatupProgress
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.HeatupProgress"
+        entity = f"Cooking.Hob.Status.Zone.{group}.HeatupProgress"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_heatup_progress",
+                    key=f"sensor_hob_zone_{group}_heatup_progress",
                     translation_key="sensor_hob_zone_heatup_progress",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
                     native_unit_of_measurement=PERCENTAGE,
+                    min_update_interval=30,
+                    significant_change=10,
                 )
             )
 
         # Duration
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.Duration"
+        entity = f"Cooking.Hob.Status.Zone.{group}.Duration"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_duration",
+                    key=f"sensor_hob_zone_{group}_duration",
                     translation_key="sensor_hob_zone_duration",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
@@ -198,49 +201,53 @@ def generate_hob_zones(appliance: HomeAppliance) -> HCFanEntityDescription:
             )
 
         # ElapsedProgramTime
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.ElapsedProgramTime"
-        extra_entity = f"Cooking.Hob.Status.Zone.{group[0]}.ElapsedProgramTime.AutoCounting"
+        entity = f"Cooking.Hob.Status.Zone.{group}.ElapsedProgramTime"
+        extra_entity = f"Cooking.Hob.Status.Zone.{group}.ElapsedProgramTime.AutoCounting"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_elapsed_program_time",
+                    key=f"sensor_hob_zone_{group}_elapsed_program_time",
                     translation_key="sensor_hob_zone_elapsed_program_time",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
                     device_class=SensorDeviceClass.DURATION,
                     native_unit_of_measurement=UnitOfTime.SECONDS,
                     suggested_unit_of_measurement=UnitOfTime.MINUTES,
+                    min_update_interval=60,
                     extra_attributes=[{"name": "Auto Counting", "entity": extra_entity}],
                 )
             )
 
         # RemainingProgramTime
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.RemainingProgramTime"
-        extra_entity = f"Cooking.Hob.Status.Zone.{group[0]}.RemainingProgramTime.AutoCounting"
+        entity = f"Cooking.Hob.Status.Zone.{group}.RemainingProgramTime"
+        extra_entity = f"Cooking.Hob.Status.Zone.{group}.RemainingProgramTime.AutoCounting"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_remaining_program_time",
+                    key=f"sensor_hob_zone_{group}_remaining_program_time",
                     translation_key="sensor_hob_zone_remaining_program_time",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
                     device_class=SensorDeviceClass.DURATION,
                     native_unit_of_measurement=UnitOfTime.SECONDS,
                     suggested_unit_of_measurement=UnitOfTime.MINUTES,
+                    min_update_interval=60,
                     extra_attributes=[{"name": "Auto Counting", "entity": extra_entity}],
                 )
             )
 
         # ProgramProgress
-        entity = f"Cooking.Hob.Status.Zone.{group[0]}.ProgramProgress"
+        entity = f"Cooking.Hob.Status.Zone.{group}.ProgramProgress"
         if entity in appliance.entities:
             descriptions["sensor"].append(
                 HCSensorEntityDescription(
-                    key=f"sensor_hob_zone_{group[0]}_program_progress",
+                    key=f"sensor_hob_zone_{group}_program_progress",
                     translation_key="sensor_hob_zone_program_progress",
                     translation_placeholders={"group_name": group_name},
                     entity=entity,
                     native_unit_of_measurement=PERCENTAGE,
+                    min_update_interval=30,
+                    significant_change=10,
                 )
             )
 
@@ -272,35 +279,6 @@ def generate_hood_light(appliance: HomeAppliance) -> HCFanEntityDescription:
     return None
 
 
-def generate_hood_ambient_light(appliance: HomeAppliance) -> HCFanEntityDescription:
-    """Get Hood light descriptions."""
-    if (
-        "BSH.Common.Setting.AmbientLightCustomColor" in appliance.entities
-        and "BSH.Common.Setting.AmbientLightColor" in appliance.entities
-    ):
-        return HCLightEntityDescription(
-            key="light_cooking_ambient_lighting",
-            entity="BSH.Common.Setting.AmbientLightEnabled",
-            brightness_entity="BSH.Common.Setting.AmbientLightBrightness",
-            color_entity="BSH.Common.Setting.AmbientLightCustomColor",
-            color_mode_entity="BSH.Common.Setting.AmbientLightColor",
-        )
-
-    if "BSH.Common.Setting.AmbientLightBrightness" in appliance.entities:
-        return HCLightEntityDescription(
-            key="light_cooking_ambient_lighting",
-            entity="BSH.Common.Setting.AmbientLightEnabled",
-            brightness_entity="BSH.Common.Setting.AmbientLightBrightness",
-        )
-
-    if "BSH.Common.Setting.AmbientLightEnabled" in appliance.entities:
-        return HCLightEntityDescription(
-            key="light_cooking_ambient_lighting",
-            entity="BSH.Common.Setting.AmbientLightEnabled",
-        )
-    return None
-
-
 COOKING_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
     "sensor": [
         HCSensorEntityDescription(
@@ -328,6 +306,8 @@ COOKING_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
             key="sensor_heatup_progress",
             entity="Cooking.Oven.Option.HeatupProgress",
             native_unit_of_measurement=PERCENTAGE,
+            min_update_interval=30,
+            significant_change=10,
         ),
         HCSensorEntityDescription(
             key="sensor_grease_filter_saturation",
@@ -471,6 +451,6 @@ COOKING_ENTITY_DESCRIPTIONS: _EntityDescriptionsDefinitionsType = {
             device_class=SwitchDeviceClass.SWITCH,
         ),
     ],
-    "light": [generate_hood_light, generate_hood_ambient_light],
+    "light": [generate_hood_light],
     "fan": [generate_hood_fan],
 }
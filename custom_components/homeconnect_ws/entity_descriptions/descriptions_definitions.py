@@ -37,6 +37,10 @@ class HCEntityDescription(EntityDescription, frozen_or_thawed=True):
     entities: list[str] | None = None
     available_access: tuple[Access] | None = None
     extra_attributes: list[ExtraAttributeDict] = None
+    min_update_interval: float | None = None
+    "Minimum time in seconds between two state writes, the last value is always written"
+    significant_change: float | None = None
+    "Change of the value, that is written regardless of min_update_interval"
 
 
 class HCSelectEntityDescription(
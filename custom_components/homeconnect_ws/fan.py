@@ -8,7 +8,6 @@ from typing import TYPE_CHECKING, Any, NamedTuple
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.util.percentage import percentage_to_ranged_value, ranged_value_to_percentage
-from homeconnect_websocket.message import Action, Message
 
 from .entity import HCEntity
 from .helpers import create_entities
@@ -82,7 +81,7 @@ class HCFan(HCEntity, FanEntity):
     @property
     def percentage(self) -> int | None:
         for speed in self._speed_mapping:
-            if self._speed_entities[speed.entity_name].value_raw == speed.entity_value:
+            if self.get_value_raw(self._speed_entities[speed.entity_name]) == speed.entity_value:
                 return ranged_value_to_percentage(self._speed_range, speed.speed)
         return 0
 
@@ -95,27 +94,15 @@ class HCFan(HCEntity, FanEntity):
                 new_speed_entity = speed.entity_name
                 new_speed_value = speed.entity_value
         if new_speed_entity or new_speed == 0:
-            data = []
-            for entity in self._speed_entities.values():
-                if entity.name == new_speed_entity:
-                    data.append({"uid": entity.uid, "value": new_speed_value})
-                else:
-                    data.append({"uid": entity.uid, "value": 0})
-            message = Message(
-                resource="/ro/values",
-                action=Action.POST,
-                data=data,
+            await self.async_set_values_raw(
+                {
+                    entity: new_speed_value if entity.name == new_speed_entity else 0
+                    for entity in self._speed_entities.values()
+                }
             )
-            await self._appliance.session.send_sync(message)
         else:
             msg = f"Speed {percentage} is invalid"
             raise ServiceValidationError(msg)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        data = [{"uid": entity.uid, "value": 0} for entity in self._speed_entities.values()]
-        message = Message(
-            resource="/ro/values",
-            action=Action.POST,
-            data=data,
-        )
-        await self._appliance.session.send_sync(message)
+        await self.async_set_values_raw(dict.fromkeys(self._speed_entities.values(), 0))
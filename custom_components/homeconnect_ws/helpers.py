@@ -4,23 +4,32 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
 from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.service import async_extract_config_entry_ids
+from homeconnect_websocket.entities import Execution
+from homeconnect_websocket.errors import HomeConnectError
 
-from custom_components.homeconnect_ws.const import DOMAIN
+from custom_components.homeconnect_ws.const import DOMAIN, PLATFORM_DESCRIPTION_TYPES, PLATFORMS
+
+from .write_queue import get_raw_value, validate_value
 
 if TYPE_CHECKING:
     import re
+    from collections.abc import Iterable, Iterator
 
+    from homeassistant.const import Platform
     from homeassistant.core import HomeAssistant, ServiceCall
     from homeconnect_websocket import HomeAppliance
-    from homeconnect_websocket.entities import Access
+    from homeconnect_websocket.entities import Access, Program
     from homeconnect_websocket.entities import Entity as HcEntity
 
     from . import HCConfigEntry, HCData
     from .entity import HCEntity
+    from .entity_descriptions import _EntityDescriptionsType
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -47,13 +56,25 @@ def create_entities(
     return entities
 
 
+def get_platforms(available_entity_descriptions: _EntityDescriptionsType) -> list[Platform]:
+    """Get the platforms with at least one Entity description."""
+    return [
+        platform
+        for platform in PLATFORMS
+        if any(
+            available_entity_descriptions.get(description_type)
+            for description_type in PLATFORM_DESCRIPTION_TYPES[platform]
+        )
+    ]
+
+
 def merge_dicts(*args: dict[str, list]) -> dict[str, list]:
     """Merge multiple dictionaries of type dict[str, list]."""
     out_dict: dict[str, list] = {}
     for in_dict in args:
         for key, value in in_dict.items():
             if key not in out_dict:
-                out_dict[key] = value
+                out_dict[key] = list(value)
             else:
                 out_dict[key].extend(value)
     return out_dict
@@ -85,6 +106,134 @@ def get_groups_from_regex(appliance: HomeAppliance, pattern: re.Pattern) -> set[
     return groups
 
 
+class EntityTrie:
+    """
+    Index of HC entity names by their dot separated segments.
+
+    Children are kept in the order of the entity names.
+    """
+
+    __slots__ = ("children", "name")
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self.children: dict[str, EntityTrie] = {}
+        self.name: str | None = None
+        "Full HC entity name, if an entity ends at this node"
+        for name in names:
+            node = self
+            for segment in name.split("."):
+                child = node.children.get(segment)
+                if child is None:
+                    child = node.children[segment] = EntityTrie()
+                node = child
+            node.name = name
+
+    def get_node(self, prefix: str) -> EntityTrie | None:
+        """Get the node of a prefix, e.g. `Cooking.Hob.Status.Zone`."""
+        node = self
+        for segment in prefix.split("."):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def get_children(self, prefix: str) -> list[str]:
+        """Get the segments directly below a prefix."""
+        node = self.get_node(prefix)
+        return list(node.children) if node else []
+
+    def get_numeric_groups(self, prefix: str) -> list[str]:
+        """Get the numeric segments below a prefix, which have HC entities below them."""
+        node = self.get_node(prefix)
+        if node is None:
+            return []
+        return [
+            segment
+            for segment, child in node.children.items()
+            if segment.isdigit() and child.children
+        ]
+
+    def get_entities(self, prefix: str) -> list[str]:
+        """Get all HC entity names at or below a prefix."""
+        node = self.get_node(prefix)
+        return list(node) if node else []
+
+    def __iter__(self) -> Iterator[str]:
+        if self.name is not None:
+            yield self.name
+        for child in self.children.values():
+            yield from child
+
+
+_ENTITY_TRIES: WeakKeyDictionary[HomeAppliance, EntityTrie] = WeakKeyDictionary()
+
+
+def get_entity_trie(appliance: HomeAppliance) -> EntityTrie:
+    """Get the EntityTrie of an appliance, built on first use."""
+    trie = _ENTITY_TRIES.get(appliance)
+    if trie is None:
+        trie = _ENTITY_TRIES[appliance] = EntityTrie(appliance.entities)
+    return trie
+
+
+_PROGRAM_OPTIONS: WeakKeyDictionary[Program, dict[str, HcEntity]] = WeakKeyDictionary()
+
+
+def get_program_options(program: Program) -> dict[str, HcEntity]:
+    """Get the options of a program by name, built on first use."""
+    options = _PROGRAM_OPTIONS.get(program)
+    if options is None:
+        options = _PROGRAM_OPTIONS[program] = {
+            option.name: option
+            for option in program._options  # noqa: SLF001
+        }
+    return options
+
+
+def get_program(appliance: HomeAppliance, key: str) -> Program:
+    """Get a program that can be started by its HC key."""
+    if (program := appliance.programs.get(key)) is None:
+        msg = f"Unknown Program {key}"
+        raise ServiceValidationError(msg)
+    if program.execution == Execution.SELECT_ONLY:
+        msg = f"Program {key} can't be started"
+        raise ServiceValidationError(msg)
+    if program.available is False:
+        msg = f"Program {key} is not available"
+        raise ServiceValidationError(msg)
+    return program
+
+
+def get_program_option_values(
+    program: Program, options: dict[str, Any], *, selected: bool
+) -> dict[int, Any]:
+    """
+    Validate option values against the options of a program, return the raw values by uid.
+
+    Access and range of options follow the `selected` program, options of another program are
+    only checked against its option list and their enums.
+    """
+    program_options = get_program_options(program)
+    values = {}
+    errors = []
+    for key, value in options.items():
+        if (option := program_options.get(key)) is None:
+            errors.append(f"{key}: not an option of {program.name}")
+            continue
+        try:
+            if selected:
+                # Sent with the start message, the option doesn't have to be available yet
+                values[option.uid] = validate_value(option, value, check_available=False)
+            else:
+                values[option.uid] = get_raw_value(option, value)
+        except (HomeConnectError, TypeError, ValueError) as ex:
+            errors.append(f"{key}: {ex}")
+    if errors:
+        msg = f"Invalid options: {', '.join(errors)}"
+        raise ServiceValidationError(msg)
+    return values
+
+
 async def get_config_entry_from_call(
     hass: HomeAssistant, service_call: ServiceCall
 ) -> HCConfigEntry | None:
@@ -98,6 +247,24 @@ async def get_config_entry_from_call(
     raise ServiceValidationError(msg)
 
 
+def get_hc_entity(hass: HomeAssistant, config_entry: HCConfigEntry, key: str) -> HcEntity:
+    """Get an HC entity by its HC key or the entity id of an entity of the config entry."""
+    appliance = config_entry.runtime_data.appliance
+    if key in appliance.entities:
+        return appliance.entities[key]
+    registry_entry = er.async_get(hass).async_get(key)
+    if registry_entry is None or registry_entry.config_entry_id != config_entry.entry_id:
+        msg = f"Unknown HC key or entity id {key}"
+        raise ServiceValidationError(msg)
+    description_key = registry_entry.unique_id.removeprefix(f"{appliance.info['deviceID']}-")
+    for descriptions in config_entry.runtime_data.available_entity_descriptions.values():
+        for description in descriptions:
+            if description.key == description_key and description.entity:
+                return appliance.entities[description.entity]
+    msg = f"{key} has no HC entity"
+    raise ServiceValidationError(msg)
+
+
 def entity_is_available(entity: HcEntity, available_access: tuple[Access]) -> bool:
     """Check is HC entity is available."""
     available = True
@@ -0,0 +1,133 @@
+"""Apply host changes of a loaded config entry without reloading it."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientConnectionError
+from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+
+from .address_cache import async_get_address_cache, get_peer_address
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import HomeAppliance
+
+_LOGGER = logging.getLogger(__name__)
+
+HOST_UPDATE_COOLDOWN = 60
+
+
+def set_appliance_host(appliance: HomeAppliance, host: str) -> None:
+    """Set the host the session connects to on its next (re)connect."""
+    session = appliance.session
+    socket = session._socket  # noqa: SLF001
+    session._host = host  # noqa: SLF001
+    socket._url = socket._URL_FORMAT.format(host=f"[{host}]" if ":" in host else host)  # noqa: SLF001
+
+
+@callback
+def async_route_connects(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    appliance: HomeAppliance,
+    host_updater: HCHostUpdater | None = None,
+) -> None:
+    """
+    Connect the session by the cached address of the host of the config entry.
+
+    The session reconnects on its own, so the address is looked up on every connect: expired
+    addresses and host changes apply to reconnects too. A failed connect invalidates the cached
+    address, the next attempt connects by the host name to resolve it again. A host change
+    received by the host updater while connected is applied before connecting.
+    """
+    socket = appliance.session._socket  # noqa: SLF001
+    connect = socket.connect
+    address_cache = async_get_address_cache(hass)
+
+    async def routed_connect() -> None:
+        if host_updater is not None:
+            host_updater.async_apply_pending()
+        host = config_entry.data[CONF_HOST]
+        set_appliance_host(appliance, address_cache.async_get(host) or host)
+        try:
+            await connect()
+        except (TimeoutError, ClientConnectionError):
+            address_cache.async_invalidate(host)
+            raise
+        if peer_address := get_peer_address(socket):
+            address_cache.async_set(host, peer_address)
+
+    socket.connect = routed_connect
+
+
+class HCHostUpdater:
+    """
+    Apply host changes discovered by zeroconf to a loaded config entry.
+
+    Changes are debounced by `HOST_UPDATE_COOLDOWN`, only the last host is applied. The new host
+    is saved in the config entry and used for the next reconnect of the session. While the
+    session is connected the change is kept pending, until the session reconnects, see
+    `async_route_connects`.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, appliance: HomeAppliance
+    ) -> None:
+        self._hass = hass
+        self._config_entry = config_entry
+        self._appliance = appliance
+        self._host: str | None = None
+        self._pending_host: str | None = None
+        self._debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=HOST_UPDATE_COOLDOWN,
+            immediate=False,
+            function=self._async_apply,
+        )
+
+    @callback
+    def async_update(self, host: str) -> None:
+        """Schedule a host change."""
+        self._host = host
+        self._debouncer.async_schedule_call()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel a scheduled host change."""
+        self._debouncer.async_shutdown()
+
+    @callback
+    def async_apply_pending(self) -> None:
+        """Apply the host change received while connected, before the session reconnects."""
+        if self._pending_host is not None:
+            self._async_set_host(self._pending_host)
+
+    @callback
+    def _async_apply(self) -> None:
+        host, self._host = self._host, None
+        if host is None:
+            return
+        if self._appliance.session.connected and host != self._config_entry.data[CONF_HOST]:
+            _LOGGER.debug(
+                "Connected to %s, setting host %s on reconnect", self._config_entry.title, host
+            )
+            self._pending_host = host
+            return
+        self._async_set_host(host)
+
+    @callback
+    def _async_set_host(self, host: str) -> None:
+        self._pending_host = None
+        if host == self._config_entry.data[CONF_HOST]:
+            return
+        _LOGGER.debug("Setting host of %s to %s", self._config_entry.title, host)
+        set_appliance_host(self._appliance, host)
+        self._hass.config_entries.async_update_entry(
+            self._config_entry, data={**self._config_entry.data, CONF_HOST: host}
+        )
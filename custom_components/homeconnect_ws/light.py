@@ -20,8 +20,6 @@ from homeassistant.util.color import (
     value_to_brightness,
 )
 from homeassistant.util.scaling import scale_ranged_value_to_int_range
-from homeconnect_websocket.message import Action
-from homeconnect_websocket.message import Message as HC_Message
 
 from .entity import HCEntity
 from .helpers import create_entities, entity_is_available
@@ -117,15 +115,15 @@ class HCLight(HCEntity, LightEntity):
 
     @property
     def is_on(self) -> bool | None:
-        return bool(self._entity.value)
+        return bool(self.get_value())
 
     @property
     def brightness(self) -> int | None:
         if self._color_entity is not None:
-            rgb = rgb_hex_to_rgb_list(self._color_entity.value.strip("#"))
+            rgb = rgb_hex_to_rgb_list(self.get_value(self._color_entity).strip("#"))
             return max(rgb)
         if self._brightness_entity is not None:
-            return value_to_brightness((1, 100), self._brightness_entity.value)
+            return value_to_brightness((1, 100), self.get_value(self._brightness_entity))
         return None
 
     @property
@@ -134,40 +132,31 @@ class HCLight(HCEntity, LightEntity):
             return scale_ranged_value_to_int_range(
                 (1, 100),
                 (DEFAULT_MIN_KELVIN + 1, DEFAULT_MAX_KELVIN),
-                self._color_temperature_entity.value,
+                self.get_value(self._color_temperature_entity),
             )
         return None
 
     @property
     def rgb_color(self) -> tuple[int, int, int] | None:
         if self._color_entity is not None:
-            rgb = rgb_hex_to_rgb_list(self._color_entity.value.strip("#"))
+            rgb = rgb_hex_to_rgb_list(self.get_value(self._color_entity).strip("#"))
             return match_max_scale((255,), rgb)
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        message = HC_Message(
-            resource="/ro/values",
-            action=Action.POST,
-            data=[],
-        )
+        values: dict[HcEntity, Any] = {}
         brightness = kwargs.get(ATTR_BRIGHTNESS, self.brightness)
         rgb = kwargs.get(ATTR_RGB_COLOR, self.rgb_color)
 
         if self._attr_color_mode == ColorMode.RGB:
             rgb_with_brightness = tuple(color * brightness // 255 for color in rgb)
-            message.data.append(
-                {
-                    "uid": self._color_entity.uid,
-                    "value": "#" + color_rgb_to_hex(*rgb_with_brightness),
-                }
-            )
+            values[self._color_entity] = "#" + color_rgb_to_hex(*rgb_with_brightness)
             if (
                 self._color_mode_entity is not None
-                and self._color_mode_entity.value != "CustomColor"
+                and self.get_value(self._color_mode_entity) != "CustomColor"
             ):
                 color_mode_value = self._color_mode_entity._rev_enumeration["CustomColor"]  # noqa: SLF001
-                message.data.append({"uid": self._color_mode_entity.uid, "value": color_mode_value})
+                values[self._color_mode_entity] = color_mode_value
 
         elif (
             self._attr_color_mode in (ColorMode.BRIGHTNESS, ColorMode.COLOR_TEMP)
@@ -179,7 +168,7 @@ class HCLight(HCEntity, LightEntity):
                     self._brightness_entity.min,
                 )
             )
-            message.data.append({"uid": self._brightness_entity.uid, "value": value_in_range})
+            values[self._brightness_entity] = value_in_range
 
         if ATTR_COLOR_TEMP_KELVIN in kwargs:
             value_in_range = int(
@@ -189,13 +178,11 @@ class HCLight(HCEntity, LightEntity):
                     kwargs[ATTR_COLOR_TEMP_KELVIN],
                 )
             )
-            message.data.append(
-                {"uid": self._color_temperature_entity.uid, "value": value_in_range}
-            )
+            values[self._color_temperature_entity] = value_in_range
 
-        if self._entity.value is not True:
-            message.data.append({"uid": self._entity.uid, "value": True})
-        await self._appliance.session.send_sync(message)
+        if self.get_value() is not True:
+            values[self._entity] = True
+        await self.async_set_values_raw(values)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
-        await self._entity.set_value(False)
+        await self.async_set_value(value=False)
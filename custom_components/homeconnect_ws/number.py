@@ -53,7 +53,7 @@ class HCNumber(HCEntity, NumberEntity):
 
     @property
     def native_value(self) -> int | float:
-        return self._entity.value
+        return self.get_value()
 
     async def async_set_native_value(self, value: float) -> None:
-        await self._entity.set_value(int(value))
+        await self.async_set_value_debounced(int(value))
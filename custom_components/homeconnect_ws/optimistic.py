@@ -0,0 +1,197 @@
+"""Optimistic state of written HC entities and the latency of their confirmation."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+    from homeconnect_websocket.entities import Entity as HcEntity
+
+    from .dispatcher import HCDispatcher
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIRM_TIMEOUT = 5
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5)
+
+
+def _latency_histogram() -> dict[str, int]:
+    return {f"<={bucket}s": 0 for bucket in LATENCY_BUCKETS}
+
+
+@dataclass
+class ConfirmationStats:
+    """Counters for the confirmation of written values."""
+
+    confirmed: int = 0
+    "Writes confirmed by an update of the HC entity"
+    timeouts: int = 0
+    "Writes not confirmed within the timeout"
+    failed: int = 0
+    "Writes rejected by the appliance or failed to send"
+    rollbacks: int = 0
+    "Optimistic states rolled back"
+    latency: dict[str, int] = field(default_factory=_latency_histogram)
+    "Histogram of the time between write and confirmation"
+
+
+@dataclass
+class _PendingWrite:
+    value: Any
+    start: float
+    cancel_timeout: CALLBACK_TYPE | None = None
+
+
+class HCOptimisticState:
+    """
+    Track written values until the appliance confirms them.
+
+    The first update of a written HC entity confirms the write, the time until then is recorded
+    in a latency histogram. Writes not confirmed within `timeout` expire. If `enabled`, the
+    written value is shown by `get_value` until it's confirmed, and rolled back to the value of
+    the HC entity when the write fails or expires. The HC entities themselves aren't changed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        dispatcher: HCDispatcher,
+        *,
+        enabled: bool = False,
+        timeout: float = CONFIRM_TIMEOUT,
+    ) -> None:
+        self._hass = hass
+        self._dispatcher = dispatcher
+        self._enabled = enabled
+        self._timeout = timeout
+        self._pending: dict[HcEntity, _PendingWrite] = {}
+        self._registered: set[HcEntity] = set()
+        self.stats = ConfirmationStats()
+
+    @callback
+    def async_start(self, values: dict[HcEntity, Any]) -> None:
+        """Track written raw values, showing them if enabled."""
+        changed = []
+        for entity, value in values.items():
+            pending = self._get_pending(entity)
+            if pending is None and value == entity.value_raw:
+                continue
+            if pending is not None:
+                if value == pending.value:
+                    continue
+                self._pop(entity)
+            if entity not in self._registered:
+                self._registered.add(entity)
+                entity.register_callback(self._async_hc_update)
+            self._pending[entity] = pending = _PendingWrite(value, self._hass.loop.time())
+            if self._enabled:
+                pending.cancel_timeout = async_call_later(
+                    self._hass, self._timeout, partial(self._async_timeout, entity)
+                )
+                changed.append(entity)
+        if changed:
+            self._dispatcher.async_update_entities(changed)
+
+    @callback
+    def async_fail(self, values: dict[HcEntity, Any], error: Exception) -> None:
+        """Stop tracking values that failed to write, rolling back their optimistic state."""
+        for entity in values:
+            if (pending := self._pop(entity)) is None:
+                continue
+            self.stats.failed += 1
+            self._async_rollback(
+                entity, pending, f"write failed: {str(error) or type(error).__name__}"
+            )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop tracking all values."""
+        for entity in list(self._pending):
+            self._pop(entity)
+        for entity in self._registered:
+            entity.unregister_callback(self._async_hc_update)
+        self._registered.clear()
+
+    def get_value(self, entity: HcEntity) -> Any:
+        """Get the value of an HC entity, the written value while it's shown optimistically."""
+        if not self._enabled or (pending := self._pending.get(entity)) is None:
+            return entity.value
+        if entity.enum and pending.value is not None:
+            return entity.enum.get(pending.value, pending.value)
+        return pending.value
+
+    def get_value_raw(self, entity: HcEntity) -> Any:
+        """Get the raw value of an HC entity, the written value while it's shown optimistically."""
+        if not self._enabled or (pending := self._pending.get(entity)) is None:
+            return entity.value_raw
+        return pending.value
+
+    def get_known_value(self, entity: HcEntity) -> Any:
+        """Get the raw value last written to an HC entity while it's unconfirmed, else its value."""
+        pending = self._get_pending(entity)
+        return entity.value_raw if pending is None else pending.value
+
+    def dump(self) -> dict:
+        """Dump confirmation statistics."""
+        return asdict(self.stats)
+
+    def _get_pending(self, entity: HcEntity) -> _PendingWrite | None:
+        pending = self._pending.get(entity)
+        if (
+            pending is not None
+            and pending.cancel_timeout is None
+            and self._hass.loop.time() - pending.start > self._timeout
+        ):
+            # Writes without a timeout timer expire on lookup
+            self._pending.pop(entity)
+            self.stats.timeouts += 1
+            return None
+        return pending
+
+    def _pop(self, entity: HcEntity) -> _PendingWrite | None:
+        pending = self._pending.pop(entity, None)
+        if pending is not None and pending.cancel_timeout is not None:
+            pending.cancel_timeout()
+        return pending
+
+    async def _async_hc_update(self, entity: HcEntity) -> None:
+        """Confirm the write on the first update of the HC entity."""
+        if self._get_pending(entity) is None:
+            return
+        pending = self._pop(entity)
+        latency = self._hass.loop.time() - pending.start
+        self.stats.confirmed += 1
+        for bucket in LATENCY_BUCKETS:
+            if latency <= bucket:
+                self.stats.latency[f"<={bucket}s"] += 1
+                break
+        if entity.value_raw != pending.value:
+            _LOGGER.debug(
+                "%s confirmed %s instead of %s", entity.name, entity.value_raw, pending.value
+            )
+
+    @callback
+    def _async_timeout(self, entity: HcEntity, _: datetime) -> None:
+        if (pending := self._pending.pop(entity, None)) is None:
+            return
+        self.stats.timeouts += 1
+        self._async_rollback(entity, pending, f"not confirmed within {self._timeout}s")
+
+    @callback
+    def _async_rollback(self, entity: HcEntity, pending: _PendingWrite, reason: str) -> None:
+        """Show the value of the HC entity again instead of the written value."""
+        if not self._enabled:
+            return
+        if entity.value_raw != pending.value:
+            _LOGGER.warning("Rolling back %s to %s, %s", entity.name, entity.value, reason)
+            self.stats.rollbacks += 1
+        self._dispatcher.async_update_entities([entity])
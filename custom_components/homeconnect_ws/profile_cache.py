@@ -0,0 +1,117 @@
+"""Persistent cache of parsed profile files."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import DeviceDescription
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.profiles"
+SAVE_DELAY = 10
+MAX_PROFILES = 10
+
+
+def profile_key(description_file: bytes, feature_file: bytes) -> str:
+    """Get the cache key of a DeviceDescription/FeatureMapping file pair."""
+    return hashlib.sha256(
+        hashlib.sha256(description_file).digest() + hashlib.sha256(feature_file).digest()
+    ).hexdigest()
+
+
+def _parser_version() -> str:
+    return version("homeconnect-websocket")
+
+
+class HCProfileCache:
+    """
+    Cache of parsed device descriptions, shared by all config flows.
+
+    Profiles are keyed by the hash of their DeviceDescription and FeatureMapping files.
+    At most `MAX_PROFILES` profiles are cached, the least recently used profile is evicted
+    first. The cache is invalidated when the version of the parser changes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._version: str | None = None
+        self._profiles: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the cache."""
+        self._version = await self._hass.async_add_executor_job(_parser_version)
+        data = await self._store.async_load()
+        if data is None:
+            return
+        if data.get("parser_version") != self._version:
+            _LOGGER.debug("Cached profiles are outdated")
+            self._async_schedule_save()
+            return
+        self._profiles = data["profiles"]
+
+    @callback
+    def async_get(self, key: str, appliance_id: str) -> DeviceDescription | None:
+        """Get a cached device description and mark it as used by the appliance."""
+        profile = self._profiles.pop(key, None)
+        if profile is None:
+            return None
+        self._profiles[key] = profile
+        if appliance_id not in profile["appliances"]:
+            profile["appliances"].append(appliance_id)
+        self._async_schedule_save()
+        return profile["description"]
+
+    @callback
+    def async_set(self, key: str, appliance_id: str, description: DeviceDescription) -> None:
+        """Add a parsed device description used by the appliance."""
+        profile = self._profiles.pop(key, None)
+        appliances = profile["appliances"] if profile else []
+        if appliance_id not in appliances:
+            appliances.append(appliance_id)
+        self._profiles[key] = {"appliances": appliances, "description": description}
+        while len(self._profiles) > MAX_PROFILES:
+            del self._profiles[next(iter(self._profiles))]
+        self._async_schedule_save()
+
+    @callback
+    def async_remove_appliance(self, appliance_id: str) -> None:
+        """Remove the appliance and profiles not used by other appliances."""
+        changed = False
+        for key, profile in list(self._profiles.items()):
+            if appliance_id in profile["appliances"]:
+                profile["appliances"].remove(appliance_id)
+                if not profile["appliances"]:
+                    del self._profiles[key]
+                changed = True
+        if changed:
+            self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"parser_version": self._version, "profiles": self._profiles}
+
+
+@singleton(f"{DOMAIN}_profile_cache")
+async def async_get_profile_cache(hass: HomeAssistant) -> HCProfileCache:
+    """Get the loaded profile cache."""
+    cache = HCProfileCache(hass)
+    await cache.async_load()
+    return cache
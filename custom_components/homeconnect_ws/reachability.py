@@ -0,0 +1,44 @@
+"""Cheap reachability probe of appliances, used before retrying a full connect."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+
+_LOGGER = logging.getLogger(__name__)
+
+PROBE_TIMEOUT = 2
+TLS_PORT = 443
+AES_PORT = 80
+
+
+@dataclass
+class HCConnectStats:
+    """Connection attempts of a config entry."""
+
+    attempted: int = 0
+    """Full connects attempted"""
+    skipped: int = 0
+    """Full connects skipped, because the appliance wasn't reachable"""
+    probe: bool = False
+    """Probe before the next connect, set when the last connect failed"""
+
+
+async def async_probe(host: str, port: int, timeout: float = PROBE_TIMEOUT) -> bool:  # noqa: ASYNC109
+    """
+    Check if the appliance accepts TCP connections.
+
+    Fails fast when an appliance is switched off or its mDNS host name can't be resolved.
+    """
+    try:
+        async with asyncio.timeout(timeout):
+            _, writer = await asyncio.open_connection(host, port)
+    except (TimeoutError, OSError) as ex:
+        _LOGGER.debug("%s:%s not reachable: %s", host, port, ex)
+        return False
+    writer.close()
+    with contextlib.suppress(OSError):
+        await writer.wait_closed()
+    return True
@@ -0,0 +1,124 @@
+"""Hand off the validated socket of the config flow to the first setup of the entry."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.hass_dict import HassKey
+
+from .const import CONF_AES_IV, CONF_PSK, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from typing import Any
+
+    from homeassistant.core import Event, HomeAssistant
+    from homeconnect_websocket import HomeAppliance
+    from homeconnect_websocket.hc_socket import HCSocket
+
+_LOGGER = logging.getLogger(__name__)
+
+# Shorter than the websocket heartbeat, unanswered pings would close the socket
+HANDOFF_TTL = 10
+
+
+@dataclass
+class _Handoff:
+    socket: HCSocket
+    fingerprint: tuple[Any, ...]
+    cancel_expire: Callable[[], None]
+
+
+HANDOFF_KEY: HassKey[dict[str, _Handoff]] = HassKey(f"{DOMAIN}_socket_handoff")
+
+
+def _fingerprint(data: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Get the connection settings the socket was opened with."""
+    return tuple(data.get(key) for key in (CONF_HOST, CONF_PSK, CONF_AES_IV))
+
+
+@callback
+def _async_get_handoffs(hass: HomeAssistant) -> dict[str, _Handoff]:
+    if (handoffs := hass.data.get(HANDOFF_KEY)) is None:
+        handoffs = hass.data[HANDOFF_KEY] = {}
+
+        @callback
+        def discard_all(_event: Event) -> None:
+            while handoffs:
+                _async_discard(hass, handoffs.popitem()[1])
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, discard_all)
+    return handoffs
+
+
+@callback
+def async_store_socket(
+    hass: HomeAssistant, unique_id: str, data: Mapping[str, Any], socket: HCSocket
+) -> None:
+    """Keep a connected socket for the setup of the entry, for `HANDOFF_TTL` seconds."""
+    handoffs = _async_get_handoffs(hass)
+    if previous := handoffs.pop(unique_id, None):
+        _async_discard(hass, previous)
+
+    @callback
+    def expire(_now: Any) -> None:
+        if handoffs.get(unique_id) is handoff:
+            _LOGGER.debug("Socket of %s expired", unique_id)
+            del handoffs[unique_id]
+            _async_discard(hass, handoff)
+
+    handoff = _Handoff(socket, _fingerprint(data), lambda: None)
+    handoff.cancel_expire = async_call_later(hass, HANDOFF_TTL, expire)
+    handoffs[unique_id] = handoff
+
+
+@callback
+def async_pop_socket(
+    hass: HomeAssistant, unique_id: str | None, data: Mapping[str, Any]
+) -> HCSocket | None:
+    """Get the connected socket of an appliance, if opened with the same settings."""
+    handoffs = hass.data.get(HANDOFF_KEY, {})
+    if unique_id is None or (handoff := handoffs.pop(unique_id, None)) is None:
+        return None
+    if handoff.fingerprint != _fingerprint(data) or handoff.socket.closed:
+        _LOGGER.debug("Socket of %s can't be used", unique_id)
+        _async_discard(hass, handoff)
+        return None
+    handoff.cancel_expire()
+    return handoff.socket
+
+
+@callback
+def _async_discard(hass: HomeAssistant, handoff: _Handoff) -> None:
+    handoff.cancel_expire()
+    hass.async_create_task(handoff.socket.close(), f"{DOMAIN} close socket")
+
+
+async def async_adopt_socket(appliance: HomeAppliance, socket: HCSocket) -> None:
+    """
+    Use a connected socket for the next connect of the appliance.
+
+    The appliance sends its initial message when the socket is opened, it's buffered until
+    the session starts receiving, so the session handshake runs as on a new connection.
+    """
+    session = appliance.session
+    await session._socket.close()  # noqa: SLF001 Close the unused session of the replaced socket
+
+    reconnect = socket.connect
+    adopted = True
+
+    async def connect() -> None:
+        nonlocal adopted
+        # Already connected, reconnects open a new connection
+        if adopted:
+            adopted = False
+            return
+        await reconnect()
+
+    socket.connect = connect
+    session._socket = socket  # noqa: SLF001
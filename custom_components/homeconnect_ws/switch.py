@@ -48,21 +48,21 @@ class HCSwitch(HCEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         if self._value_mapping:
-            if self._value_mapping[0] == self._entity.value:
+            if self._value_mapping[0] == self.get_value():
                 return True
-            if self._value_mapping[1] == self._entity.value:
+            if self._value_mapping[1] == self.get_value():
                 return False
             return None
-        return bool(self._entity.value)
+        return bool(self.get_value())
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         if self._value_mapping:
-            await self._entity.set_value(self._value_mapping[0])
+            await self.async_set_value(self._value_mapping[0])
         else:
-            await self._entity.set_value(True)
+            await self.async_set_value(value=True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         if self._value_mapping:
-            await self._entity.set_value(self._value_mapping[1])
+            await self.async_set_value(self._value_mapping[1])
         else:
-            await self._entity.set_value(False)
+            await self.async_set_value(value=False)
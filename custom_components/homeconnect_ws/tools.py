@@ -0,0 +1,195 @@
+"""
+Offline compatibility check of profile files.
+
+Parses the appliances of all profile files in a directory in parallel and matches them against
+the Entity descriptions, without starting Home Assistant:
+
+    python -m custom_components.homeconnect_ws.tools <directory with profile zip files>
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from homeconnect_websocket import ParserError, parse_device_description
+from homeconnect_websocket.testutils import MockAppliance
+
+from .config_flow import process_zip_file, read_description_files
+from .entity_descriptions import get_available_entities, get_namespaces, load_description_modules
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from homeconnect_websocket import DeviceDescription
+
+    from .entity_descriptions import _EntityDescriptionsType
+
+
+@dataclasses.dataclass
+class ApplianceReport:
+    """Compatibility of one appliance."""
+
+    appliance_id: str
+    name: str
+    profile_file: str
+    hc_entities: int = 0
+    "Number of HC entities"
+    entities: dict[str, int] = dataclasses.field(default_factory=dict)
+    "Number of available Entity descriptions by description type"
+    unmatched: list[str] = dataclasses.field(default_factory=list)
+    "HC entities not used by any available Entity description"
+    parse_time: float = 0.0
+    "Time to parse the device description in s"
+    match_time: float = 0.0
+    "Time to get the available Entity descriptions in s"
+    error: str | None = None
+
+
+def parse_timed(
+    description_file: bytes, feature_file: bytes
+) -> tuple[DeviceDescription | None, float, str | None]:
+    """Parse a device description, return the description, the parse time and the error."""
+    start = time.perf_counter()
+    try:
+        description = parse_device_description(description_file, feature_file)
+    except ParserError as ex:
+        return None, time.perf_counter() - start, str(ex)
+    return description, time.perf_counter() - start, None
+
+
+def parse_profiles(
+    files: dict[str, tuple[bytes, bytes]], workers: int | None = None
+) -> dict[str, tuple[DeviceDescription | None, float, str | None]]:
+    """Parse device descriptions in parallel in a process pool."""
+    if not files:
+        return {}
+    with ProcessPoolExecutor(
+        max_workers=workers or min(len(files), os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        results = executor.map(
+            parse_timed,
+            [description_file for description_file, _ in files.values()],
+            [feature_file for _, feature_file in files.values()],
+        )
+        return dict(zip(files, results, strict=True))
+
+
+def get_used_entities(available_entities: _EntityDescriptionsType) -> set[str]:
+    """Get the HC entities used by Entity descriptions."""
+    used = set()
+    for descriptions in available_entities.values():
+        for description in descriptions:
+            for field in dataclasses.fields(description):
+                value = getattr(description, field.name)
+                if field.name == "entities" and value:
+                    used.update(value)
+                elif field.name.endswith("entity") and isinstance(value, str):
+                    used.add(value)
+    return used
+
+
+def check_appliance(report: ApplianceReport, description: DeviceDescription) -> None:
+    """Match the Entity descriptions against an appliance."""
+    appliance = MockAppliance(description, "localhost", "tools", "tools", "")
+    load_description_modules(get_namespaces(appliance))
+    start = time.perf_counter()
+    available_entities = get_available_entities(appliance)
+    report.match_time = time.perf_counter() - start
+    report.hc_entities = len(appliance.entities)
+    report.entities = {
+        description_type: len(descriptions)
+        for description_type, descriptions in available_entities.items()
+        if descriptions
+    }
+    report.unmatched = sorted(set(appliance.entities) - get_used_entities(available_entities))
+
+
+def check_profiles(directory: Path, workers: int | None = None) -> list[ApplianceReport]:
+    """Check the appliances of all profile files in a directory."""
+    appliances: dict[str, dict[str, Any]] = {}
+    reports: dict[str, ApplianceReport] = {}
+    for path in sorted(directory.glob("*.zip")):
+        for appliance_id, appliance in process_zip_file(path).items():
+            info = appliance["info"]
+            appliances[appliance_id] = appliance
+            reports[appliance_id] = ApplianceReport(
+                appliance_id, f"{info['brand']} {info['type']} {info['vib']}", path.name
+            )
+
+    files = read_description_files(appliances)
+    # Appliances of the same model share their profile, parse it only once
+    results = parse_profiles(
+        {
+            key: (description_file, feature_file)
+            for key, description_file, feature_file in files.values()
+        },
+        workers,
+    )
+    for appliance_id, (key, _, _) in files.items():
+        report = reports[appliance_id]
+        description, report.parse_time, report.error = results[key]
+        if description is None:
+            continue
+        try:
+            check_appliance(report, description)
+        except Exception as ex:  # noqa: BLE001
+            report.error = f"{type(ex).__name__}: {ex}"
+    return list(reports.values())
+
+
+def print_reports(reports: Sequence[ApplianceReport], elapsed: float) -> None:
+    """Print the reports."""
+    print(  # noqa: T201
+        f"{'appliance':<40} {'HC entities':>11} {'entities':>8} {'unmatched':>9} "
+        f"{'parse (ms)':>10} {'match (ms)':>10}"
+    )
+    for report in reports:
+        if report.error:
+            print(f"{report.name:<40} error: {report.error}")  # noqa: T201
+            continue
+        print(  # noqa: T201
+            f"{report.name:<40} {report.hc_entities:>11} {sum(report.entities.values()):>8} "
+            f"{len(report.unmatched):>9} {report.parse_time * 1000:>10.1f} "
+            f"{report.match_time * 1000:>10.1f}"
+        )
+        print(  # noqa: T201
+            "    "
+            + ", ".join(
+                f"{description_type}: {n}" for description_type, n in report.entities.items()
+            )
+        )
+        for name in report.unmatched:
+            print(f"    unmatched {name}")  # noqa: T201
+    print(  # noqa: T201
+        f"{len(reports)} appliances, {sum(report.error is not None for report in reports)} "
+        f"with errors, {elapsed:.2f} s"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the compatibility check."""
+    parser = argparse.ArgumentParser(
+        prog="python -m custom_components.homeconnect_ws.tools",
+        description="Check the compatibility of profile files with the integration.",
+    )
+    parser.add_argument("directory", type=Path, help="directory with profile zip files")
+    parser.add_argument("--workers", type=int, help="number of parser processes")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    reports = check_profiles(args.directory, args.workers)
+    print_reports(reports, time.perf_counter() - start)
+    return 1 if any(report.error for report in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+"""Coalesce concurrent writes to an appliance into a single message."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeconnect_websocket.entities import Access
+from homeconnect_websocket.errors import AccessError
+from homeconnect_websocket.message import Action, Message
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket import HomeAppliance
+    from homeconnect_websocket.entities import Entity as HcEntity
+
+    from .optimistic import HCOptimisticState
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_WRITE_WINDOW = 5
+"""Default write window in ms"""
+SLIDER_DEBOUNCE = 0.3
+"""Time in seconds without a new value after which a slider value is written"""
+
+
+def get_raw_value(entity: HcEntity, value: Any) -> Any:
+    """Get the raw value to write, resolving the values of Enum entities like `Entity.set_value`."""
+    if entity.enum:
+        rev_enumeration = entity._rev_enumeration  # noqa: SLF001
+        if value not in rev_enumeration:
+            msg = "Value not in Enum"
+            raise ValueError(msg)
+        value = rev_enumeration[value]
+    return entity._type(value)  # noqa: SLF001
+
+
+def check_writable(entity: HcEntity, *, check_available: bool = True) -> None:
+    """Raise an `AccessError` if the entity can't be written, like `Entity.set_value_raw`."""
+    if hasattr(entity, "access") and entity.access not in (Access.READ_WRITE, Access.WRITE_ONLY):
+        msg = "Not Writable"
+        raise AccessError(msg)
+    if check_available and hasattr(entity, "available") and not entity.available:
+        msg = "Not Available"
+        raise AccessError(msg)
+
+
+def validate_value(entity: HcEntity, value: Any, *, check_available: bool = True) -> Any:
+    """Validate a value against the access, enum and range of an entity, return the raw value."""
+    check_writable(entity, check_available=check_available)
+    try:
+        value_raw = get_raw_value(entity, value)
+    except TypeError as ex:
+        raise ValueError(str(ex)) from ex
+    if isinstance(value_raw, int | float) and not isinstance(value_raw, bool):
+        if getattr(entity, "min", None) is not None and value_raw < entity.min:
+            msg = f"Value {value} below minimum {entity.min}"
+            raise ValueError(msg)
+        if getattr(entity, "max", None) is not None and value_raw > entity.max:
+            msg = f"Value {value} above maximum {entity.max}"
+            raise ValueError(msg)
+    return value_raw
+
+
+class _Batch:
+    """Values collected during one write window."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.values: dict[int, tuple[HcEntity, Any]] = {}
+        self.as_list = False
+        self.done: asyncio.Future[None] = hass.loop.create_future()
+
+
+class HCWriteQueue:
+    """
+    Write queue of an appliance.
+
+    Values written within `window` ms of the first write are sent as one `/ro/values` POST,
+    the last value of an entity wins. Every caller awaits the response of that message and
+    gets its error. A window of 0 writes every value immediately. Written values are tracked
+    by `optimistic` until the appliance confirms them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        appliance: HomeAppliance,
+        window: float,
+        optimistic: HCOptimisticState | None = None,
+    ) -> None:
+        self._hass = hass
+        self._appliance = appliance
+        self._window = window / 1000
+        self._optimistic = optimistic
+        self._batch: _Batch | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    async def async_set_value(self, entity: HcEntity, value: Any) -> None:
+        """Set the value of an entity, resolving the values of Enum entities."""
+        check_writable(entity)
+        await self._async_set_values_raw({entity: get_raw_value(entity, value)}, as_list=False)
+
+    async def async_set_values_raw(self, values: dict[HcEntity, Any]) -> None:
+        """
+        Set the raw values of entities, sent as a list even if it's only one value.
+
+        The values aren't checked, like raw `/ro/values` messages.
+        """
+        await self._async_set_values_raw(values, as_list=True)
+
+    async def _async_set_values_raw(self, values: dict[HcEntity, Any], *, as_list: bool) -> None:
+        if not values:
+            return
+        if self._optimistic is not None:
+            self._optimistic.async_start(values)
+        try:
+            await self._async_write(values, as_list=as_list)
+        except Exception as ex:
+            if self._optimistic is not None:
+                self._optimistic.async_fail(values, ex)
+            raise
+
+    async def _async_write(self, values: dict[HcEntity, Any], *, as_list: bool) -> None:
+        if self._window <= 0:
+            await self._async_send(values, as_list=as_list)
+            return
+        if self._batch is None:
+            self._batch = _Batch(self._hass)
+            self._flush_handle = self._hass.loop.call_later(self._window, self._async_flush)
+        batch = self._batch
+        batch.as_list |= as_list
+        for entity, value in values.items():
+            batch.values[entity.uid] = (entity, value)
+        # A cancelled caller must not cancel the write of the other callers
+        await asyncio.shield(batch.done)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel pending writes."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._batch is not None:
+            self._batch.done.cancel()
+            self._batch = None
+
+    @callback
+    def _async_flush(self) -> None:
+        batch, self._batch, self._flush_handle = self._batch, None, None
+        if batch is not None:
+            self._hass.async_create_task(self._async_send_batch(batch), eager_start=True)
+
+    async def _async_send_batch(self, batch: _Batch) -> None:
+        try:
+            await self._async_send(dict(batch.values.values()), as_list=batch.as_list)
+        except Exception as ex:  # noqa: BLE001
+            if not batch.done.done():
+                batch.done.set_exception(ex)
+                # Mark the exception as retrieved, in case all callers were cancelled
+                batch.done.exception()
+        else:
+            if not batch.done.done():
+                batch.done.set_result(None)
+
+    async def _async_send(self, values: dict[HcEntity, Any], *, as_list: bool) -> None:
+        data = [{"uid": entity.uid, "value": value} for entity, value in values.items()]
+        if len(values) > 1:
+            _LOGGER.debug("Writing %s values in one message", len(values))
+        message = Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data=data if as_list or len(data) > 1 else data[0],
+        )
+        response = await self._appliance.session.send_sync(message)
+        if response.action == Action.RESPONSE and response.code is None:
+            for entity, value in values.items():
+                entity._value_shadow = value  # noqa: SLF001
+
+
+class HCWriteDebouncer:
+    """
+    Trailing debounce of writes.
+
+    A value is written once no other value followed within `delay` seconds, so only the last
+    value of a burst (e.g. dragging a slider) is sent. Every caller of the burst awaits that
+    write and gets its error.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, delay: float, write: Callable[[Any], Awaitable[None]]
+    ) -> None:
+        self._hass = hass
+        self._delay = delay
+        self._write = write
+        self._value: Any = None
+        self._done: asyncio.Future[None] | None = None
+        self._handle: asyncio.TimerHandle | None = None
+
+    async def async_write(self, value: Any) -> None:
+        """Write the value, unless another value follows within the delay."""
+        self._value = value
+        if self._handle is not None:
+            self._handle.cancel()
+        if self._done is None:
+            self._done = self._hass.loop.create_future()
+        done = self._done
+        self._handle = self._hass.loop.call_later(self._delay, self._async_fire)
+        await asyncio.shield(done)
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel the pending write."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._done is not None:
+            self._done.cancel()
+            self._done = None
+
+    @callback
+    def _async_fire(self) -> None:
+        done, self._done, self._handle = self._done, None, None
+        if done is not None:
+            self._hass.async_create_task(
+                self._async_write_value(self._value, done), eager_start=True
+            )
+
+    async def _async_write_value(self, value: Any, done: asyncio.Future[None]) -> None:
+        try:
+            await self._write(value)
+        except Exception as ex:  # noqa: BLE001
+            if not done.done():
+                done.set_exception(ex)
+                # Mark the exception as retrieved, in case all callers were cancelled
+                done.exception()
+        else:
+            if not done.done():
+                done.set_result(None)
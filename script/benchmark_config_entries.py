@@ -0,0 +1,141 @@
+# ruff: noqa: INP001
+"""
+Benchmark the size and save latency of the config entries file.
+
+Compares config entries with the device description inlined under `description` with
+config entries referencing the compressed description in its own storage file, using a
+fleet of synthetic appliances. Each save writes the whole config entries file, like an
+unrelated config entry update (e.g. a host update from zeroconf) does.
+
+Run from the repository root: python -m script.benchmark_config_entries
+"""
+
+from __future__ import annotations
+
+import random
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any
+
+from homeassistant.helpers.json import save_json
+
+from custom_components.homeconnect_ws.description_store import encode_description
+
+APPLIANCE_COUNT = 12
+MODEL_COUNT = 8
+ENTITIES_PER_APPLIANCE = 600
+REPEAT = 20
+
+
+def synthetic_description(model: int, rng: random.Random) -> dict[str, Any]:
+    """Create a device description with a realistic number of entities."""
+    description: dict[str, Any] = {
+        "info": {"brand": "BRAND", "type": f"Type{model}", "model": f"Model{model}"}
+    }
+    for i, section in enumerate(("status", "setting", "event", "command", "option", "program")):
+        entities = []
+        for uid in range(ENTITIES_PER_APPLIANCE // 6):
+            entity = {
+                "uid": (i + 1) * 1000 + uid,
+                "name": f"Namespace.Model{model}.{section.capitalize()}.Entity{uid:03d}",
+                "available": True,
+                "access": rng.choice(("read", "readWrite")),
+                "protocolType": rng.choice(("Boolean", "Integer", "Float", "String")),
+            }
+            if rng.random() < 0.5:
+                entity["enumeration"] = {
+                    str(value): f"Namespace.EnumType.Value{value:02d}"
+                    for value in range(rng.randint(2, 12))
+                }
+            else:
+                entity["min"] = 0
+                entity["max"] = rng.randint(1, 3600)
+                entity["stepSize"] = 1
+            entities.append(entity)
+        description[section] = entities
+    return description
+
+
+def config_entry(index: int, data: dict[str, Any]) -> dict[str, Any]:
+    """Create the stored representation of a config entry."""
+    return {
+        "entry_id": f"{index:026d}",
+        "version": 2,
+        "minor_version": 1,
+        "domain": "homeconnect_ws",
+        "title": f"Appliance {index}",
+        "data": {
+            "host": f"192.168.1.{index}",
+            "device_id": f"{index:08x}",
+            "mode": "TLS",
+            "psk": "x" * 43,
+            "name": f"Appliance {index}",
+            **data,
+        },
+        "options": {},
+        "pref_disable_new_entities": False,
+        "pref_disable_polling": False,
+        "source": "user",
+        "unique_id": f"{index:018d}",
+        "disabled_by": None,
+        "discovery_keys": {},
+        "subentries": [],
+    }
+
+
+def config_entries_file(entries: list[dict[str, Any]]) -> dict[str, Any]:
+    """Create the stored config entries file."""
+    return {
+        "version": 1,
+        "minor_version": 5,
+        "key": "core.config_entries",
+        "data": {"entries": entries},
+    }
+
+
+def measure(path: Path, data: dict[str, Any]) -> tuple[int, float]:
+    """Get the file size in bytes and the fastest save time in ms."""
+    timer = timeit.Timer(lambda: save_json(str(path), data, private=True))
+    save_time = min(timer.repeat(REPEAT, 1)) * 1000
+    return path.stat().st_size, save_time
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rng = random.Random(0)  # noqa: S311
+    models = [synthetic_description(model, rng) for model in range(MODEL_COUNT)]
+    descriptions = [models[index % MODEL_COUNT] for index in range(APPLIANCE_COUNT)]
+    encoded = [encode_description(description) for description in descriptions]
+    stores = {data["hash"]: data for data in encoded}
+
+    inline = config_entries_file(
+        [config_entry(index, {"description": d}) for index, d in enumerate(descriptions)]
+    )
+    external = config_entries_file(
+        [
+            config_entry(index, {"description_hash": data["hash"]})
+            for index, data in enumerate(encoded)
+        ]
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inline_size, inline_time = measure(Path(tmp, "inline"), inline)
+        external_size, external_time = measure(Path(tmp, "external"), external)
+        store_size = 0
+        for description_hash, data in stores.items():
+            path = Path(tmp, description_hash)
+            save_json(str(path), {"version": 1, "key": description_hash, "data": data})
+            store_size += path.stat().st_size
+
+    print(  # noqa: T201
+        f"{APPLIANCE_COUNT} appliances, {len(stores)} distinct device descriptions\n"
+        f"{'':<22} {'size (kB)':>10} {'save (ms)':>10}\n"
+        f"{'inline description':<22} {inline_size / 1024:>10.1f} {inline_time:>10.2f}\n"
+        f"{'description hash':<22} {external_size / 1024:>10.1f} {external_time:>10.2f}\n"
+        f"{'description stores':<22} {store_size / 1024:>10.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# ruff: noqa: INP001
+"""
+Benchmark matching of Entity descriptions against appliances.
+
+Compares the linear scan over all descriptions with the Entity description index,
+using synthetic appliances with 200, 2.000 and 20.000 HC entities.
+
+Run from the repository root: python -m script.benchmark_entity_descriptions
+"""
+
+from __future__ import annotations
+
+import random
+import timeit
+from typing import TYPE_CHECKING
+
+from custom_components.homeconnect_ws.entity_descriptions import (
+    EntityDescriptionIndex,
+    get_all_entity_description,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from custom_components.homeconnect_ws.entity_descriptions import (
+        _EntityDescriptionsDefinitionsType,
+    )
+
+APPLIANCE_SIZES = (200, 2000, 20000)
+REPEAT = 5
+
+
+def match_linear(
+    all_descriptions: _EntityDescriptionsDefinitionsType, entities: Collection[str]
+) -> list:
+    """Match static descriptions by scanning all descriptions (previous implementation)."""
+    matched = []
+    appliance_entities = set(entities)
+    for description_type, descriptions in all_descriptions.items():
+        if description_type == "dynamic":
+            continue
+        for description in descriptions:
+            if callable(description):
+                continue
+            all_subscribed_entities = set()
+            if description.entity:
+                all_subscribed_entities.add(description.entity)
+            if description.entities:
+                all_subscribed_entities.update(description.entities)
+            if appliance_entities.issuperset(all_subscribed_entities):
+                matched.append(description)
+    return matched
+
+
+def match_index(index: EntityDescriptionIndex, entities: Collection[str]) -> list:
+    """Match static descriptions using the Entity description index."""
+    return [
+        description
+        for position in index.match(entities)
+        if not callable(description := index.descriptions[position][1])
+    ]
+
+
+def synthetic_entities(size: int, known: list[str], rng: random.Random) -> dict[str, None]:
+    """Create HC entity names, half of the known names and synthetic names for the rest."""
+    entities = dict.fromkeys(rng.sample(known, min(len(known) // 2, size)))
+    for i in range(size - len(entities)):
+        entities[f"Synthetic.Appliance.Setting.Entity{i:05d}"] = None
+    return entities
+
+
+def main() -> None:
+    """Run the benchmark."""
+    all_descriptions = get_all_entity_description()
+    index = EntityDescriptionIndex(all_descriptions)
+    known = sorted(index.by_entity)
+    rng = random.Random(0)  # noqa: S311
+    print(  # noqa: T201
+        f"{len(index.descriptions)} descriptions, {len(known)} indexed HC entities\n"
+        f"{'HC entities':>12} {'linear (µs)':>12} {'index (µs)':>12} {'speedup':>8}"
+    )
+    for size in APPLIANCE_SIZES:
+        entities = synthetic_entities(size, known, rng)
+        assert match_linear(all_descriptions, entities) == match_index(index, entities)  # noqa: S101
+
+        timer = timeit.Timer(lambda: match_linear(all_descriptions, entities))  # noqa: B023
+        number, _ = timer.autorange()
+        linear = min(timer.repeat(REPEAT, number)) / number * 1e6
+
+        timer = timeit.Timer(lambda: match_index(index, entities))  # noqa: B023
+        number, _ = timer.autorange()
+        indexed = min(timer.repeat(REPEAT, number)) / number * 1e6
+
+        print(f"{size:>12} {linear:>12.1f} {indexed:>12.1f} {linear / indexed:>7.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
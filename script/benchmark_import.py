@@ -0,0 +1,73 @@
+# ruff: noqa: INP001
+"""
+Benchmark the import time of the integration and the Entity description modules.
+
+Each measurement runs in a fresh interpreter. The Home Assistant modules used by the integration
+are imported before the measurement, so only the cost of the integration is measured. The
+description modules are measured with the integration already imported; "all modules" is the
+cost that was paid on every integration import before the modules were loaded lazily.
+
+Run from the repository root: python -m script.benchmark_import
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+REPEAT = 20
+INTEGRATION = "custom_components.homeconnect_ws"
+PACKAGE = f"{INTEGRATION}.entity_descriptions"
+
+SETUP = """
+import aiohttp, homeconnect_websocket, voluptuous
+from homeassistant import config_entries, exceptions, loader
+from homeassistant.components import (
+    binary_sensor, button, fan, light, number, select, sensor, switch
+)
+from homeassistant.helpers import device_registry, event, service, storage
+"""
+MEASURE = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+SCENARIOS = {
+    "integration": ("", f"import {INTEGRATION}"),
+    "Dishcare module": (
+        f"import {PACKAGE}",
+        f"{PACKAGE}.load_description_modules(['Dishcare'])",
+    ),
+    "Cooking module": (
+        f"import {PACKAGE}",
+        f"{PACKAGE}.load_description_modules(['Cooking'])",
+    ),
+    "all modules": (f"import {PACKAGE}", f"{PACKAGE}.load_description_modules()"),
+}
+
+
+def measure(setup: str, statement: str) -> float:
+    """Get the fastest time in ms of the statement in a fresh interpreter."""
+    code = SETUP + setup + MEASURE.format(statement=statement)
+    times = [
+        float(
+            subprocess.run(  # noqa: S603
+                [sys.executable, "-c", code], capture_output=True, check=True, text=True
+            ).stdout
+        )
+        for _ in range(REPEAT)
+    ]
+    return min(times) * 1000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{'scenario':<16} {'import (ms)':>12}")  # noqa: T201
+    for name, (setup, statement) in SCENARIOS.items():
+        print(f"{name:<16} {measure(setup, statement):>12.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -29,7 +29,7 @@ async def setup_config_entry(
         data=data,
         unique_id=unique_id,
     )
-    entry.runtime_data = HCData(appliance, Mock(), DEVICE_DESCRIPTION)
+    entry.runtime_data = HCData(appliance, Mock(), DEVICE_DESCRIPTION, Mock())
     entry.add_to_hass(hass)
     result = await hass.config_entries.async_setup(entry.entry_id)
     await hass.async_block_till_done()
@@ -37,6 +37,13 @@ def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
     return
 
 
+@pytest.fixture(autouse=True)
+def mock_probe() -> Generator[AsyncMock]:
+    """Mock the reachability probe of appliances."""
+    with patch("custom_components.homeconnect_ws.async_probe", return_value=True) as mock_probe:
+        yield mock_probe
+
+
 @pytest.fixture
 def patch_entity_description(monkeypatch: pytest.MonkeyPatch) -> None:
     """Patch entity_description for testing."""
@@ -93,15 +100,15 @@ def mock_process_profile_file() -> Generator[MagicMock]:
     """Mock process profile files."""
     device_description = {
         MOCK_TLS_DEVICE_ID: {
-            "info": MOCK_TLS_DEVICE_INFO,
+            "info": dict(MOCK_TLS_DEVICE_INFO),
             "description": MOCK_TLS_DEVICE_DESCRIPTION,
         },
         MOCK_AES_DEVICE_ID: {
-            "info": MOCK_AES_DEVICE_INFO,
+            "info": dict(MOCK_AES_DEVICE_INFO),
             "description": MOCK_AES_DEVICE_DESCRIPTION,
         },
         MOCK_TLS_DEVICE_ID_2: {
-            "info": MOCK_TLS_DEVICE_INFO,
+            "info": dict(MOCK_TLS_DEVICE_INFO),
             "description": MOCK_TLS_DEVICE_DESCRIPTION,
         },
     }
@@ -0,0 +1,50 @@
+"""Tests for the address cache."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from custom_components.homeconnect_ws import address_cache
+from custom_components.homeconnect_ws.address_cache import (
+    ADDRESS_TTL,
+    HCAddressCache,
+    get_peer_address,
+)
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_address_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test addresses are cached by normalized host name until they expire."""
+    cache = HCAddressCache()
+    cache.async_set("brand-type-id.local.", "192.168.1.2")
+    assert cache.async_get("Brand-Type-ID") == "192.168.1.2"
+
+    now = time.monotonic()
+    monkeypatch.setattr(address_cache.time, "monotonic", lambda: now + ADDRESS_TTL + 1)
+    assert cache.async_get("Brand-Type-ID") is None
+
+
+def test_address_cache_invalid() -> None:
+    """Test only addresses of host names are cached."""
+    cache = HCAddressCache()
+    cache.async_set("192.168.1.3", "192.168.1.2")
+    cache.async_set("brand-type-id", "brand-type-id.local")
+    assert cache.async_get("192.168.1.3") is None
+    assert cache.async_get("brand-type-id") is None
+
+    cache.async_set("brand-type-id", "fe80::1")
+    cache.async_invalidate("brand-type-id")
+    assert cache.async_get("brand-type-id") is None
+
+
+def test_peer_address() -> None:
+    """Test the address is read from the websocket transport."""
+    socket = Mock(_websocket=None)
+    assert get_peer_address(socket) is None
+
+    socket._websocket = Mock(get_extra_info=Mock(return_value=("192.168.1.2", 443)))
+    assert get_peer_address(socket) == "192.168.1.2"
@@ -2,22 +2,36 @@
 
 from __future__ import annotations
 
+import json
 from binascii import Error as BinasciiError
-from typing import TYPE_CHECKING
-from unittest.mock import ANY, AsyncMock, MagicMock, Mock, call
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+from unittest.mock import ANY, AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
 from aiohttp import ClientConnectionError, ClientConnectorSSLError
-from custom_components.homeconnect_ws import config_flow
+from custom_components.homeconnect_ws import HC_KEY, HCConfig, config_flow
 from custom_components.homeconnect_ws.const import (
     CONF_AES_IV,
+    CONF_BACKGROUND_CONNECT,
+    CONF_DESCRIPTION_HASH,
     CONF_FILE,
     CONF_MANUAL_HOST,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_OPTIMISTIC_STATE,
     CONF_PSK,
+    CONF_SETUP_ALL,
     DOMAIN,
 )
-from homeassistant.config_entries import SOURCE_IGNORE, SOURCE_USER
-from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE, CONF_HOST, CONF_NAME
+from custom_components.homeconnect_ws.description_store import (
+    async_load_description,
+    async_remove_description,
+    async_save_description,
+    hash_description,
+)
+from custom_components.homeconnect_ws.diagnostics import async_get_config_entry_diagnostics
+from homeassistant.config_entries import SOURCE_IGNORE, SOURCE_REAUTH, SOURCE_USER
+from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE, CONF_HOST, CONF_MODE, CONF_NAME
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers.selector import SelectOptionDict
 from homeconnect_websocket import ParserError
@@ -35,7 +49,10 @@ from .const import (
 )
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     import pytest
+    from homeassistant.config_entries import ConfigFlowResult
     from homeassistant.core import HomeAssistant
 
 UPLOADED_FILE = str(uuid4())
@@ -125,13 +142,13 @@ async def test_user_tls(
         MOCK_TLS_DEVICE_INFO["key"],
     )
     tls_socket.return_value.connect.assert_awaited_once()
-    tls_socket.return_value.close.assert_awaited_once()
+    tls_socket.return_value.close.assert_not_awaited()  # Kept for the entry setup
 
     mock_process_profile_file.assert_called_once_with(UPLOADED_FILE)
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_TLS"
-    assert result["data"][CONF_DESCRIPTION] == MOCK_TLS_DEVICE_DESCRIPTION
+    assert result["data"][CONF_DESCRIPTION_HASH] == hash_description(MOCK_TLS_DEVICE_DESCRIPTION)
     assert result["data"][CONF_HOST] == "Test_Brand-Test_TLS-010203040506070809"
     assert result["data"][CONF_PSK] == MOCK_TLS_DEVICE_INFO["key"]
     assert CONF_AES_IV not in result["data"]
@@ -178,13 +195,13 @@ async def test_user_aes(
         MOCK_AES_DEVICE_INFO["iv"],
     )
     aes_socket.return_value.connect.assert_awaited_once()
-    aes_socket.return_value.close.assert_awaited_once()
+    aes_socket.return_value.close.assert_not_awaited()  # Kept for the entry setup
 
     mock_process_profile_file.assert_called_once_with(UPLOADED_FILE)
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_AES"
-    assert result["data"][CONF_DESCRIPTION] == MOCK_AES_DEVICE_DESCRIPTION
+    assert result["data"][CONF_DESCRIPTION_HASH] == hash_description(MOCK_AES_DEVICE_DESCRIPTION)
     assert result["data"][CONF_HOST] == "101112131415161718"
     assert result["data"][CONF_PSK] == MOCK_AES_DEVICE_INFO["key"]
     assert result["data"][CONF_AES_IV] == MOCK_AES_DEVICE_INFO["iv"]
@@ -274,7 +291,7 @@ async def test_user_select_device_one(
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_AES"
-    assert result["data"][CONF_DESCRIPTION] == MOCK_AES_DEVICE_DESCRIPTION
+    assert result["data"][CONF_DESCRIPTION_HASH] == hash_description(MOCK_AES_DEVICE_DESCRIPTION)
     assert result["data"][CONF_HOST] == "101112131415161718"
     assert result["data"][CONF_PSK] == MOCK_AES_DEVICE_INFO["key"]
     assert result["data"][CONF_AES_IV] == MOCK_AES_DEVICE_INFO["iv"]
@@ -327,6 +344,101 @@ async def test_user_select_device_ignore(
     hass.config_entries.flow.async_abort(result["flow_id"])
 
 
+async def test_user_setup_all(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+    mock_setup_entry: AsyncMock,  # noqa: ARG001
+) -> None:
+    """Test setting up all appliances in one flow."""
+    tls_timeout = AsyncMock()
+    tls_timeout.connect.side_effect = TimeoutError
+    tls_auth_failed = AsyncMock()
+    tls_auth_failed.connect.side_effect = ClientConnectorSSLError(MagicMock(), MagicMock())
+    hc_socket = Mock()
+    hc_socket.TlsSocket = Mock(side_effect=[tls_timeout, tls_auth_failed])
+    hc_socket.AesSocket = Mock(return_value=AsyncMock())
+    monkeypatch.setattr(config_flow, "hc_socket", hc_socket)
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
+        },
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "device_select"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_SETUP_ALL: True,
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "bulk_setup_finished"
+    assert result["description_placeholders"] == {
+        "setup": "1",
+        "manual_host": "1",
+        "auth_failed": "1",
+    }
+    for socket in (tls_timeout, tls_auth_failed, hc_socket.AesSocket.return_value):
+        socket.connect.assert_awaited_once()
+    tls_timeout.close.assert_awaited_once()
+    tls_auth_failed.close.assert_awaited_once()
+    # Kept for the entry setup
+    hc_socket.AesSocket.return_value.close.assert_not_awaited()
+
+    entries = hass.config_entries.async_entries(DOMAIN)
+    assert [entry.unique_id for entry in entries] == [MOCK_AES_DEVICE_ID]
+    assert entries[0].data[CONF_DESCRIPTION_HASH] == hash_description(MOCK_AES_DEVICE_DESCRIPTION)
+
+    # Unreachable appliance asks for the host
+    flows = hass.config_entries.flow.async_progress()
+    assert len(flows) == 1
+    assert flows[0]["context"]["unique_id"] == MOCK_TLS_DEVICE_ID
+    assert flows[0]["step_id"] == "host"
+
+    hc_socket.TlsSocket = Mock(return_value=AsyncMock())
+    result = await hass.config_entries.flow.async_configure(
+        flows[0]["flow_id"],
+        user_input={
+            CONF_HOST: "1.2.3.4",
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_HOST] == "1.2.3.4"
+    assert result["data"][CONF_MANUAL_HOST]
+
+
+async def test_user_select_no_device(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,  # noqa: ARG001
+) -> None:
+    """Test select device without device."""
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
+        },
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_SETUP_ALL: False,
+        },
+    )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "device_select"
+    assert result["errors"] == {"base": "no_appliance_selected"}
+    hass.config_entries.flow.async_abort(result["flow_id"])
+
+
 async def test_user_set_host(
     hass: HomeAssistant,
     mock_process_profile_file: MagicMock,  # noqa: ARG001
@@ -407,7 +519,7 @@ async def test_user_set_host(
         MOCK_TLS_DEVICE_INFO["key"],
     )
     mock_hc_socket.return_value.connect.assert_awaited_once()
-    mock_hc_socket.return_value.close.assert_awaited_once()
+    mock_hc_socket.return_value.close.assert_not_awaited()  # Kept for the entry setup
     mock_setup_entry.assert_awaited_once()
 
 
@@ -725,21 +837,249 @@ async def test_process_profile(
     )
 
     assert result == {
-        MOCK_TLS_DEVICE_ID: {
-            "info": MOCK_TLS_DEVICE_INFO,
-            "description": mock_parser.return_value,
+        MOCK_TLS_DEVICE_ID: {"info": MOCK_TLS_DEVICE_INFO, "profile_file": ANY},
+        MOCK_AES_DEVICE_ID: {"info": MOCK_AES_DEVICE_INFO, "profile_file": ANY},
+    }
+    mock_parser.assert_not_called()
+    mock_process_uploaded_file.assert_called_with(ANY, UPLOADED_FILE)
+
+    files = config_flow.read_description_files(result)
+    assert files == {
+        MOCK_TLS_DEVICE_ID: (ANY, b"TLS_DeviceDescription", b"TLS_FeatureMapping"),
+        MOCK_AES_DEVICE_ID: (ANY, b"AES_DeviceDescription", b"AES_FeatureMapping"),
+    }
+    assert files[MOCK_TLS_DEVICE_ID][0] != files[MOCK_AES_DEVICE_ID][0]
+
+
+class MockProcessPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor with the signature of ProcessPoolExecutor."""
+
+    def __init__(self, max_workers: int, mp_context: Any) -> None:
+        super().__init__(max_workers)
+
+
+async def test_parse_descriptions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test parsing device descriptions in parallel."""
+    mock_parser = MagicMock(side_effect=lambda description, feature: (description, feature))
+    monkeypatch.setattr(config_flow, "parse_device_description", mock_parser)
+    monkeypatch.setattr(config_flow, "ProcessPoolExecutor", MockProcessPoolExecutor)
+
+    descriptions = config_flow.parse_descriptions(
+        {
+            MOCK_TLS_DEVICE_ID: (b"TLS_DeviceDescription", b"TLS_FeatureMapping"),
+            MOCK_AES_DEVICE_ID: (b"AES_DeviceDescription", b"AES_FeatureMapping"),
+        }
+    )
+
+    assert descriptions == {
+        MOCK_TLS_DEVICE_ID: (b"TLS_DeviceDescription", b"TLS_FeatureMapping"),
+        MOCK_AES_DEVICE_ID: (b"AES_DeviceDescription", b"AES_FeatureMapping"),
+    }
+    assert mock_parser.call_count == 2
+
+
+async def test_user_parse_all_descriptions(
+    monkeypatch: pytest.MonkeyPatch,
+    hass: HomeAssistant,
+    mock_process_uploaded_file: MagicMock,  # noqa: ARG001
+) -> None:
+    """Test all device descriptions are parsed on upload, if enabled."""
+    mock_parser = MagicMock(return_value=MOCK_TLS_DEVICE_DESCRIPTION)
+    monkeypatch.setattr(config_flow, "parse_device_description", mock_parser)
+    monkeypatch.setattr(config_flow, "ProcessPoolExecutor", MockProcessPoolExecutor)
+    hass.data[HC_KEY] = HCConfig(parse_profiles_in_parallel=True)
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
         },
-        MOCK_AES_DEVICE_ID: {
-            "info": MOCK_AES_DEVICE_INFO,
-            "description": mock_parser.return_value,
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "device_select"
+    assert mock_parser.call_count == 2
+    hass.config_entries.flow.async_abort(result["flow_id"])
+
+
+async def test_user_setup_all_parse_sequential(
+    monkeypatch: pytest.MonkeyPatch,
+    hass: HomeAssistant,
+    mock_process_uploaded_file: MagicMock,  # noqa: ARG001
+    mock_setup_entry: AsyncMock,  # noqa: ARG001
+) -> None:
+    """Test device descriptions are parsed without a process pool, if not enabled."""
+    mock_parser = MagicMock(return_value=MOCK_TLS_DEVICE_DESCRIPTION)
+    monkeypatch.setattr(config_flow, "parse_device_description", mock_parser)
+    mock_pool = Mock()
+    monkeypatch.setattr(config_flow, "ProcessPoolExecutor", mock_pool)
+    hc_socket = Mock()
+    hc_socket.TlsSocket = Mock(return_value=AsyncMock())
+    hc_socket.AesSocket = Mock(return_value=AsyncMock())
+    monkeypatch.setattr(config_flow, "hc_socket", hc_socket)
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={CONF_FILE: UPLOADED_FILE}
+    )
+    assert result["step_id"] == "device_select"
+    mock_parser.assert_not_called()
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={CONF_SETUP_ALL: True}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "bulk_setup_finished"
+    assert mock_parser.call_count == 2
+    mock_pool.assert_not_called()
+
+
+async def test_user_profile_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    hass: HomeAssistant,
+    mock_process_uploaded_file: MagicMock,  # noqa: ARG001
+    mock_setup_entry: AsyncMock,  # noqa: ARG001
+) -> None:
+    """Test parsed device descriptions are cached until the config entry is removed."""
+    mock_parser = MagicMock(return_value=MOCK_AES_DEVICE_DESCRIPTION)
+    monkeypatch.setattr(config_flow, "parse_device_description", mock_parser)
+    hc_socket = Mock()
+    hc_socket.AesSocket = Mock(return_value=AsyncMock())
+    monkeypatch.setattr(config_flow, "hc_socket", hc_socket)
+
+    async def setup_aes_appliance() -> ConfigFlowResult:
+        result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input={CONF_FILE: UPLOADED_FILE}
+        )
+        return await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input={CONF_DEVICE: MOCK_AES_DEVICE_ID}
+        )
+
+    result = await setup_aes_appliance()
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_DESCRIPTION_HASH] == hash_description(MOCK_AES_DEVICE_DESCRIPTION)
+    assert mock_parser.call_count == 1
+
+    # Reauth uses the cached description
+    entry = result["result"]
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={
+            "source": SOURCE_REAUTH,
+            "entry_id": entry.entry_id,
+            "unique_id": entry.unique_id,
         },
-    }
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={CONF_FILE: UPLOADED_FILE}
+    )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert entry.data[CONF_DESCRIPTION_HASH] == hash_description(MOCK_AES_DEVICE_DESCRIPTION)
+    assert mock_parser.call_count == 1
+
+    # Purged when the config entry is removed
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    result = await setup_aes_appliance()
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert mock_parser.call_count == 2
+
 
-    mock_parser.assert_has_calls(
-        [
-            call(b"TLS_DeviceDescription", b"TLS_FeatureMapping"),
-            call(b"AES_DeviceDescription", b"AES_FeatureMapping"),
-        ],
-        any_order=True,
+async def test_user_parse_selected_device(
+    monkeypatch: pytest.MonkeyPatch,
+    hass: HomeAssistant,
+    mock_process_uploaded_file: MagicMock,  # noqa: ARG001
+    mock_setup_entry: AsyncMock,
+) -> None:
+    """Test only the device description of the selected appliance is parsed."""
+    mock_parser = MagicMock(side_effect=ParserError("Test Error"))
+    monkeypatch.setattr(config_flow, "parse_device_description", mock_parser)
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
+        },
     )
-    mock_process_uploaded_file.assert_called_with(ANY, UPLOADED_FILE)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "device_select"
+    mock_parser.assert_not_called()
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_DEVICE: MOCK_AES_DEVICE_ID,
+        },
+    )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "profile_file_parser_error"
+    assert result["description_placeholders"] == {"error": "Test Error"}
+    mock_parser.assert_called_once_with(b"AES_DeviceDescription", b"AES_FeatureMapping")
+    mock_setup_entry.assert_not_awaited()
+
+
+async def test_user_setup_from_dump(
+    monkeypatch: pytest.MonkeyPatch,
+    hass: HomeAssistant,
+    tmp_path: Path,
+    mock_setup_entry: AsyncMock,  # noqa: ARG001
+) -> None:
+    """Test setting up a config entry from the diagnostics of a config entry."""
+    description_hash = await async_save_description(hass, MOCK_AES_DEVICE_DESCRIPTION)
+    data = {**MOCK_CONFIG_DATA, CONF_MODE: "AES", CONF_DESCRIPTION_HASH: description_hash}
+    data.pop(CONF_DESCRIPTION)
+    entry = MockConfigEntry(domain=DOMAIN, data=data, unique_id=MOCK_AES_DEVICE_ID, version=2)
+    entry.add_to_hass(hass)
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    dump_file = tmp_path / "dump.json"
+    dump_file.write_text(json.dumps({"data": diagnostics}))
+    # The dump is set up on another instance, without the stored description
+    await async_remove_description(hass, description_hash, entry.entry_id)
+
+    upload = MagicMock()
+    upload.__enter__.return_value = dump_file
+    monkeypatch.setattr(config_flow, "process_uploaded_file", Mock(return_value=upload))
+    hc_socket = Mock()
+    hc_socket.AesSocket = Mock(return_value=AsyncMock())
+    monkeypatch.setattr(config_flow, "hc_socket", hc_socket)
+    hass.data[HC_KEY] = HCConfig(setup_from_dump=True)
+
+    result = await hass.config_entries.flow.async_init(DOMAIN, context={"source": SOURCE_USER})
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], user_input={CONF_FILE: UPLOADED_FILE}
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert CONF_DESCRIPTION not in result["data"]
+    assert await async_load_description(hass, result["data"][CONF_DESCRIPTION_HASH]) == json.loads(
+        json.dumps(MOCK_AES_DEVICE_DESCRIPTION)
+    )
+
+
+async def test_options_flow(
+    hass: HomeAssistant,
+    mock_setup_entry: AsyncMock,  # noqa: ARG001
+) -> None:
+    """Test options flow."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG_DATA, unique_id=MOCK_TLS_DEVICE_ID)
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_MIN_UPDATE_INTERVAL: 10},
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options == {
+        CONF_MIN_UPDATE_INTERVAL: 10,
+        CONF_BACKGROUND_CONNECT: False,
+        CONF_OPTIMISTIC_STATE: False,
+    }
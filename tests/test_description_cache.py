@@ -0,0 +1,101 @@
+"""Tests for the Entity description cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
+
+from custom_components import homeconnect_ws
+from custom_components.homeconnect_ws.const import CONF_DESCRIPTION_HASH, DOMAIN
+from custom_components.homeconnect_ws.description_cache import (
+    decode_descriptions,
+    encode_descriptions,
+)
+from custom_components.homeconnect_ws.description_store import async_save_description
+from custom_components.homeconnect_ws.entity_descriptions import (
+    HCSensorEntityDescription,
+    get_all_entity_description,
+)
+from homeassistant.const import CONF_DESCRIPTION
+
+from . import setup_config_entry
+from .const import ENTITY_DESCRIPTIONS, MOCK_CONFIG_DATA
+
+if TYPE_CHECKING:
+    import pytest
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
+
+
+def test_encode_descriptions() -> None:
+    """Test Entity descriptions are encoded without loss."""
+    encoded = encode_descriptions(ENTITY_DESCRIPTIONS)
+    assert decode_descriptions(encoded) == ENTITY_DESCRIPTIONS
+
+    static_descriptions = {
+        key: [description for description in value if not callable(description)]
+        for key, value in get_all_entity_description().items()
+        if key != "dynamic"
+    }
+    encoded = encode_descriptions(static_descriptions)
+    assert decode_descriptions(encoded) == static_descriptions
+
+
+async def test_description_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_appliance: MockAppliance,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test Entity descriptions are resolved only once per device description."""
+    get_available_entities = Mock(return_value=ENTITY_DESCRIPTIONS)
+    monkeypatch.setattr(homeconnect_ws, "get_available_entities", get_available_entities)
+
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    assert entry.runtime_data.available_entity_descriptions == ENTITY_DESCRIPTIONS
+    assert get_available_entities.call_count == 1
+    assert f"{DOMAIN}.descriptions.{entry.entry_id}" in hass_storage
+
+    # Cached
+    assert await hass.config_entries.async_reload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.runtime_data.available_entity_descriptions == ENTITY_DESCRIPTIONS
+    assert get_available_entities.call_count == 1
+
+    # Changed device description, reloaded by the update listener
+    description = {**MOCK_CONFIG_DATA[CONF_DESCRIPTION], "status": []}
+    description_hash = await async_save_description(hass, description)
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_DESCRIPTION_HASH: description_hash}
+    )
+    await hass.async_block_till_done()
+    assert get_available_entities.call_count == 2
+
+    # Removed with the config entry
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert f"{DOMAIN}.descriptions.{entry.entry_id}" not in hass_storage
+
+
+async def test_description_cache_not_cacheable(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_appliance: MockAppliance,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test Entity descriptions with callables are not cached."""
+    descriptions = {
+        "sensor": [
+            HCSensorEntityDescription(
+                key="Test.Sensor",
+                entity="Test.Sensor",
+                extra_attributes=[{"name": "Test", "entity": "Test.Sensor", "value_fn": str}],
+            )
+        ]
+    }
+    monkeypatch.setattr(homeconnect_ws, "get_available_entities", Mock(return_value=descriptions))
+
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    assert f"{DOMAIN}.descriptions.{entry.entry_id}" not in hass_storage
@@ -0,0 +1,332 @@
+"""Tests for state write dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from custom_components import homeconnect_ws
+from custom_components.homeconnect_ws.const import CONF_MIN_UPDATE_INTERVAL, DOMAIN
+from custom_components.homeconnect_ws.dispatcher import DispatcherStats, HCDispatcher
+from custom_components.homeconnect_ws.entity_descriptions import HCSensorEntityDescription
+from homeassistant.components.light import ATTR_BRIGHTNESS
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.const import STATE_ON
+from homeassistant.helpers.entity_platform import async_get_platforms
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
+
+from . import setup_config_entry
+from .const import MOCK_CONFIG_DATA
+
+if TYPE_CHECKING:
+    import pytest
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
+
+
+async def test_coalesce_message(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test updates from one message are written once per entity."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    dispatcher = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.dispatcher
+
+    await mock_appliance._update_entities(
+        [
+            {"uid": 108, "value": True},
+            {"uid": 109, "value": 50},
+            {"uid": 110, "value": 50},
+            {"uid": 111, "value": "#ff0000"},
+            {"uid": 112, "value": 1},
+        ]
+    )
+    await hass.async_block_till_done()
+
+    # Light.1 to Light.4 depend on these 5 HC entities
+    assert dispatcher.stats.updates == 5
+    assert dispatcher.stats.batches == 1
+    assert dispatcher.stats.writes == 4
+
+    state = hass.states.get("light.fake_brand_homeappliance_light_3")
+    assert state.state == STATE_ON
+    assert state.attributes[ATTR_BRIGHTNESS] == 128
+
+
+async def test_remove_listener(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test HC callbacks are removed on unload."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    assert mock_appliance.entities["Test.Switch"]._callbacks
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert not mock_appliance.entities["Test.Switch"]._callbacks
+
+
+async def test_stress(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test many updates are written once per batch and the last value is written."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    dispatcher = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.dispatcher
+    await mock_appliance.entities["Test.Lighting"].update({"value": True})
+    await hass.async_block_till_done()
+    dispatcher.stats = DispatcherStats()
+
+    for i in range(2000):
+        await mock_appliance._update_entities(
+            [
+                {"uid": 102, "value": i},
+                {"uid": 109, "value": i % 100 + 1},
+            ]
+        )
+        if i % 10 == 9:
+            await hass.async_block_till_done()
+
+    assert dispatcher.stats.updates == 4000
+    assert dispatcher.stats.batches == 200
+    # Sensor, Light.2 and Light.3
+    assert dispatcher.stats.writes == 600
+
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor").state == "1999"
+    state = hass.states.get("light.fake_brand_homeappliance_light_3")
+    assert state.attributes[ATTR_BRIGHTNESS] == 255
+
+
+async def test_wait_connected(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test updates received while not connected are written once connected."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    dispatcher = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.dispatcher
+
+    mock_appliance.session.connected = False
+    mock_appliance.session.connected_event = asyncio.Event()
+    for i in range(1000):
+        await mock_appliance._update_entities([{"uid": 102, "value": i}])
+        await asyncio.sleep(0)
+
+    assert dispatcher.stats.updates == 1000
+    assert dispatcher.stats.writes == 0
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor").state != "999"
+
+    mock_appliance.session.connected = True
+    mock_appliance.session.connected_event.set()
+    await hass.async_block_till_done()
+
+    assert dispatcher.stats.batches == 1
+    assert dispatcher.stats.writes == 1
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor").state == "999"
+
+
+async def test_cooldown(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test updates within the cooldown are deferred and the last value is written."""
+    monkeypatch.setattr(homeconnect_ws, "HCDispatcher", partial(HCDispatcher, cooldown=5))
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    entity_id = "sensor.fake_brand_homeappliance_sensor"
+
+    for i in range(100):
+        await mock_appliance._update_entities([{"uid": 102, "value": i}])
+        if i % 10 == 0:
+            await hass.async_block_till_done()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == "0"
+
+    freezer.tick(timedelta(seconds=4))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "0"
+
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "99"
+
+
+async def test_skip_unchanged(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test unchanged states are not written."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    dispatcher = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.dispatcher
+
+    for _ in range(10):
+        await mock_appliance._update_entities([{"uid": 102, "value": 5}])
+        await hass.async_block_till_done()
+
+    assert dispatcher.stats.writes == 1
+    assert dispatcher.stats.skipped == 9
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor").state == "5"
+
+    await mock_appliance._update_entities([{"uid": 102, "value": 6}])
+    await hass.async_block_till_done()
+
+    assert dispatcher.stats.writes == 2
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor").state == "6"
+
+
+async def test_skip_unchanged_direct_write(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test states written directly refresh the fingerprint of the last written state."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    entity_id = "sensor.fake_brand_homeappliance_sensor"
+    platform = next(
+        platform
+        for platform in async_get_platforms(hass, DOMAIN)
+        if platform.domain == SENSOR_DOMAIN
+    )
+
+    await mock_appliance._update_entities([{"uid": 102, "value": 5}])
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "5"
+
+    mock_appliance.entities["Test.Sensor"]._value = 6
+    platform.entities[entity_id].async_write_ha_state()
+    assert hass.states.get(entity_id).state == "6"
+
+    await mock_appliance._update_entities([{"uid": 102, "value": 5}])
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "5"
+
+
+async def test_skip_unchanged_force_update(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test descriptions with force_update are always written."""
+    monkeypatch.setattr(
+        homeconnect_ws,
+        "get_available_entities",
+        Mock(
+            return_value={
+                "sensor": [
+                    HCSensorEntityDescription(
+                        key="Test.Sensor", name="Sensor", entity="Test.Sensor", force_update=True
+                    )
+                ]
+            }
+        ),
+    )
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    dispatcher = hass.config_entries.async_entries(DOMAIN)[0].runtime_data.dispatcher
+
+    for _ in range(10):
+        await mock_appliance._update_entities([{"uid": 102, "value": 5}])
+        await hass.async_block_till_done()
+
+    assert dispatcher.stats.writes == 10
+    assert dispatcher.stats.skipped == 0
+
+
+THROTTLED_DESCRIPTIONS = {
+    "sensor": [
+        HCSensorEntityDescription(
+            key="Test.Sensor",
+            name="Sensor",
+            entity="Test.Sensor",
+            min_update_interval=20,
+            significant_change=10,
+        )
+    ]
+}
+
+
+async def test_min_update_interval(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    monkeypatch: pytest.MonkeyPatch,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test min_update_interval and significant_change."""
+    monkeypatch.setattr(
+        homeconnect_ws, "get_available_entities", Mock(return_value=THROTTLED_DESCRIPTIONS)
+    )
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    entry = hass.config_entries.async_entries(DOMAIN)[0]
+    dispatcher = entry.runtime_data.dispatcher
+    entity_id = "sensor.fake_brand_homeappliance_sensor"
+
+    for value in (20, 21, 25):
+        await mock_appliance._update_entities([{"uid": 102, "value": value}])
+        await hass.async_block_till_done()
+
+    assert dispatcher.stats.writes == 1
+    assert dispatcher.stats.deferred == 2
+    assert hass.states.get(entity_id).state == "20"
+
+    # significant change is written immediately
+    await mock_appliance._update_entities([{"uid": 102, "value": 30}])
+    await hass.async_block_till_done()
+    assert dispatcher.stats.writes == 2
+    assert hass.states.get(entity_id).state == "30"
+
+    # trailing value is written after the interval
+    await mock_appliance._update_entities([{"uid": 102, "value": 31}])
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "30"
+
+    freezer.tick(timedelta(seconds=19))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "30"
+
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert dispatcher.stats.writes == 3
+    assert hass.states.get(entity_id).state == "31"
+
+
+async def test_min_update_interval_options(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test min_update_interval overridden by options."""
+    monkeypatch.setattr(
+        homeconnect_ws, "get_available_entities", Mock(return_value=THROTTLED_DESCRIPTIONS)
+    )
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        options={CONF_MIN_UPDATE_INTERVAL: 0},
+        unique_id="any",
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    dispatcher = entry.runtime_data.dispatcher
+
+    for value in (20, 21, 25):
+        await mock_appliance._update_entities([{"uid": 102, "value": value}])
+        await hass.async_block_till_done()
+
+    assert dispatcher.stats.writes == 3
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor").state == "25"
@@ -84,6 +84,79 @@ def test_get_available_entities(
     ]
 
 
+def test_entity_description_index() -> None:
+    """Test the Entity description index keeps the original order."""
+
+    def generator(_: MockAppliance) -> None:
+        return None
+
+    descriptions = {
+        "sensor": [
+            HCSensorEntityDescription(key="sensor_3", entities=["Test.C", "Test.A", "Test.A"]),
+            HCSensorEntityDescription(key="sensor_missing", entities=["Test.A", "Test.D"]),
+            generator,
+            HCSensorEntityDescription(key="sensor_1", entity="Test.A"),
+        ],
+        "switch": [
+            HCSwitchEntityDescription(key="switch_no_entity"),
+            HCSwitchEntityDescription(key="switch_2", entity="Test.B", entities=["Test.C"]),
+        ],
+        "dynamic": [generator],
+    }
+    index = entity_descriptions.EntityDescriptionIndex(descriptions)
+
+    expected = [0, 2, 3, 4, 5, 6]
+    # fewer appliance entities than indexed entities
+    assert index.match({"Test.A", "Test.B", "Test.C"}) == expected
+    # more appliance entities than indexed entities
+    assert index.match({"Test.A", "Test.B", "Test.C", "Test.E", "Test.F", "Test.G"}) == expected
+    assert index.match(set()) == [2, 4, 6]
+
+
+def test_get_namespaces() -> None:
+    """Test namespaces of appliance entities with descriptions."""
+    appliance = Mock()
+    appliance.entities = dict.fromkeys(
+        ["BSH.Common.Status.DoorState", "Cooking.Oven.Status.Test", "Test.Sensor", "Cooking.Test"]
+    )
+    assert entity_descriptions.get_namespaces(appliance) == {"Cooking"}
+
+
+def test_get_all_entity_description_namespaces() -> None:
+    """Test only descriptions of the requested namespaces are merged."""
+
+    def keys(descriptions: dict) -> set[str]:
+        return {
+            description.key
+            for value in descriptions.values()
+            for description in value
+            if not callable(description)
+        }
+
+    dishcare = keys(entity_descriptions.get_all_entity_description(["Dishcare"]))
+    cooking = keys(entity_descriptions.get_all_entity_description(["Cooking"]))
+    all_keys = keys(entity_descriptions.get_all_entity_description())
+
+    assert "sensor_rinse_aid" in dishcare
+    assert "sensor_rinse_aid" not in cooking
+    assert "sensor_interval_time_off" in cooking
+    assert "sensor_interval_time_off" not in dishcare
+    assert dishcare | cooking <= all_keys
+
+
+def test_get_all_entity_description_common_light() -> None:
+    """Test the ambient light is described for appliances without a domain namespace."""
+    appliance = Mock()
+    appliance.entities = dict.fromkeys(
+        ["BSH.Common.Setting.AmbientLightEnabled", "BSH.Common.Setting.AmbientLightBrightness"]
+    )
+    descriptions = entity_descriptions.get_all_entity_description(
+        entity_descriptions.get_namespaces(appliance)
+    )
+    lights = [generator(appliance) for generator in descriptions["light"]]
+    assert [light.key for light in lights if light] == ["light_cooking_ambient_lighting"]
+
+
 POWER_SWITCH = {
     "setting": [
         {
@@ -107,11 +107,12 @@ async def test_set_speed(
         blocking=True,
     )
 
+    # Speeds that are already 0 aren't written
     mock_appliance.session.send_sync.assert_awaited_once_with(
         Message(
             resource="/ro/values",
             action=Action.POST,
-            data=[{"uid": 403, "value": 1}, {"uid": 404, "value": 0}],
+            data=[{"uid": 403, "value": 1}],
         )
     )
     mock_appliance.session.send_sync.reset_mock()
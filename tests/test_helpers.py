@@ -4,14 +4,20 @@ from __future__ import annotations
 
 import re
 from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
+from custom_components.homeconnect_ws.const import PLATFORMS
 from custom_components.homeconnect_ws.helpers import (
     EntityMatch,
+    EntityTrie,
     get_entities_from_regex,
+    get_entity_trie,
     get_groups_from_regex,
+    get_platforms,
 )
+from homeassistant.const import Platform
 
-from .const import DEVICE_DESCRIPTION
+from .const import DEVICE_DESCRIPTION, ENTITY_DESCRIPTIONS
 
 if TYPE_CHECKING:
     from homeconnect_websocket.testutils import MockApplianceType
@@ -36,3 +42,47 @@ async def test_get_groups_from_regex(mock_homeconnect_appliance: MockApplianceTy
     pattern = re.compile(r"^Test\.RegEx\.(.*)\..*$")
     result = get_groups_from_regex(appliance, pattern)
     assert result == {("001",), ("002",)}
+
+
+def test_get_platforms() -> None:
+    """Test get_platforms helper."""
+    assert get_platforms({"sensor": [], "wifi": [Mock()], "fan": [Mock()], "light": []}) == [
+        Platform.SENSOR,
+        Platform.FAN,
+    ]
+    assert get_platforms({"start_button": [Mock()]}) == [Platform.BUTTON]
+    assert get_platforms({}) == []
+    assert get_platforms(ENTITY_DESCRIPTIONS) == PLATFORMS
+
+
+def test_entity_trie() -> None:
+    """Test EntityTrie."""
+    trie = EntityTrie(
+        [
+            "Cooking.Hob.Status.Zone.001.State",
+            "Cooking.Hob.Status.Zone.001.ElapsedProgramTime",
+            "Cooking.Hob.Status.Zone.001.ElapsedProgramTime.AutoCounting",
+            "Cooking.Hob.Status.Zone.002.State",
+            "Cooking.Hob.Status.Zone.Count",
+            "Cooking.Hob.Status.Zone.003",
+        ]
+    )
+    assert trie.get_numeric_groups("Cooking.Hob.Status.Zone") == ["001", "002"]
+    assert trie.get_numeric_groups("Cooking.Oven.Status.Cavity") == []
+    assert trie.get_children("Cooking.Hob.Status.Zone.001") == ["State", "ElapsedProgramTime"]
+    assert trie.get_children("Cooking.Oven") == []
+    assert trie.get_entities("Cooking.Hob.Status.Zone.001.ElapsedProgramTime") == [
+        "Cooking.Hob.Status.Zone.001.ElapsedProgramTime",
+        "Cooking.Hob.Status.Zone.001.ElapsedProgramTime.AutoCounting",
+    ]
+    assert trie.get_node("Cooking.Hob.Status.Zone.003").name == "Cooking.Hob.Status.Zone.003"
+    assert trie.get_node("Cooking.Hob.Status").name is None
+
+
+async def test_get_entity_trie(mock_homeconnect_appliance: MockApplianceType) -> None:
+    """Test get_entity_trie helper."""
+    appliance = await mock_homeconnect_appliance(description=DEVICE_DESCRIPTION)
+    trie = get_entity_trie(appliance)
+    assert get_entity_trie(appliance) is trie
+    assert trie.get_numeric_groups("Test.RegEx") == ["001", "002"]
+    assert sorted(trie) == sorted(appliance.entities)
@@ -2,20 +2,38 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-from unittest.mock import MagicMock, Mock
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, Mock
 
+import pytest
 from aiohttp import ClientConnectionError, ClientConnectorSSLError
 from custom_components import homeconnect_ws
-from custom_components.homeconnect_ws.const import DOMAIN
-from homeassistant.config_entries import ConfigEntryState
+from custom_components.homeconnect_ws import get_connect_stats
+from custom_components.homeconnect_ws.address_cache import async_get_address_cache
+from custom_components.homeconnect_ws.const import (
+    CONF_BACKGROUND_CONNECT,
+    CONF_DESCRIPTION_HASH,
+    DOMAIN,
+)
+from custom_components.homeconnect_ws.description_store import (
+    async_load_description,
+    decode_description,
+    encode_description,
+    hash_description,
+)
+from custom_components.homeconnect_ws.diagnostics import async_get_config_entry_diagnostics
+from custom_components.homeconnect_ws.reachability import async_probe
+from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.const import CONF_DESCRIPTION, CONF_HOST, STATE_UNAVAILABLE, Platform
+from homeconnect_websocket import HomeAppliance
+from homeconnect_websocket.hc_socket import AesSocket
 from homeconnect_websocket.testutils import MockAppliance
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from .const import DEVICE_DESCRIPTION, MOCK_CONFIG_DATA, MOCK_TLS_DEVICE_ID
+from .const import DEVICE_DESCRIPTION, ENTITY_DESCRIPTIONS, MOCK_CONFIG_DATA, MOCK_TLS_DEVICE_ID
 
 if TYPE_CHECKING:
-    import pytest
     from homeassistant.core import HomeAssistant
 
 
@@ -98,3 +116,365 @@ async def test_load_failure(
     assert entry.state is ConfigEntryState.SETUP_RETRY
     appliance.session.close.assert_awaited_once()
     await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_connect_probe(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    mock_probe: AsyncMock,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test setup retries are skipped while the appliance isn't reachable."""
+    appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "mock_app", "mock_app_id", "PSK_KEY")
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", Mock(return_value=appliance))
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+
+    appliance.session.connect.side_effect = ClientConnectionError()
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    mock_probe.assert_not_awaited()
+
+    appliance.session.connect.reset_mock(side_effect=True)
+    mock_probe.return_value = False
+    await hass.config_entries.async_reload(entry.entry_id)
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    mock_probe.assert_awaited_once_with("1.2.3.4", 80)
+    appliance.session.connect.assert_not_awaited()
+
+    # Connect stats are reported while the setup is retried
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+    assert diagnostics["connect_stats"] == {"attempted": 1, "skipped": 1, "probe": True}
+    assert "appliance_state" not in diagnostics
+
+    mock_probe.return_value = True
+    await hass.config_entries.async_reload(entry.entry_id)
+    assert entry.state is ConfigEntryState.LOADED
+    appliance.session.connect.assert_awaited_once()
+
+    stats = get_connect_stats(hass, entry)
+    assert (stats.attempted, stats.skipped, stats.probe) == (2, 1, False)
+
+
+def mock_socket(appliance: MockAppliance) -> Mock:
+    """Mock the socket of the session, connected by the session connect."""
+    socket = Mock(_URL_FORMAT="ws://{host}:80/homeconnect", connect=AsyncMock())
+    appliance.session._socket = socket
+
+    async def connect(*_args: Any) -> None:
+        await appliance.session._socket.connect()
+
+    appliance.session.connect.side_effect = connect
+    return socket
+
+
+async def test_connect_cached_address(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test host names are connected by their cached address."""
+    appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "mock_app", "mock_app_id", "PSK_KEY")
+    socket = mock_socket(appliance)
+    connect = socket.connect
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", Mock(return_value=appliance))
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**MOCK_CONFIG_DATA, CONF_HOST: "Brand-Type-ID"},
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+    cache = async_get_address_cache(hass)
+    cache.async_set("brand-type-id.local.", "192.168.1.2")
+
+    connect.side_effect = ClientConnectionError()
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    assert socket._url == "ws://192.168.1.2:80/homeconnect"
+    # Resolved again on the next connect
+    assert cache.async_get("Brand-Type-ID") is None
+
+    connect.side_effect = None
+    socket._websocket.get_extra_info.return_value = ("192.168.1.3", 80)
+    await hass.config_entries.async_reload(entry.entry_id)
+    assert entry.state is ConfigEntryState.LOADED
+    assert socket._url == "ws://Brand-Type-ID:80/homeconnect"
+    assert cache.async_get("Brand-Type-ID") == "192.168.1.3"
+    assert entry.data[CONF_HOST] == "Brand-Type-ID"
+
+
+async def test_reconnect_cached_address(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test reconnects of the session look up the cached address and fall back to the host."""
+    appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "mock_app", "mock_app_id", "PSK_KEY")
+    socket = mock_socket(appliance)
+    connect = socket.connect
+    socket._websocket.get_extra_info.return_value = ("192.168.1.2", 80)
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", Mock(return_value=appliance))
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**MOCK_CONFIG_DATA, CONF_HOST: "Brand-Type-ID"},
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    assert socket._url == "ws://Brand-Type-ID:80/homeconnect"
+
+    # The session reconnects by the cached address
+    await appliance.session._socket.connect()
+    assert socket._url == "ws://192.168.1.2:80/homeconnect"
+
+    # The appliance moved, the next reconnect resolves the host name again
+    connect.side_effect = ClientConnectionError()
+    with pytest.raises(ClientConnectionError):
+        await appliance.session._socket.connect()
+    connect.side_effect = None
+    socket._websocket.get_extra_info.return_value = ("192.168.1.3", 80)
+    await appliance.session._socket.connect()
+    assert socket._url == "ws://Brand-Type-ID:80/homeconnect"
+    assert async_get_address_cache(hass).async_get("Brand-Type-ID") == "192.168.1.3"
+
+
+async def test_probe(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the probe fails when the connection is refused."""
+    writer = Mock(wait_closed=AsyncMock())
+    open_connection = AsyncMock(return_value=(Mock(), writer))
+    monkeypatch.setattr(asyncio, "open_connection", open_connection)
+    assert await async_probe("1.2.3.4", 443)
+    writer.close.assert_called_once()
+
+    open_connection.side_effect = ConnectionRefusedError()
+    assert not await async_probe("1.2.3.4", 443)
+
+
+async def test_background_connect(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test entities are created before the appliance is connected in background mode."""
+    appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "mock_app", "mock_app_id", "PSK_KEY")
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", Mock(return_value=appliance))
+    monkeypatch.setattr(homeconnect_ws, "BACKGROUND_CONNECT_RETRY_MIN", 0)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+    # First setup connects and stores the device info
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+
+    connect_event = asyncio.Event()
+    connect_attempts = 0
+
+    async def connect(*_: Any) -> None:
+        nonlocal connect_attempts
+        connect_attempts += 1
+        if connect_attempts == 1:
+            raise ClientConnectionError
+        await connect_event.wait()
+
+    appliance.session.connect.side_effect = connect
+    monkeypatch.setattr(homeconnect_ws, "HCSession", Mock(return_value=appliance.session))
+    hass.config_entries.async_update_entry(entry, options={CONF_BACKGROUND_CONNECT: True})
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.awaiting_connection
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor").state == STATE_UNAVAILABLE
+
+    connect_event.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert connect_attempts == 2
+    assert not entry.runtime_data.awaiting_connection
+    assert hass.states.get("sensor.fake_brand_homeappliance_sensor").state != STATE_UNAVAILABLE
+
+
+async def test_background_connect_closed_session(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test background connects are retried with a new session after a failed connect."""
+    appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "mock_app", "mock_app_id", "PSK_KEY")
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", Mock(return_value=appliance))
+    monkeypatch.setattr(homeconnect_ws, "BACKGROUND_CONNECT_RETRY_MIN", 0)
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    connect_event = asyncio.Event()
+    connect_attempts = 0
+
+    async def connect(*_: Any) -> None:
+        nonlocal connect_attempts
+        connect_attempts += 1
+        if connect_attempts < 3:
+            raise ClientConnectionError
+        await connect_event.wait()
+
+    # The failed connects close the session of the appliance
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", HomeAppliance)
+    monkeypatch.setattr(AesSocket, "connect", connect)
+    hass.config_entries.async_update_entry(entry, options={CONF_BACKGROUND_CONNECT: True})
+    await hass.async_block_till_done()
+
+    assert connect_attempts == 3
+    assert entry.runtime_data.awaiting_connection
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_background_connect_auth_failed(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test reauth is started when authentication fails in background mode."""
+    appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "mock_app", "mock_app_id", "PSK_KEY")
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", Mock(return_value=appliance))
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    appliance.session.connect.side_effect = ClientConnectorSSLError(MagicMock(), MagicMock())
+    hass.config_entries.async_update_entry(entry, options={CONF_BACKGROUND_CONNECT: True})
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.awaiting_connection
+    flows = hass.config_entries.flow.async_progress()
+    assert len(flows) == 1
+    assert flows[0]["context"]["source"] == SOURCE_REAUTH
+
+
+async def test_forward_platforms(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test only platforms with entities are set up."""
+    appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "mock_app", "mock_app_id", "PSK_KEY")
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", Mock(return_value=appliance))
+    monkeypatch.setattr(
+        homeconnect_ws,
+        "get_available_entities",
+        Mock(return_value={"sensor": ENTITY_DESCRIPTIONS["sensor"]}),
+    )
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.platforms == [Platform.SENSOR]
+    assert list(entry.runtime_data.platform_setup_times) == [Platform.SENSOR]
+    assert hass.states.async_entity_ids("sensor")
+    assert not hass.states.async_entity_ids("light")
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_migrate_description(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test the device description is moved out of the config entry."""
+    entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG_DATA, unique_id="any", version=1)
+    entry.add_to_hass(hass)
+    other_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG_DATA, version=1)
+    other_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.version == 2
+    assert CONF_DESCRIPTION not in entry.data
+    description_hash = entry.data[CONF_DESCRIPTION_HASH]
+    assert description_hash == hash_description(DEVICE_DESCRIPTION)
+    storage_key = f"{DOMAIN}.device_description.{description_hash}"
+    assert storage_key in hass_storage
+    assert await async_load_description(hass, description_hash) == DEVICE_DESCRIPTION
+
+    # Removed with the last config entry using it
+    assert other_entry.version == 2
+    assert await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+    assert storage_key in hass_storage
+    assert await hass.config_entries.async_remove(other_entry.entry_id)
+    await hass.async_block_till_done()
+    assert storage_key not in hass_storage
+
+
+def test_encode_description_int_keys() -> None:
+    """Test a description with int enumeration keys matches its hash after decoding."""
+    description = {
+        "info": {"brand": "Fake_Brand"},
+        "setting": [{"uid": 1, "name": "Test.Enum", "enumeration": {i: str(i) for i in range(12)}}],
+    }
+    data = encode_description(description)
+    decoded = decode_description(data)
+    assert decoded["setting"][0]["enumeration"] == {str(i): str(i) for i in range(12)}
+    assert hash_description(decoded) == data["hash"]
+
+
+async def test_missing_description(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+) -> None:
+    """Test a missing device description starts reauth, to upload the profile file."""
+    data = {key: value for key, value in MOCK_CONFIG_DATA.items() if key != CONF_DESCRIPTION}
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**data, CONF_DESCRIPTION_HASH: "missing"},
+        unique_id=MOCK_TLS_DEVICE_ID,
+        version=2,
+    )
+    entry.add_to_hass(hass)
+
+    assert not await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_ERROR
+    flows = hass.config_entries.flow.async_progress()
+    assert len(flows) == 1
+    assert flows[0]["context"]["source"] == SOURCE_REAUTH
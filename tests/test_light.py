@@ -224,6 +224,20 @@ async def test_set_brightness(
     )
     mock_appliance.session.send_sync.reset_mock()
 
+    # Unchanged brightness isn't written
+    await hass.services.async_call(
+        LIGHT_DOMAIN,
+        SERVICE_TURN_ON,
+        {
+            ATTR_ENTITY_ID: "light.fake_brand_homeappliance_light_2",
+            ATTR_BRIGHTNESS_PCT: 1,
+        },
+        blocking=True,
+    )
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+    await mock_appliance.entities["Test.LightingBrightness"].update({"value": 50})
+    await hass.async_block_till_done()
     await hass.services.async_call(
         LIGHT_DOMAIN,
         SERVICE_TURN_ON,
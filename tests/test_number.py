@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from homeassistant.components.number import (
@@ -85,3 +86,32 @@ async def test_set_value(
             data={"uid": 204, "value": 2},
         )
     )
+
+
+async def test_set_value_debounced(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test only the last value of a burst is written."""
+    entity_id = "number.fake_brand_homeappliance_number"
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+
+    await asyncio.gather(
+        *(
+            hass.services.async_call(
+                NUMBER_DOMAIN,
+                SERVICE_SET_VALUE,
+                {ATTR_ENTITY_ID: entity_id, ATTR_VALUE: value},
+                blocking=True,
+            )
+            for value in ("2", "4", "6")
+        )
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data={"uid": 204, "value": 6},
+        )
+    )
@@ -0,0 +1,143 @@
+"""Tests for the optimistic state."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+from custom_components.homeconnect_ws import optimistic as optimistic_module
+from custom_components.homeconnect_ws.optimistic import CONFIRM_TIMEOUT, HCOptimisticState
+from custom_components.homeconnect_ws.write_queue import HCWriteQueue
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
+
+
+async def test_optimistic_confirmed(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test the written value is shown immediately and confirmed by the appliance."""
+    dispatcher = Mock()
+    optimistic = HCOptimisticState(hass, dispatcher, enabled=True)
+    queue = HCWriteQueue(hass, mock_appliance, 5, optimistic)
+    entity = mock_appliance.entities["Test.Number"]
+    await entity.update({"value": 2})
+
+    task = asyncio.create_task(queue.async_set_value(entity, 4))
+    await asyncio.sleep(0)
+    assert optimistic.get_value(entity) == 4
+    # The HC entity isn't changed
+    assert entity.value == 2
+    dispatcher.async_update_entities.assert_called_once_with([entity])
+    await task
+
+    await entity.update({"value": 4})
+    await hass.async_block_till_done()
+    assert optimistic.stats.confirmed == 1
+    assert optimistic.stats.latency["<=0.1s"] == 1
+    assert optimistic.stats.rollbacks == 0
+
+    # Confirmations stop the timeout
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=CONFIRM_TIMEOUT + 1))
+    await hass.async_block_till_done()
+    assert optimistic.get_value(entity) == 4
+    assert optimistic.stats.timeouts == 0
+    optimistic.async_shutdown()
+
+
+async def test_optimistic_failed(
+    hass: HomeAssistant, mock_appliance: MockAppliance, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the optimistic state is rolled back when the write fails."""
+    mock_appliance.session.send_sync.side_effect = TimeoutError
+    optimistic = HCOptimisticState(hass, Mock(), enabled=True)
+    queue = HCWriteQueue(hass, mock_appliance, 5, optimistic)
+    entity = mock_appliance.entities["Test.Number"]
+    await entity.update({"value": 2})
+
+    with pytest.raises(TimeoutError):
+        await queue.async_set_value(entity, 4)
+    assert optimistic.get_value(entity) == 2
+    assert optimistic.stats.failed == 1
+    assert optimistic.stats.rollbacks == 1
+    assert "Rolling back Test.Number to 2, write failed: TimeoutError" in caplog.text
+    optimistic.async_shutdown()
+
+
+async def test_optimistic_timeout(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test the optimistic state is rolled back when the appliance doesn't confirm it."""
+    dispatcher = Mock()
+    optimistic = HCOptimisticState(hass, dispatcher, enabled=True)
+    queue = HCWriteQueue(hass, mock_appliance, 5, optimistic)
+    entity = mock_appliance.entities["Test.Number"]
+    await entity.update({"value": 2})
+
+    await queue.async_set_value(entity, 4)
+    assert optimistic.get_value(entity) == 4
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=CONFIRM_TIMEOUT + 1))
+    await hass.async_block_till_done()
+    assert optimistic.get_value(entity) == 2
+    assert optimistic.stats.timeouts == 1
+    assert optimistic.stats.rollbacks == 1
+    dispatcher.async_update_entities.assert_called_with([entity])
+    optimistic.async_shutdown()
+
+
+async def test_optimistic_update_before_rollback(
+    hass: HomeAssistant, mock_appliance: MockAppliance
+) -> None:
+    """Test a value sent by the appliance isn't rolled back."""
+    mock_appliance.session.send_sync.side_effect = TimeoutError
+    optimistic = HCOptimisticState(hass, Mock(), enabled=True)
+    queue = HCWriteQueue(hass, mock_appliance, 5, optimistic)
+    entity = mock_appliance.entities["Test.Number"]
+    await entity.update({"value": 2})
+
+    task = asyncio.create_task(queue.async_set_value(entity, 4))
+    await asyncio.sleep(0)
+    await entity.update({"value": 4})
+    await hass.async_block_till_done()
+    with pytest.raises(TimeoutError):
+        await task
+    assert entity.value == 4
+    assert optimistic.get_value(entity) == 4
+    assert optimistic.stats.rollbacks == 0
+    optimistic.async_shutdown()
+
+
+async def test_optimistic_disabled(
+    hass: HomeAssistant, mock_appliance: MockAppliance, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the confirmation latency is recorded without showing the value or timers."""
+    dispatcher = Mock()
+    call_later = Mock()
+    monkeypatch.setattr(optimistic_module, "async_call_later", call_later)
+    optimistic = HCOptimisticState(hass, dispatcher)
+    queue = HCWriteQueue(hass, mock_appliance, 5, optimistic)
+    entity = mock_appliance.entities["Test.Number"]
+    await entity.update({"value": 2})
+
+    await queue.async_set_value(entity, 4)
+    # Unchanged values aren't tracked
+    await queue.async_set_value(mock_appliance.entities["Test.Number"], 2)
+    assert optimistic.get_value(entity) == 2
+    dispatcher.async_update_entities.assert_not_called()
+    call_later.assert_not_called()
+
+    await entity.update({"value": 4})
+    await hass.async_block_till_done()
+    assert optimistic.stats.confirmed == 1
+
+    # Unconfirmed writes expire when looked up
+    await queue.async_set_value(entity, 6)
+    assert optimistic.get_known_value(entity) == 6
+    optimistic._timeout = 0
+    await asyncio.sleep(0.01)
+    assert optimistic.get_known_value(entity) == 4
+    assert optimistic.stats.timeouts == 1
+    optimistic.async_shutdown()
@@ -0,0 +1,76 @@
+"""Tests for the profile cache."""
+
+from __future__ import annotations
+
+from importlib.metadata import version
+from typing import TYPE_CHECKING, Any
+
+from custom_components.homeconnect_ws.profile_cache import (
+    MAX_PROFILES,
+    STORAGE_KEY,
+    HCProfileCache,
+    profile_key,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+def test_profile_key() -> None:
+    """Test the key depends on both files."""
+    key = profile_key(b"DeviceDescription", b"FeatureMapping")
+    assert key == profile_key(b"DeviceDescription", b"FeatureMapping")
+    assert key != profile_key(b"DeviceDescription", b"FeatureMapping2")
+    assert key != profile_key(b"DeviceDescriptionFeatureMapping", b"")
+
+
+async def test_profile_cache_lru(hass: HomeAssistant) -> None:
+    """Test the least recently used profile is evicted."""
+    cache = HCProfileCache(hass)
+    await cache.async_load()
+
+    for i in range(MAX_PROFILES):
+        cache.async_set(f"key_{i}", f"appliance_{i}", {"info": i})
+    assert cache.async_get("key_0", "appliance_0") == {"info": 0}
+
+    cache.async_set("key_new", "appliance_new", {"info": "new"})
+    assert cache.async_get("key_1", "appliance_1") is None
+    assert cache.async_get("key_0", "appliance_0") == {"info": 0}
+    assert cache.async_get("key_new", "appliance_new") == {"info": "new"}
+
+
+async def test_profile_cache_remove_appliance(hass: HomeAssistant) -> None:
+    """Test profiles are removed with the last appliance using them."""
+    cache = HCProfileCache(hass)
+    await cache.async_load()
+
+    cache.async_set("key", "appliance_1", {"info": 1})
+    assert cache.async_get("key", "appliance_2") == {"info": 1}
+
+    cache.async_remove_appliance("appliance_1")
+    assert cache.async_get("key", "appliance_3") == {"info": 1}
+    cache.async_remove_appliance("appliance_2")
+    cache.async_remove_appliance("appliance_3")
+    assert cache.async_get("key", "appliance_1") is None
+
+
+async def test_profile_cache_parser_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the cache is invalidated when the parser version changes."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "parser_version": "0.0.0",
+            "profiles": {"key": {"appliances": ["appliance"], "description": {"info": 1}}},
+        },
+    }
+    cache = HCProfileCache(hass)
+    await cache.async_load()
+    assert cache.async_get("key", "appliance") is None
+
+    hass_storage[STORAGE_KEY]["data"]["parser_version"] = version("homeconnect-websocket")
+    cache = HCProfileCache(hass)
+    await cache.async_load()
+    assert cache.async_get("key", "appliance") == {"info": 1}
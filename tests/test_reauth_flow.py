@@ -15,6 +15,7 @@ from custom_components.homeconnect_ws.const import (
     CONF_PSK,
     DOMAIN,
 )
+from homeassistant.const import CONF_HOST
 from homeassistant.data_entry_flow import FlowResultType
 from homeconnect_websocket import ParserError
 from pytest_homeassistant_custom_component.common import MockConfigEntry
@@ -27,6 +28,7 @@ from .const import (
 if TYPE_CHECKING:
     import pytest
     from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
 
 UPLOADED_FILE = str(uuid4())
 
@@ -69,7 +71,45 @@ async def test_reauth(
     assert mock_config.data[CONF_AES_IV] == "New_AES_IV"
 
     mock_hc_socket.return_value.connect.assert_awaited_once()
-    mock_hc_socket.return_value.close.assert_awaited_once()
+    mock_hc_socket.return_value.close.assert_not_awaited()  # Kept for the entry setup
+
+
+async def test_reauth_loaded(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,
+    mock_appliance: MockAppliance,  # noqa: ARG001
+    patch_entity_description: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a reauthentication flow reloads a loaded entry once."""
+    hc_socket = Mock()
+    hc_socket.AesSocket = Mock(return_value=AsyncMock())
+    monkeypatch.setattr(config_flow, "hc_socket", hc_socket)
+    mock_process_profile_file.return_value[MOCK_AES_DEVICE_ID]["info"]["key"] = "New_AES_PSK_KEY"
+
+    mock_config = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_AES_DEVICE_ID,
+    )
+    mock_config.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config.entry_id)
+    await hass.async_block_till_done()
+    mock_reload = AsyncMock(return_value=True)
+    monkeypatch.setattr(hass.config_entries, "async_reload", mock_reload)
+
+    result = await mock_config.start_reauth_flow(hass)
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert result["reason"] == "reauth_successful"
+    assert mock_config.data[CONF_PSK] == "New_AES_PSK_KEY"
+    mock_reload.assert_awaited_once_with(mock_config.entry_id)
 
 
 async def test_reauth_appliance_not_in_profile(
@@ -136,7 +176,8 @@ async def test_reauth_auth_failed_ssl_error(
 
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == "auth_failed"
-    mock_hc_socket.return_value.close.assert_awaited_once()
+    # Host of the config entry and mDNS host
+    assert mock_hc_socket.return_value.close.await_count == 2
     mock_setup_entry.assert_not_awaited()
 
 
@@ -171,7 +212,8 @@ async def test_reauth_auth_failed_binascii_error(
 
     assert result["type"] is FlowResultType.ABORT
     assert result["reason"] == "auth_failed"
-    mock_hc_socket.return_value.close.assert_awaited_once()
+    # Host of the config entry and mDNS host
+    assert mock_hc_socket.return_value.close.await_count == 2
     mock_setup_entry.assert_not_awaited()
 
 
@@ -208,7 +250,12 @@ async def test_reauth_connection_failed_timeout(
     assert result["step_id"] == "host"
     assert result["errors"]["base"] == "cannot_connect"
 
-    mock_hc_socket.return_value.close.assert_awaited_once()
+    # Host of the config entry and mDNS host
+    assert [call.args[0] for call in mock_hc_socket.call_args_list] == [
+        MOCK_CONFIG_DATA[CONF_HOST],
+        MOCK_AES_DEVICE_ID,
+    ]
+    assert mock_hc_socket.return_value.close.await_count == 2
     hass.config_entries.flow.async_abort(result["flow_id"])
     mock_setup_entry.assert_not_awaited()
 
@@ -246,7 +293,12 @@ async def test_reauth_connection_failed_connection_error(
     assert result["step_id"] == "host"
     assert result["errors"]["base"] == "cannot_connect"
 
-    mock_hc_socket.return_value.close.assert_awaited_once()
+    # Host of the config entry and mDNS host
+    assert [call.args[0] for call in mock_hc_socket.call_args_list] == [
+        MOCK_CONFIG_DATA[CONF_HOST],
+        MOCK_AES_DEVICE_ID,
+    ]
+    assert mock_hc_socket.return_value.close.await_count == 2
     hass.config_entries.flow.async_abort(result["flow_id"])
     mock_setup_entry.assert_not_awaited()
 
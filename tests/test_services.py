@@ -0,0 +1,208 @@
+"""Tests for services."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from custom_components.homeconnect_ws.const import DOMAIN
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeconnect_websocket.entities import Access
+from homeconnect_websocket.message import Action, Message
+
+from . import setup_config_entry
+from .const import MOCK_CONFIG_DATA
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
+
+
+def get_device_id(hass: HomeAssistant) -> str:
+    """Get the device id of the appliance."""
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "Fake_deviceID")})
+    assert device
+    return device.id
+
+
+async def test_set_values(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test valid values are sent in one message and results are returned per key."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    mock_appliance.entities["Test.Sensor"]._access = Access.READ
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "set_values",
+        {
+            "device_id": get_device_id(hass),
+            "values": {
+                "Test.Switch": True,
+                "Test.Select": "Option3",
+                "number.fake_brand_homeappliance_number": 8,
+                "Test.Sensor": 1,
+                "Test.Switch.Enum": "Maybe",
+                "Test.Unknown": 1,
+            },
+        },
+        blocking=True,
+        return_response=True,
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data=[
+                {"uid": 201, "value": True},
+                {"uid": 203, "value": 2},
+                {"uid": 204, "value": 8},
+            ],
+        )
+    )
+    results = response["results"]
+    assert results["Test.Switch"] == {"success": True, "uid": 201, "value": True}
+    assert results["Test.Select"] == {"success": True, "uid": 203, "value": 2}
+    assert results["number.fake_brand_homeappliance_number"] == {
+        "success": True,
+        "uid": 204,
+        "value": 8,
+    }
+    assert results["Test.Sensor"] == {"success": False, "error": "Not Writable"}
+    assert results["Test.Switch.Enum"] == {"success": False, "error": "Value not in Enum"}
+    assert results["Test.Unknown"] == {
+        "success": False,
+        "error": "Unknown HC key or entity id Test.Unknown",
+    }
+
+
+async def test_set_values_errors(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test errors are raised when no response is requested."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    device_id = get_device_id(hass)
+
+    with pytest.raises(ServiceValidationError, match=r"Invalid values for Test\.Number"):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_values",
+            {"device_id": device_id, "values": {"Test.Number": 22}},
+            blocking=True,
+        )
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+    mock_appliance.session.send_sync.side_effect = TimeoutError
+    with pytest.raises(HomeAssistantError, match="Failed to set values"):
+        await hass.services.async_call(
+            DOMAIN,
+            "set_values",
+            {"device_id": device_id, "values": {"Test.Number": 2}},
+            blocking=True,
+        )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "set_values",
+        {"device_id": device_id, "values": {"Test.Number": 2}},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["results"] == {
+        "Test.Number": {"success": False, "uid": 204, "value": 2, "error": "TimeoutError"}
+    }
+
+
+async def test_start_program(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test a program is started with its options in one message."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    mock_appliance.entities["Test.Option2"]._access = Access.READ
+
+    await hass.services.async_call(
+        DOMAIN,
+        "start_program",
+        {
+            "device_id": get_device_id(hass),
+            "program": "Test.Program.Program2",
+            "options": {"Test.Option1": 5},
+        },
+        blocking=True,
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/activeProgram",
+            action=Action.POST,
+            data={"program": 501, "options": [{"uid": 401, "value": 5}]},
+        )
+    )
+    mock_appliance.session.send_sync.reset_mock()
+
+    # Access of options follows the selected program, not the one started
+    await hass.services.async_call(
+        DOMAIN,
+        "start_program",
+        {
+            "device_id": get_device_id(hass),
+            "program": "Test.Program.Program2",
+            "options": {"Test.Option2": 3},
+        },
+        blocking=True,
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/activeProgram",
+            action=Action.POST,
+            data={
+                "program": 501,
+                "options": [{"uid": 402, "value": 3}, {"uid": 401, "value": None}],
+            },
+        )
+    )
+
+
+async def test_start_program_invalid(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test invalid programs and options are rejected."""
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    device_id = get_device_id(hass)
+    await mock_appliance.entities["Test.SelectedProgram"].update({"value": 500})
+    mock_appliance.entities["Test.Option2"]._access = Access.READ
+
+    with pytest.raises(ServiceValidationError, match=r"Unknown Program Test\.Program\.Program4"):
+        await hass.services.async_call(
+            DOMAIN,
+            "start_program",
+            {"device_id": device_id, "program": "Test.Program.Program4"},
+            blocking=True,
+        )
+
+    with pytest.raises(
+        ServiceValidationError,
+        match=(
+            r"Invalid options: Test\.Option2: Not Writable, "
+            r"Test\.FanSpeed1: not an option of Test\.Program\.Program1"
+        ),
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            "start_program",
+            {
+                "device_id": device_id,
+                "program": "Test.Program.Program1",
+                "options": {"Test.Option2": 1, "Test.FanSpeed1": "Speed1"},
+            },
+            blocking=True,
+        )
+    mock_appliance.session.send_sync.assert_not_awaited()
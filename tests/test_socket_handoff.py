@@ -0,0 +1,90 @@
+"""Tests for the socket handoff."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+from custom_components.homeconnect_ws.const import CONF_PSK
+from custom_components.homeconnect_ws.socket_handoff import (
+    HANDOFF_TTL,
+    async_adopt_socket,
+    async_pop_socket,
+    async_store_socket,
+)
+from homeassistant.const import CONF_HOST
+from homeassistant.util.dt import utcnow
+from homeconnect_websocket import HomeAppliance
+from homeconnect_websocket.hc_socket import TlsSocket
+from homeconnect_websocket.testutils import BASE_DESCRIPTION, TEST_PSK64
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+if TYPE_CHECKING:
+    import pytest
+    from homeassistant.core import HomeAssistant
+
+DATA = {CONF_HOST: "1.2.3.4", CONF_PSK: "PSK_KEY"}
+
+
+def mock_socket() -> AsyncMock:
+    """Mock a connected socket."""
+    socket = AsyncMock()
+    socket.closed = False
+    return socket
+
+
+async def test_pop_socket(hass: HomeAssistant) -> None:
+    """Test the socket is handed off once."""
+    socket = mock_socket()
+    async_store_socket(hass, "appliance", DATA, socket)
+
+    assert async_pop_socket(hass, "other_appliance", DATA) is None
+    assert async_pop_socket(hass, "appliance", DATA) is socket
+    assert async_pop_socket(hass, "appliance", DATA) is None
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=HANDOFF_TTL))
+    await hass.async_block_till_done()
+    socket.close.assert_not_awaited()
+
+
+async def test_pop_socket_changed_data(hass: HomeAssistant) -> None:
+    """Test the socket is closed when opened with other settings."""
+    socket = mock_socket()
+    async_store_socket(hass, "appliance", DATA, socket)
+
+    assert async_pop_socket(hass, "appliance", {**DATA, CONF_HOST: "5.6.7.8"}) is None
+    await hass.async_block_till_done()
+    socket.close.assert_awaited_once()
+
+
+async def test_socket_expired(hass: HomeAssistant) -> None:
+    """Test the socket is closed when not used within the TTL."""
+    socket = mock_socket()
+    async_store_socket(hass, "appliance", DATA, socket)
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=HANDOFF_TTL))
+    await hass.async_block_till_done()
+    socket.close.assert_awaited_once()
+    assert async_pop_socket(hass, "appliance", DATA) is None
+
+
+async def test_adopt_socket(
+    hass: HomeAssistant,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the appliance connects with the adopted socket."""
+    connect = AsyncMock()
+    monkeypatch.setattr(TlsSocket, "connect", connect)
+    appliance = HomeAppliance(BASE_DESCRIPTION, "1.2.3.4", "app_name", "app_id", TEST_PSK64)
+    socket = TlsSocket("1.2.3.4", TEST_PSK64)
+
+    await async_adopt_socket(appliance, socket)
+    assert appliance.session._socket is socket
+
+    # First connect uses the open connection, later connects reconnect
+    await socket.connect()
+    connect.assert_not_awaited()
+    await socket.connect()
+    connect.assert_awaited_once()
+    await socket.close()
@@ -118,6 +118,27 @@ async def test_turn_on(
     )
 
 
+async def test_turn_on_unchanged(
+    hass: HomeAssistant,
+    mock_appliance: MockAppliance,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test turning on a switch that is already on."""
+    entity_id = "switch.fake_brand_homeappliance_switch"
+    assert await setup_config_entry(hass, MOCK_CONFIG_DATA, mock_appliance)
+    await mock_appliance.entities["Test.Switch"].update({"value": True})
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        domain=SWITCH_DOMAIN,
+        service=SERVICE_TURN_ON,
+        service_data={ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+
 async def test_turn_on_enum(
     hass: HomeAssistant,
     mock_appliance: MockAppliance,
@@ -0,0 +1,69 @@
+"""Tests for the profile compatibility check."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, Mock
+
+from custom_components.homeconnect_ws import tools
+from homeconnect_websocket import ParserError
+from homeconnect_websocket.entities import DeviceDescription
+
+from .const import DEVICE_DESCRIPTION, ENTITY_DESCRIPTIONS, MOCK_AES_DEVICE_ID, MOCK_TLS_DEVICE_ID
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+class MockProcessPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor with the signature of ProcessPoolExecutor."""
+
+    def __init__(self, max_workers: int, mp_context: Any) -> None:
+        super().__init__(max_workers)
+
+
+def mock_parser(description: bytes, feature: bytes) -> DeviceDescription:  # noqa: ARG001
+    """Parse the TLS appliance, fail on the AES appliance."""
+    if description == b"AES_DeviceDescription":
+        msg = "Invalid description"
+        raise ParserError(msg)
+    return DeviceDescription(**{**DEVICE_DESCRIPTION, "program": []})
+
+
+def test_check_profiles(
+    monkeypatch: pytest.MonkeyPatch,
+    create_profile_file: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test profiles are parsed and matched against the Entity descriptions."""
+    parser = MagicMock(side_effect=mock_parser)
+    monkeypatch.setattr(tools, "parse_device_description", parser)
+    monkeypatch.setattr(tools, "ProcessPoolExecutor", MockProcessPoolExecutor)
+    monkeypatch.setattr(tools, "get_available_entities", Mock(return_value=ENTITY_DESCRIPTIONS))
+
+    assert tools.main([str(create_profile_file.parent)]) == 1
+    assert parser.call_count == 2
+
+    reports = tools.check_profiles(create_profile_file.parent)
+    tls_report, aes_report = reports
+    assert tls_report.appliance_id == MOCK_TLS_DEVICE_ID
+    assert tls_report.profile_file == create_profile_file.name
+    assert tls_report.error is None
+    assert tls_report.entities == {
+        description_type: len(descriptions)
+        for description_type, descriptions in ENTITY_DESCRIPTIONS.items()
+    }
+    assert "Test.Option1" in tls_report.unmatched
+    assert "Test.BinarySensor" not in tls_report.unmatched
+    assert "Test.LightingCustomColor" not in tls_report.unmatched
+    assert aes_report.appliance_id == MOCK_AES_DEVICE_ID
+    assert aes_report.error == "Invalid description"
+    assert aes_report.entities == {}
+
+    output = capsys.readouterr().out
+    assert "Test_Brand Test_TLS Test_vib" in output
+    assert "error: Invalid description" in output
+    assert "2 appliances, 1 with errors" in output
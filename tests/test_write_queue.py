@@ -0,0 +1,105 @@
+"""Tests for the write queue."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from custom_components.homeconnect_ws.write_queue import HCWriteQueue
+from homeconnect_websocket.entities import Access
+from homeconnect_websocket.errors import AccessError
+from homeconnect_websocket.message import Action, Message
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeconnect_websocket.testutils import MockAppliance
+
+
+async def test_coalesce(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test concurrent writes are sent in one message."""
+    queue = HCWriteQueue(hass, mock_appliance, 5)
+    await asyncio.gather(
+        queue.async_set_value(mock_appliance.entities["Test.Switch"], value=True),
+        queue.async_set_value(mock_appliance.entities["Test.Select"], "Option2"),
+        queue.async_set_value(mock_appliance.entities["Test.Number"], 4),
+        queue.async_set_value(mock_appliance.entities["Test.Number"], 6),
+    )
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(
+            resource="/ro/values",
+            action=Action.POST,
+            data=[
+                {"uid": 201, "value": True},
+                {"uid": 203, "value": 1},
+                {"uid": 204, "value": 6},
+            ],
+        )
+    )
+
+    # Writes after the window are sent in a new message
+    mock_appliance.session.send_sync.reset_mock()
+    await queue.async_set_value(mock_appliance.entities["Test.Switch"], value=False)
+    mock_appliance.session.send_sync.assert_awaited_once_with(
+        Message(resource="/ro/values", action=Action.POST, data={"uid": 201, "value": False})
+    )
+
+
+async def test_coalesce_error(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test every caller gets the error of the message."""
+    mock_appliance.session.send_sync.side_effect = TimeoutError
+    queue = HCWriteQueue(hass, mock_appliance, 5)
+    results = await asyncio.gather(
+        queue.async_set_value(mock_appliance.entities["Test.Switch"], value=True),
+        queue.async_set_value(mock_appliance.entities["Test.Number"], 4),
+        return_exceptions=True,
+    )
+    assert [type(result) for result in results] == [TimeoutError, TimeoutError]
+    mock_appliance.session.send_sync.assert_awaited_once()
+
+
+async def test_no_window(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test writes are sent immediately without a window."""
+    queue = HCWriteQueue(hass, mock_appliance, 0)
+    await asyncio.gather(
+        queue.async_set_value(mock_appliance.entities["Test.Switch"], value=True),
+        queue.async_set_value(mock_appliance.entities["Test.Number"], 4),
+    )
+    assert mock_appliance.session.send_sync.await_count == 2
+
+
+async def test_invalid_write(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test invalid writes are rejected before queueing."""
+    queue = HCWriteQueue(hass, mock_appliance, 5)
+    with pytest.raises(ValueError, match="Value not in Enum"):
+        await queue.async_set_value(mock_appliance.entities["Test.Select"], "Option4")
+
+    mock_appliance.entities["Test.Switch"]._access = Access.READ
+    with pytest.raises(AccessError, match="Not Writable"):
+        await queue.async_set_value(mock_appliance.entities["Test.Switch"], value=True)
+
+    mock_appliance.entities["Test.Number"]._available = False
+    with pytest.raises(AccessError, match="Not Available"):
+        await queue.async_set_value(mock_appliance.entities["Test.Number"], 4)
+    mock_appliance.session.send_sync.assert_not_awaited()
+
+
+async def test_raw_write_unchecked(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test raw values are written without checking the availability of the entities."""
+    queue = HCWriteQueue(hass, mock_appliance, 0)
+    mock_appliance.entities["Test.Number"]._available = False
+    await queue.async_set_values_raw({mock_appliance.entities["Test.Number"]: 4})
+    mock_appliance.session.send_sync.assert_awaited_once()
+
+
+async def test_shutdown(hass: HomeAssistant, mock_appliance: MockAppliance) -> None:
+    """Test pending writes are cancelled on shutdown."""
+    queue = HCWriteQueue(hass, mock_appliance, 1000)
+    task = asyncio.create_task(
+        queue.async_set_value(mock_appliance.entities["Test.Switch"], value=True)
+    )
+    await asyncio.sleep(0)
+    queue.async_shutdown()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    mock_appliance.session.send_sync.assert_not_awaited()
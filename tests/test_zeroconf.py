@@ -2,26 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
+from datetime import timedelta
 from ipaddress import ip_address
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, Mock
 from uuid import uuid4
 
+from aiohttp import ClientConnectorSSLError
+from custom_components import homeconnect_ws
 from custom_components.homeconnect_ws import config_flow
+from custom_components.homeconnect_ws.address_cache import async_get_address_cache
 from custom_components.homeconnect_ws.const import (
     CONF_AES_IV,
+    CONF_DESCRIPTION_HASH,
     CONF_FILE,
     CONF_MANUAL_HOST,
     CONF_PSK,
     DOMAIN,
 )
-from homeassistant.config_entries import SOURCE_ZEROCONF
+from custom_components.homeconnect_ws.description_store import hash_description
+from custom_components.homeconnect_ws.host_update import HOST_UPDATE_COOLDOWN
+from homeassistant.config_entries import SOURCE_ZEROCONF, ConfigEntryState
 from homeassistant.const import CONF_DESCRIPTION, CONF_DEVICE_ID, CONF_HOST, CONF_NAME
 from homeassistant.data_entry_flow import FlowResultType
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util.dt import utcnow
+from homeconnect_websocket.hc_socket import TlsSocket
+from homeconnect_websocket.testutils import MockAppliance
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
 from .const import (
+    DEVICE_DESCRIPTION,
     MOCK_CONFIG_DATA,
     MOCK_TLS_DEVICE_DESCRIPTION,
     MOCK_TLS_DEVICE_ID,
@@ -86,13 +99,13 @@ async def test_zeroconf_init(
         MOCK_TLS_DEVICE_INFO["key"],
     )
     tls_socket.return_value.connect.assert_awaited_once()
-    tls_socket.return_value.close.assert_awaited_once()
+    tls_socket.return_value.close.assert_not_awaited()  # Kept for the entry setup
 
     mock_process_profile_file.assert_called_once_with(UPLOADED_FILE)
 
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "Test_Brand Test_TLS"
-    assert result["data"][CONF_DESCRIPTION] == MOCK_TLS_DEVICE_DESCRIPTION
+    assert result["data"][CONF_DESCRIPTION_HASH] == hash_description(MOCK_TLS_DEVICE_DESCRIPTION)
     assert result["data"][CONF_HOST] == "127.0.0.2"
     assert result["data"][CONF_PSK] == MOCK_TLS_DEVICE_INFO["key"]
     assert CONF_AES_IV not in result["data"]
@@ -101,6 +114,79 @@ async def test_zeroconf_init(
     mock_setup_entry.assert_awaited_once()
 
 
+async def test_zeroconf_host_race(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+    mock_setup_entry: AsyncMock,  # noqa: ARG001
+) -> None:
+    """Test the mDNS host is used when the discovered address doesn't respond."""
+    sockets: dict[str, AsyncMock] = {}
+
+    def create_socket(host: str, _psk: str) -> AsyncMock:
+        socket = sockets[host] = AsyncMock()
+        if host == "127.0.0.2":
+            socket.connect.side_effect = asyncio.Event().wait
+        return socket
+
+    hc_socket = Mock()
+    hc_socket.TlsSocket = Mock(side_effect=create_socket)
+    monkeypatch.setattr(config_flow, "hc_socket", hc_socket)
+    monkeypatch.setattr(config_flow, "CONNECTION_ATTEMPT_DELAY", 0)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=MOCK_ZEROCONF_DATA
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
+        },
+    )
+
+    mdns_host = f"Test_Brand-Test_TLS-{MOCK_TLS_DEVICE_ID}"
+    assert list(sockets) == ["127.0.0.2", mdns_host]
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_HOST] == mdns_host
+    sockets["127.0.0.2"].close.assert_awaited_once()
+    sockets[mdns_host].close.assert_not_awaited()  # Kept for the entry setup
+
+
+async def test_zeroconf_host_race_auth_failed(
+    hass: HomeAssistant,
+    mock_process_profile_file: MagicMock,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+    mock_setup_entry: AsyncMock,  # noqa: ARG001
+) -> None:
+    """Test an auth failure of a stale address doesn't stop the other candidates."""
+    sockets: dict[str, AsyncMock] = {}
+
+    def create_socket(host: str, _psk: str) -> AsyncMock:
+        socket = sockets[host] = AsyncMock()
+        if host == "127.0.0.2":
+            socket.connect.side_effect = ClientConnectorSSLError(MagicMock(), MagicMock())
+        return socket
+
+    hc_socket = Mock()
+    hc_socket.TlsSocket = Mock(side_effect=create_socket)
+    monkeypatch.setattr(config_flow, "hc_socket", hc_socket)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=MOCK_ZEROCONF_DATA
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_FILE: UPLOADED_FILE,
+        },
+    )
+
+    mdns_host = f"Test_Brand-Test_TLS-{MOCK_TLS_DEVICE_ID}"
+    assert list(sockets) == ["127.0.0.2", mdns_host]
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_HOST] == mdns_host
+
+
 async def test_zeroconf_duplicate_entry(
     hass: HomeAssistant,
     mock_setup_entry: AsyncMock,
@@ -143,6 +229,63 @@ async def test_zeroconf_update_host(
     assert mock_config.data[CONF_HOST] == "127.0.0.2"
     mock_setup_entry.assert_not_awaited()
 
+    address_cache = async_get_address_cache(hass)
+    assert address_cache.async_get(f"Test_Brand-Test_TLS-{MOCK_TLS_DEVICE_ID}") == "127.0.0.2"
+
+
+async def test_zeroconf_update_host_loaded(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    patch_entity_description: None,  # noqa: ARG001
+) -> None:
+    """Test host updates of a loaded entry are debounced and applied without reloading."""
+    appliance = MockAppliance(DEVICE_DESCRIPTION, "host", "mock_app", "mock_app_id", "PSK_KEY")
+    appliance.session._socket = Mock(_URL_FORMAT=TlsSocket._URL_FORMAT, connect=AsyncMock())
+    monkeypatch.setattr(homeconnect_ws, "HomeAppliance", Mock(return_value=appliance))
+    mock_config = MockConfigEntry(
+        domain=DOMAIN,
+        data=MOCK_CONFIG_DATA,
+        unique_id=MOCK_TLS_DEVICE_ID,
+    )
+    mock_config.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config.entry_id)
+    await hass.async_block_till_done()
+    assert mock_config.state is ConfigEntryState.LOADED
+    runtime_data = mock_config.runtime_data
+
+    # Applied on the next reconnect while connected
+    appliance.session.connected = True
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_ZEROCONF}, data=MOCK_ZEROCONF_DATA
+    )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=HOST_UPDATE_COOLDOWN))
+    await hass.async_block_till_done()
+    assert mock_config.data[CONF_HOST] == "1.2.3.4"
+
+    await appliance.session._socket.connect()
+    assert mock_config.data[CONF_HOST] == "127.0.0.2"
+    assert appliance.session._socket._url == "wss://127.0.0.2:443/homeconnect"
+
+    # Last host is used for the next reconnect
+    appliance.session.connected = False
+    appliance.session.retry_count = 0
+    for host in ("127.0.0.4", "127.0.0.3"):
+        await hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": SOURCE_ZEROCONF},
+            data=replace(MOCK_ZEROCONF_DATA, ip_address=ip_address(host)),
+        )
+    assert mock_config.data[CONF_HOST] == "127.0.0.2"
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=HOST_UPDATE_COOLDOWN * 2))
+    await hass.async_block_till_done()
+
+    assert mock_config.data[CONF_HOST] == "127.0.0.3"
+    assert appliance.session._host == "127.0.0.3"
+    assert appliance.session._socket._url == "wss://127.0.0.3:443/homeconnect"
+    assert mock_config.runtime_data is runtime_data
+
 
 async def test_zeroconf_update_manual_host(
     hass: HomeAssistant,